@@ -10,10 +10,17 @@ Author: Verification for Paul Phillips, Clear Seas Solutions LLC
 Date: January 2026
 """
 
+import sys
+from pathlib import Path
+
 import numpy as np
 from itertools import combinations, product
 from fractions import Fraction
 
+# Shared geometry helpers live next to the simulations
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'ppp-implementation'))
+from polytope_graph import PolytopeGraph
+
 print("=" * 80)
 print("PHILLIPS FRAMEWORK - INDEPENDENT MATHEMATICAL VERIFICATION")
 print("=" * 80)
@@ -95,6 +102,16 @@ print(f"All norms = √2? min={norms.min():.10f}, max={norms.max():.10f}")
 print(f"Expected: √2 = {np.sqrt(2):.10f}")
 print(f"PASS: {np.allclose(norms, np.sqrt(2))}")
 
+# Root graph: each root has 56 neighbours at distance √2 (the kissing
+# number of E8), giving 240 × 56 / 2 = 6720 edges
+root_graph = PolytopeGraph(all_roots, np.sqrt(2), atol=0.01)
+degree = root_graph.degree_stats()
+print(f"\n[ROOT GRAPH VERIFICATION]")
+print(f"Edges at distance √2: {root_graph.n_edges}")
+print(f"Degree: min={degree['min']}, max={degree['max']}")
+print(f"Expected: 6720 edges, every root of degree 56")
+print(f"PASS: {root_graph.n_edges == 6720 and degree['regular'] and degree['max'] == 56}")
+
 # =============================================================================
 # PART 2: 24-CELL VERIFICATION
 # =============================================================================
@@ -196,13 +213,7 @@ print(f"PASS: {len(alpha) == 8 and len(beta) == 8 and len(gamma) == 8}")
 # Verify each forms a valid 16-cell
 def count_edges(vertices, expected_dist):
     """Count edges at expected distance."""
-    count = 0
-    for i in range(len(vertices)):
-        for j in range(i+1, len(vertices)):
-            d = np.linalg.norm(vertices[i] - vertices[j])
-            if np.isclose(d, expected_dist, atol=0.01):
-                count += 1
-    return count
+    return PolytopeGraph(vertices, expected_dist, atol=0.01).n_edges
 
 # 16-cell edge length = √2 for unit-radius vertices
 # But our vertices have different norms, so calculate expected
@@ -210,13 +221,8 @@ print(f"\n[16-CELL EDGE VERIFICATION]")
 for name, verts in [("Alpha", alpha), ("Beta", beta), ("Gamma", gamma)]:
     # For 16-cell: 8 vertices, 24 edges
     # Edge length between vertices of same norm
-    edge_count = 0
-    for i in range(len(verts)):
-        for j in range(i+1, len(verts)):
-            d = np.linalg.norm(verts[i] - verts[j])
-            # 16-cell edges connect vertices at distance √2
-            if np.isclose(d, np.sqrt(2), atol=0.01):
-                edge_count += 1
+    # 16-cell edges connect vertices at distance √2
+    edge_count = count_edges(verts, np.sqrt(2))
     print(f"{name}: {edge_count} edges (expected 24 for 16-cell)")
     print(f"  PASS: {edge_count == 24}")
 
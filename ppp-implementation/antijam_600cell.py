@@ -30,6 +30,11 @@ from dataclasses import dataclass
 from typing import Tuple, List, Dict, Optional
 import hashlib
 
+from lattice_index import SphericalCapIndex
+from polytope_geometry import cell600_vertices
+from polytope_graph import polytope_graph
+from h4_orbits import cell600_group_tables
+
 
 # =============================================================================
 # QUATERNION OPERATIONS
@@ -74,60 +79,11 @@ def generate_600cell_vertices() -> np.ndarray:
     - 1200 triangular faces
     - 600 tetrahedral cells
 
-    Vertices are organized in three types.
+    Vertices are organized in three types: 8 permutations of (±1, 0, 0, 0),
+    16 of (±1/2, ±1/2, ±1/2, ±1/2) and 96 even permutations of
+    (±φ/2, ±1/2, ±1/(2φ), 0). Built once by polytope_geometry (read-only).
     """
-    phi = (1 + np.sqrt(5)) / 2  # Golden ratio ≈ 1.618
-    inv_phi = 1 / phi            # ≈ 0.618
-
-    vertices = []
-
-    # Type 1: 8 vertices - axis-aligned unit vectors
-    # (±1, 0, 0, 0) and permutations
-    for i in range(4):
-        for sign in [1, -1]:
-            v = np.zeros(4)
-            v[i] = sign
-            vertices.append(v)
-
-    # Type 2: 16 vertices - all half coordinates
-    # (±1/2, ±1/2, ±1/2, ±1/2)
-    for signs in np.ndindex(2, 2, 2, 2):
-        v = np.array([(-1)**s * 0.5 for s in signs])
-        vertices.append(v)
-
-    # Type 3: 96 vertices - golden ratio combinations
-    # Even permutations of (±φ/2, ±1/2, ±1/(2φ), 0)
-    base = [phi/2, 0.5, inv_phi/2, 0]
-
-    # Even permutations (12 of them)
-    even_perms = [
-        [0,1,2,3], [0,2,3,1], [0,3,1,2],
-        [1,0,3,2], [1,2,0,3], [1,3,2,0],
-        [2,0,1,3], [2,1,3,0], [2,3,0,1],
-        [3,0,2,1], [3,1,0,2], [3,2,1,0]
-    ]
-
-    for perm in even_perms:
-        base_perm = np.array([base[p] for p in perm])
-        # Apply signs to non-zero elements
-        for signs in np.ndindex(2, 2, 2):
-            v = base_perm.copy()
-            sign_idx = 0
-            for i in range(4):
-                if abs(base_perm[i]) > 0.01:
-                    v[i] *= (-1)**signs[sign_idx]
-                    sign_idx += 1
-                    if sign_idx >= 3:
-                        break
-            vertices.append(v)
-
-    vertices = np.array(vertices)
-
-    # Normalize to unit sphere
-    norms = np.linalg.norm(vertices, axis=1, keepdims=True)
-    vertices = vertices / norms
-
-    return vertices
+    return cell600_vertices()
 
 
 def verify_600cell(vertices: np.ndarray) -> Dict:
@@ -141,25 +97,23 @@ def verify_600cell(vertices: np.ndarray) -> Dict:
     norms = np.linalg.norm(vertices, axis=1)
     assert np.allclose(norms, 1.0), "Vertices not on unit sphere"
 
-    # Compute pairwise distances
-    distances = []
-    for i in range(n):
-        for j in range(i+1, n):
-            d = np.linalg.norm(vertices[i] - vertices[j])
-            distances.append(d)
-
-    distances = np.array(distances)
+    # Edge graph at the minimum distance (every pair, vectorized)
+    graph = polytope_graph(vertices)
 
     # The 600-cell has specific distance values related to φ
-    # Minimum distance should be 1/φ ≈ 0.618
-    min_dist = np.min(distances)
+    # Minimum distance should be 1/φ ≈ 0.618, with 720 edges of degree 12
+    min_dist = graph.edge_length
     expected_min = 1 / ((1 + np.sqrt(5)) / 2)
+    degree = graph.degree_stats()
 
     return {
         'n_vertices': n,
         'min_distance': min_dist,
         'expected_min': expected_min,
         'distance_match': np.isclose(min_dist, expected_min, rtol=0.01),
+        'n_edges': graph.n_edges,
+        'degree': degree['max'],
+        'edges_match': graph.n_edges == 720 and degree['regular'] and degree['max'] == 12,
         'all_unit': np.allclose(norms, 1.0)
     }
 
@@ -237,6 +191,17 @@ def generate_h4_generators() -> List[IsoclinicRotation]:
     return generators
 
 
+def hash_to_h4_indices(hash_hex: str) -> Tuple[int, int]:
+    """(left, right) vertex indices selected by a hash"""
+    # Use first 8 bytes of hash to select LEFT quaternion
+    idx_left = int(hash_hex[:8], 16) % 120
+
+    # Use next 8 bytes to select RIGHT quaternion
+    idx_right = int(hash_hex[8:16], 16) % 120
+
+    return idx_left, idx_right
+
+
 def hash_to_h4_element(hash_hex: str, vertices: np.ndarray) -> IsoclinicRotation:
     """
     Deterministically map a hash to an H4 group element.
@@ -249,11 +214,7 @@ def hash_to_h4_element(hash_hex: str, vertices: np.ndarray) -> IsoclinicRotation
     but both are valid quaternions so the isoclinic property
     (preserving the lattice) is maintained.
     """
-    # Use first 8 bytes of hash to select LEFT quaternion
-    idx_left = int(hash_hex[:8], 16) % 120
-
-    # Use next 8 bytes to select RIGHT quaternion
-    idx_right = int(hash_hex[8:16], 16) % 120
+    idx_left, idx_right = hash_to_h4_indices(hash_hex)
 
     # Get vertices as quaternions
     q_left = quat_normalize(vertices[idx_left])
@@ -295,6 +256,58 @@ def verify_h4_preserves_lattice(rotation: IsoclinicRotation,
     return True, max_error
 
 
+# =============================================================================
+# H4 ELEMENT TABLE
+# =============================================================================
+
+class H4ElementTable:
+    """
+    Precomputed action of every hash-selectable H4 element on the 600-cell.
+
+    The 120 vertices are the binary icosahedral group, so v_L * v_k * v_R†
+    is again a vertex. With the group multiplication table M[i, j] =
+    index(v_i * v_j) and conjugate indices C[j] = index(v_j†),
+
+        perm[L, R, k] = M[M[L, k], C[R]]
+
+    is where base vertex k lands under the rotation (L, R). All 120×120
+    (left, right) pairs fit in a 120×120×120 int16 table (~3.5 MB).
+    """
+
+    def __init__(self, vertices: np.ndarray):
+        self.vertices = vertices
+
+        # Group tables from h4_orbits, relabelled to this vertex order
+        self.mult, self.conj = cell600_group_tables(vertices)
+
+        perm = self.mult[self.mult[:, :, np.newaxis], self.conj[np.newaxis, np.newaxis, :]]
+        self.perm = np.ascontiguousarray(perm.transpose(0, 2, 1)).astype(np.int16)
+        self.perm.flags.writeable = False
+
+        # inv_perm[L, R, j] = base vertex that lands on vertex j
+        self.inv_perm = np.argsort(self.perm, axis=2).astype(np.int16)
+        self.inv_perm.flags.writeable = False
+
+    def permutation(self, idx_left: int, idx_right: int) -> np.ndarray:
+        """Where each base vertex lands under the rotation (left, right)"""
+        return self.perm[idx_left, idx_right]
+
+    def inverse_permutation(self, idx_left: int, idx_right: int) -> np.ndarray:
+        """Which base vertex lands on each vertex under (left, right)"""
+        return self.inv_perm[idx_left, idx_right]
+
+
+_H4_TABLE_CACHE: Dict[bytes, H4ElementTable] = {}
+
+
+def get_h4_table(vertices: np.ndarray) -> H4ElementTable:
+    """Shared H4ElementTable for a vertex ordering (built once per process)"""
+    key = vertices.tobytes()
+    if key not in _H4_TABLE_CACHE:
+        _H4_TABLE_CACHE[key] = H4ElementTable(vertices)
+    return _H4_TABLE_CACHE[key]
+
+
 # =============================================================================
 # ANTI-JAMMING PROTOCOL
 # =============================================================================
@@ -304,15 +317,26 @@ class AntiJamTransmitter:
 
     def __init__(self, shared_secret: bytes):
         self.vertices = generate_600cell_vertices()
+        self.table = get_h4_table(self.vertices)
         self.secret = shared_secret
         self.frame_counter = 0
+        # (frame_counter, left index, right index) of the last derived frame
+        self._frame_cache: Optional[Tuple[int, int, int]] = None
+
+    def _get_frame_indices(self) -> Tuple[int, int]:
+        """(left, right) H4 indices for this frame, hashed once per frame"""
+        if self._frame_cache is None or self._frame_cache[0] != self.frame_counter:
+            # Hash = H(secret || frame_counter)
+            data = self.secret + self.frame_counter.to_bytes(8, 'big')
+            hash_hex = hashlib.sha256(data).hexdigest()
+            self._frame_cache = (self.frame_counter, *hash_to_h4_indices(hash_hex))
+        return self._frame_cache[1], self._frame_cache[2]
 
     def _get_rotation_for_frame(self) -> IsoclinicRotation:
         """Derive H4 rotation from hash chain"""
-        # Hash = H(secret || frame_counter)
-        data = self.secret + self.frame_counter.to_bytes(8, 'big')
-        hash_hex = hashlib.sha256(data).hexdigest()
-        return hash_to_h4_element(hash_hex, self.vertices)
+        idx_left, idx_right = self._get_frame_indices()
+        return IsoclinicRotation(q_left=self.vertices[idx_left],
+                                 q_right=self.vertices[idx_right])
 
     def transmit_symbol(self, symbol_index: int) -> np.ndarray:
         """
@@ -322,14 +346,9 @@ class AntiJamTransmitter:
         """
         assert 0 <= symbol_index < 120
 
-        # Get original vertex
-        original = self.vertices[symbol_index]
-
-        # Apply secret rotation
-        rotation = self._get_rotation_for_frame()
-        rotated = rotation.apply(original)
-
-        return rotated
+        # Secret rotation of the original vertex, looked up in the H4 table
+        perm = self.table.permutation(*self._get_frame_indices())
+        return self.vertices[perm[symbol_index]].copy()
 
     def advance_frame(self):
         """Move to next frame (new rotation)"""
@@ -341,36 +360,42 @@ class AntiJamReceiver:
 
     def __init__(self, shared_secret: bytes):
         self.vertices = generate_600cell_vertices()
+        self.index = SphericalCapIndex(self.vertices)
+        self.table = get_h4_table(self.vertices)
         self.secret = shared_secret
         self.frame_counter = 0
+        # (frame_counter, left, right, inverse permutation) of the last frame
+        self._frame_cache: Optional[Tuple[int, int, int, np.ndarray]] = None
+
+    def _get_frame(self) -> Tuple[int, int, np.ndarray]:
+        """(left, right, inverse permutation) for this frame, cached per frame"""
+        if self._frame_cache is None or self._frame_cache[0] != self.frame_counter:
+            data = self.secret + self.frame_counter.to_bytes(8, 'big')
+            hash_hex = hashlib.sha256(data).hexdigest()
+            idx_left, idx_right = hash_to_h4_indices(hash_hex)
+            inv_perm = self.table.inverse_permutation(idx_left, idx_right)
+            self._frame_cache = (self.frame_counter, idx_left, idx_right, inv_perm)
+        return self._frame_cache[1:]
 
     def _get_rotation_for_frame(self) -> IsoclinicRotation:
         """Derive H4 rotation from hash chain (same as transmitter)"""
-        data = self.secret + self.frame_counter.to_bytes(8, 'big')
-        hash_hex = hashlib.sha256(data).hexdigest()
-        return hash_to_h4_element(hash_hex, self.vertices)
+        idx_left, idx_right, _ = self._get_frame()
+        return IsoclinicRotation(q_left=self.vertices[idx_left],
+                                 q_right=self.vertices[idx_right])
 
     def decode_symbol(self, received: np.ndarray) -> int:
         """
         Decode received (possibly noisy) symbol.
 
-        1. Apply inverse rotation
-        2. Snap to nearest vertex
+        The rotation is an isometry mapping vertices to vertices, so
+        snapping then un-rotating equals un-rotating then snapping:
+        1. Snap to nearest vertex of the (rotated) 600-cell
+        2. Map it back through the frame's inverse permutation
         3. Return symbol index
         """
-        # Get inverse of secret rotation
-        rotation = self._get_rotation_for_frame()
-        inverse = rotation.inverse()
-
-        # Undo rotation
-        unrotated = inverse.apply(received)
-
-        # Normalize (in case of noise)
-        unrotated = unrotated / (np.linalg.norm(unrotated) + 1e-10)
-
-        # Find nearest vertex
-        distances = np.linalg.norm(self.vertices - unrotated, axis=1)
-        return int(np.argmin(distances))
+        _, _, inv_perm = self._get_frame()
+        nearest, _ = self.index.query_one(received)
+        return int(inv_perm[nearest])
 
     def advance_frame(self):
         """Move to next frame (synchronized with transmitter)"""
@@ -387,6 +412,7 @@ class Jammer:
 
     def __init__(self):
         self.vertices = generate_600cell_vertices()
+        self.index = SphericalCapIndex(self.vertices)
 
     def decode_symbol(self, received: np.ndarray) -> int:
         """
@@ -395,12 +421,143 @@ class Jammer:
 
         This will fail because the constellation is rotated.
         """
-        # Normalize
-        received_norm = received / (np.linalg.norm(received) + 1e-10)
+        # Normalize and find nearest vertex in UNROTATED constellation
+        return self.index.query_one(received)[0]
+
+
+# =============================================================================
+# FRAME-LEVEL LINK SIMULATOR
+# =============================================================================
+
+JAMMER_MODELS = ('none', 'barrage', 'tone', 'follower')
+
+
+def frame_h4_indices(shared_secret: bytes, n_frames: int,
+                     first_frame: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (left, right) H4 indices for a run of frames, exactly as the
+    transmitter/receiver derive them from H(secret || frame_counter).
+    """
+    idx_left = np.empty(n_frames, dtype=np.int64)
+    idx_right = np.empty(n_frames, dtype=np.int64)
+    for f in range(n_frames):
+        data = shared_secret + (first_frame + f).to_bytes(8, 'big')
+        idx_left[f], idx_right[f] = hash_to_h4_indices(hashlib.sha256(data).hexdigest())
+    return idx_left, idx_right
+
+
+def jammer_signal(model: str, transmitted: np.ndarray, previous: np.ndarray,
+                  jsr_db: float, tone: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Jamming waveform for an (F, S, 4) block of transmitted symbols.
+
+    Models (jammer power J = 10^(JSR/10), signal power = 1):
+    - 'none':     no jammer
+    - 'barrage':  Gaussian noise spread over all 4 dimensions
+    - 'tone':     fixed 4D direction (CW tone analog) at full power
+    - 'follower': replays the previous frame's waveform (repeat jammer);
+                  it is a valid 600-cell point, but in the wrong frame's
+                  constellation
+
+    Args:
+        previous: (F, S, 4) waveform one frame earlier (first frame zeros)
+        tone: Unit 4-vector for the tone jammer
+    """
+    if model == 'none':
+        return np.zeros_like(transmitted)
+
+    jam_amp = np.sqrt(10 ** (jsr_db / 10))
+    if model == 'barrage':
+        return rng.normal(0, jam_amp / 2, transmitted.shape)  # σ² = J/4 per dim
+    if model == 'tone':
+        return np.broadcast_to(jam_amp * tone, transmitted.shape)
+    if model == 'follower':
+        return jam_amp * previous
+
+    raise ValueError(f"Unknown jammer model: {model}")
+
+
+def simulate_link(shared_secret: bytes, n_symbols: int, snr_db: float,
+                  jammer_model: str = 'none', jsr_db: float = 0.0,
+                  symbols_per_frame: int = 10, rng: Optional[np.random.Generator] = None,
+                  frames_per_block: int = 4096) -> Dict:
+    """
+    Vectorized anti-jam link: whole frames of symbols at once.
+
+    Per block of frames: symbol indices (F, S) are mapped through the H4
+    permutation table to the hopped constellation, AWGN and the jammer
+    waveform are added, and both decoders run as one batched snap:
+    - receiver: nearest vertex, then the frame's inverse permutation
+    - eavesdropping jammer: nearest vertex of the UNROTATED 600-cell
+
+    Same protocol as AntiJamTransmitter/AntiJamReceiver/Jammer
+    (frame f uses H(secret || f)), without per-symbol Python calls.
 
-        # Find nearest vertex in UNROTATED constellation
-        distances = np.linalg.norm(self.vertices - received_norm, axis=1)
-        return int(np.argmin(distances))
+    Returns:
+        Dict with rx_ser, jam_ser and the scenario parameters
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    vertices = generate_600cell_vertices()
+    table = get_h4_table(vertices)
+    index = SphericalCapIndex(vertices)
+
+    n_frames = -(-n_symbols // symbols_per_frame)
+    idx_left, idx_right = frame_h4_indices(shared_secret, n_frames)
+
+    noise_std = np.sqrt(10 ** (-snr_db / 10) / 4)  # 4D
+    tone = quat_normalize(rng.normal(size=4))
+
+    rx_errors = 0
+    jam_errors = 0
+    last_frame = np.zeros((1, symbols_per_frame, 4))
+
+    for start in range(0, n_frames, frames_per_block):
+        f = np.arange(start, min(start + frames_per_block, n_frames))
+        L = idx_left[f, np.newaxis]
+        R = idx_right[f, np.newaxis]
+
+        symbols = rng.integers(0, 120, (len(f), symbols_per_frame))
+        transmitted = vertices[table.perm[L, R, symbols]]
+
+        previous = np.concatenate([last_frame, transmitted[:-1]])
+        last_frame = transmitted[-1:]
+
+        jam = jammer_signal(jammer_model, transmitted, previous, jsr_db, tone, rng)
+        received = transmitted + jam + rng.normal(0, noise_std, transmitted.shape)
+
+        nearest, _ = index.query(received.reshape(-1, 4))
+        nearest = nearest.reshape(symbols.shape)
+
+        # Symbols past n_symbols (partial last frame) are not counted
+        valid = (f[:, np.newaxis] * symbols_per_frame
+                 + np.arange(symbols_per_frame)) < n_symbols
+        rx_errors += int(np.count_nonzero((table.inv_perm[L, R, nearest] != symbols) & valid))
+        jam_errors += int(np.count_nonzero((nearest != symbols) & valid))
+
+    return {
+        'snr_db': float(snr_db),
+        'jsr_db': float(jsr_db),
+        'jammer_model': jammer_model,
+        'n_symbols': n_symbols,
+        'rx_ser': rx_errors / n_symbols,
+        'jam_ser': jam_errors / n_symbols,
+    }
+
+
+def run_link_sweep(shared_secret: bytes, snr_range: List[float], jsr_range: List[float],
+                   jammer_models: Tuple[str, ...] = JAMMER_MODELS[1:],
+                   n_symbols: int = 100_000, seed: int = 42) -> List[Dict]:
+    """SER for receiver and jammer over a (model, JSR, SNR) grid"""
+    rng = np.random.default_rng(seed)
+    results = []
+    for model in jammer_models:
+        for jsr_db in jsr_range:
+            for snr_db in snr_range:
+                results.append(simulate_link(shared_secret, n_symbols, snr_db,
+                                             jammer_model=model, jsr_db=jsr_db, rng=rng))
+    return results
 
 
 # =============================================================================
@@ -416,16 +573,17 @@ def run_antijam_test():
     print()
 
     # Step 1: Verify 600-cell
-    print("[1/5] Verifying 600-cell geometry...")
+    print("[1/6] Verifying 600-cell geometry...")
     vertices = generate_600cell_vertices()
     props = verify_600cell(vertices)
     print(f"      Vertices: {props['n_vertices']}")
     print(f"      Min distance: {props['min_distance']:.4f} (expected: {props['expected_min']:.4f})")
     print(f"      Distance match: {props['distance_match']}")
+    print(f"      Edges: {props['n_edges']} (degree {props['degree']}), match: {props['edges_match']}")
     print()
 
     # Step 2: Verify H4 preserves lattice
-    print("[2/5] Verifying H4 rotations preserve 600-cell...")
+    print("[2/6] Verifying H4 rotations preserve 600-cell...")
 
     # Test several random H4 elements
     test_hashes = [
@@ -451,7 +609,7 @@ def run_antijam_test():
     print()
 
     # Step 3: Test clean transmission
-    print("[3/5] Testing clean transmission (no noise)...")
+    print("[3/6] Testing clean transmission (no noise)...")
 
     shared_secret = b"CRA-POM-ANTIJAM-SECRET-KEY-2024"
     tx = AntiJamTransmitter(shared_secret)
@@ -490,7 +648,7 @@ def run_antijam_test():
     print()
 
     # Step 4: Test with noise
-    print("[4/5] Testing noisy channel (receiver vs jammer)...")
+    print("[4/6] Testing noisy channel (receiver vs jammer)...")
 
     results = []
 
@@ -534,8 +692,19 @@ def run_antijam_test():
 
     print()
 
-    # Step 5: Measure constellation diversity
-    print("[5/5] Measuring constellation hopping diversity...")
+    # Step 5: Frame-level link with jammer models
+    print("[5/6] Frame-level link simulation with jammer models...")
+
+    for model in JAMMER_MODELS[1:]:
+        for jsr_db in [-10, 0]:
+            r = simulate_link(shared_secret, 200_000, 20, jammer_model=model, jsr_db=jsr_db,
+                              rng=np.random.default_rng(42))
+            print(f"      {model:8s} JSR={jsr_db:+3d}dB (SNR=20dB): "
+                  f"Receiver SER={100*r['rx_ser']:5.2f}%, Jammer SER={100*r['jam_ser']:5.2f}%")
+    print()
+
+    # Step 6: Measure constellation diversity
+    print("[6/6] Measuring constellation hopping diversity...")
 
     tx = AntiJamTransmitter(shared_secret)
 
@@ -25,10 +25,18 @@ Architecture: CRA-Core + PPP-Info-Site Integration
 import numpy as np
 import hashlib
 from dataclasses import dataclass
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Dict
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import warnings
+
+from lattice_index import SphericalCapIndex
+from ring_buffer import RingBuffer
+from sliding_median import SlidingMedian
+from tracker_stream import StreamingTracker
+from kinematics import integrate, accumulated_times
+from polytope_geometry import cell600_vertices
+from h4_orbits import quaternion_left_matrix, quaternion_right_matrix
 warnings.filterwarnings('ignore')
 
 # =============================================================================
@@ -122,6 +130,18 @@ class Quaternion:
         """Scalar multiplication"""
         return Quaternion(*(scalar * self.q))
 
+    def left_matrix(self) -> np.ndarray:
+        """
+        4×4 matrix of left multiplication: (q * p).q == L(q) @ p.q
+
+        Applied to an (N, 4) array of quaternions as V @ L.T.
+        """
+        return quaternion_left_matrix(self.q)
+
+    def right_matrix(self) -> np.ndarray:
+        """4×4 matrix of right multiplication: (p * q).q == R(q) @ p.q"""
+        return quaternion_right_matrix(self.q)
+
     def rotate_vector(self, v: np.ndarray) -> np.ndarray:
         """Rotate a 3D vector by this quaternion: v' = q * v * q*"""
         v_quat = Quaternion(0, v[0], v[1], v[2])
@@ -392,6 +412,8 @@ class Lattice600:
         """Generate all 120 vertices of the 600-cell on S³"""
         self.vertices = self._generate_vertices()
         self._verify_normalization()
+        # Nearest-vertex index (q and -q identified), built once
+        self.index = SphericalCapIndex(self.vertices, antipodal=True)
 
     def _generate_vertices(self) -> np.ndarray:
         """
@@ -402,50 +424,10 @@ class Lattice600:
         2. 16 vertices: (±1/2, ±1/2, ±1/2, ±1/2)
         3. 96 vertices: even permutations of (±φ/2, ±1/2, ±1/(2φ), 0)
 
-        where φ = golden ratio = (1+√5)/2
+        where φ = golden ratio = (1+√5)/2. Built once per process by
+        polytope_geometry; the shared array is read-only.
         """
-        phi = self.PHI
-        inv_phi = 1 / phi  # = φ - 1
-
-        vertices = []
-
-        # Type 1: 8 vertices - axis-aligned
-        for i in range(4):
-            for sign in [1, -1]:
-                v = np.zeros(4)
-                v[i] = sign
-                vertices.append(v)
-
-        # Type 2: 16 vertices - all half-coordinates
-        for signs in np.ndindex(2, 2, 2, 2):
-            v = np.array([(-1)**s * 0.5 for s in signs])
-            vertices.append(v)
-
-        # Type 3: 96 vertices - golden ratio coordinates
-        # These are even permutations of (±φ/2, ±1/2, ±1/(2φ), 0)
-        base_coords = [phi/2, 0.5, inv_phi/2, 0]
-
-        # Generate all even permutations (12 total)
-        even_perms = [
-            [0, 1, 2, 3], [0, 2, 3, 1], [0, 3, 1, 2],
-            [1, 0, 3, 2], [1, 2, 0, 3], [1, 3, 2, 0],
-            [2, 0, 1, 3], [2, 1, 3, 0], [2, 3, 0, 1],
-            [3, 0, 2, 1], [3, 1, 0, 2], [3, 2, 1, 0]
-        ]
-
-        for perm in even_perms:
-            base = np.array([base_coords[p] for p in perm])
-            # Apply all sign combinations to non-zero elements
-            for signs in np.ndindex(2, 2, 2):
-                v = base.copy()
-                sign_idx = 0
-                for i in range(4):
-                    if base[i] != 0:
-                        v[i] *= (-1)**signs[sign_idx]
-                        sign_idx += 1
-                vertices.append(v)
-
-        return np.array(vertices)
+        return cell600_vertices()
 
     def _verify_normalization(self):
         """Ensure all vertices lie on the unit 3-sphere"""
@@ -470,13 +452,9 @@ class Lattice600:
         v' = q * v
 
         This is used for the Rolling Lattice security mechanism.
+        All 120 products are one (120,4) @ (4,4) matrix multiply.
         """
-        rotated = np.zeros_like(self.vertices)
-        for i, v in enumerate(self.vertices):
-            v_quat = Quaternion(*v)
-            rotated_quat = rotation * v_quat
-            rotated[i] = rotated_quat.q
-        return rotated
+        return self.vertices @ rotation.left_matrix().T
 
     def apply_isoclinic_rotation(self, left: Quaternion,
                                   right: Quaternion) -> np.ndarray:
@@ -487,16 +465,11 @@ class Lattice600:
         v' = left * v * right†
 
         This is the mathematical basis for the POM constellation rotation.
+        Left and right actions commute, so v' = L(left) R(right†) v and
+        the whole lattice rotates with a single 4×4 matrix.
         """
-        rotated = np.zeros_like(self.vertices)
-        right_conj = right.conjugate()
-
-        for i, v in enumerate(self.vertices):
-            v_quat = Quaternion(*v)
-            rotated_quat = left * v_quat * right_conj
-            rotated[i] = rotated_quat.q
-
-        return rotated
+        rotation = left.left_matrix() @ right.conjugate().right_matrix()
+        return self.vertices @ rotation.T
 
     def snap_to_nearest(self, point: np.ndarray) -> Tuple[int, np.ndarray, float]:
         """
@@ -512,22 +485,27 @@ class Lattice600:
             - The vertex coordinates
             - Distance to vertex (error magnitude)
         """
-        # Normalize point to S³
-        point_norm = point / (np.linalg.norm(point) + 1e-10)
-
-        # Find closest vertex using dot product (cosine similarity on sphere)
-        dots = np.abs(self.vertices @ point_norm)
-        nearest_idx = np.argmax(dots)
+        # Closest vertex by |cosine| on S³ (normalization done by the index)
+        nearest_idx, distance = self.index.query_one(point)
 
         # Handle sign ambiguity (quaternions q and -q represent same rotation)
         nearest = self.vertices[nearest_idx]
-        if np.dot(nearest, point_norm) < 0:
+        if np.dot(nearest, point) < 0:
             nearest = -nearest
 
-        distance = np.linalg.norm(point_norm - nearest)
-
         return nearest_idx, nearest, distance
 
+    def snap_batch(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Snap an (M, 4) batch of points; same outputs as snap_to_nearest,
+        stacked along the first axis.
+        """
+        nearest_idx, distances = self.index.query(points)
+
+        nearest = self.vertices[nearest_idx]
+        signs = np.where(np.sum(nearest * points, axis=1) < 0, -1.0, 1.0)
+        return nearest_idx, nearest * signs[:, np.newaxis], distances
+
     def compute_h4_metric(self, trajectory: np.ndarray) -> float:
         """
         Compute the H4 Symmetry Metric for a trajectory.
@@ -739,93 +717,126 @@ class HypersonicTrajectory:
 
         self.g = 9.81  # m/s²
 
-    def generate_trajectory(self) -> List[HGVState]:
+    def trajectory_arrays(self) -> Dict[str, np.ndarray]:
         """
-        Generate complete HGV trajectory with Bank-to-Turn maneuver.
+        Generate the HGV trajectory as arrays (one row per sample).
 
         The trajectory has three phases:
         1. Cruise: Straight and level at Mach 8
         2. Maneuver: 15g bank-to-turn (heading change ~45°)
         3. Exit: Return to straight cruise
-        """
-        states = []
 
-        # Initial conditions
-        pos = np.array([0.0, 0.0, 30000.0])  # 30km altitude
-        vel = np.array([self.speed, 0.0, 0.0])  # Eastward
-        orient = Quaternion(1, 0, 0, 0)  # Level flight
-        omega = np.array([0.0, 0.0, 0.0])
+        Acceleration and roll rate are evaluated over the whole time
+        vector and integrated by cumulative sums. Each sample is the state
+        at the START of its step, as generate_trajectory records it.
+        maneuver_g may be an array of B peak loads for B trajectories.
+
+        Returns:
+            Dict with 'time' (N,), 'position' and 'velocity' (..., N, 3),
+            'orientation' (..., N, 4) quaternions [w, x, y, z] and
+            'angular_vel' (..., N, 3)
+        """
+        t = accumulated_times(self.dt, self.duration)
 
         # Maneuver timing
         cruise1_end = self.duration * 0.3
         maneuver_end = self.duration * 0.7
 
-        t = 0.0
-        while t <= self.duration:
-            # Store state
-            states.append(HGVState(
-                position=pos.copy(),
-                velocity=vel.copy(),
-                orientation=Quaternion(*orient.q),
-                angular_vel=omega.copy(),
-                time=t
-            ))
-
-            # Determine phase and compute accelerations
-            if t < cruise1_end:
-                # Phase 1: Straight cruise
-                accel = np.array([0.0, 0.0, 0.0])
-                omega = np.array([0.0, 0.0, 0.0])
-
-            elif t < maneuver_end:
-                # Phase 2: Bank-to-Turn maneuver
-                # Compute maneuver progress
-                maneuver_progress = (t - cruise1_end) / (maneuver_end - cruise1_end)
-
-                # Smooth envelope (sinusoidal)
-                envelope = np.sin(np.pi * maneuver_progress)
-
-                # Centripetal acceleration for turn
-                g_load = self.max_g * envelope
-                accel_mag = g_load * self.g
-
-                # Bank angle creates lateral acceleration
-                bank_angle = np.pi / 4 * envelope  # 45° max bank
-
-                # Lateral (turn) acceleration
-                accel = np.array([
-                    0.0,  # Slight decel in x
-                    accel_mag * np.cos(bank_angle),  # Lateral
-                    -accel_mag * np.sin(bank_angle) * 0.3  # Small altitude loss
-                ])
-
-                # Roll rate for banking
-                omega = np.array([0.0, 0.0, bank_angle * 2 * envelope])
-
-            else:
-                # Phase 3: Exit cruise
-                accel = np.array([0.0, 0.0, 0.0])
-                omega = np.array([0.0, 0.0, 0.0])
-
-            # Integrate state
-            vel = vel + accel * self.dt
-            pos = pos + vel * self.dt
-
-            # Integrate orientation (simplified)
-            if np.linalg.norm(omega) > 1e-6:
-                angle = np.linalg.norm(omega) * self.dt
-                axis = omega / np.linalg.norm(omega)
-                delta_q = Quaternion.from_axis_angle(axis, angle)
-                orient = delta_q * orient
-                orient = orient.normalize()
-
-            t += self.dt
-
-        return states
+        # Phase 2: Bank-to-Turn maneuver with a smooth (sinusoidal) envelope
+        maneuver = (cruise1_end <= t) & (t < maneuver_end)
+        maneuver_progress = (t - cruise1_end) / (maneuver_end - cruise1_end)
+        envelope = np.where(maneuver, np.sin(np.pi * maneuver_progress), 0.0)
+
+        # Centripetal acceleration for turn
+        g_load = np.asarray(self.max_g, dtype=np.float64)[..., np.newaxis] * envelope
+        accel_mag = g_load * self.g
+
+        # Bank angle creates lateral acceleration
+        bank_angle = np.pi / 4 * envelope  # 45° max bank
+
+        accel = np.zeros(accel_mag.shape + (3,))
+        accel[..., 1] = accel_mag * np.cos(bank_angle)          # Lateral
+        accel[..., 2] = -accel_mag * np.sin(bank_angle) * 0.3   # Small altitude loss
+
+        position, velocity = integrate([0.0, 0.0, 30000.0], [self.speed, 0.0, 0.0],
+                                       accel, self.dt, record='before')
+
+        # Roll rate for banking is about z only, so the attitude is a
+        # rotation about z by the accumulated roll angle. Both are recorded
+        # one step behind, like position and velocity
+        roll_rate = bank_angle * 2 * envelope
+        turning = roll_rate > 1e-6
+        roll = np.concatenate([[0.0], np.cumsum(np.where(turning, roll_rate, 0.0) * self.dt)[:-1]])
+        lead = position.shape[:-1]
+
+        orientation = np.zeros(lead + (4,))
+        orientation[..., 0] = np.cos(roll / 2)
+        orientation[..., 3] = np.sin(roll / 2)
+        angular_vel = np.zeros(lead + (3,))
+        angular_vel[..., 1:, 2] = roll_rate[:-1]
+
+        return {
+            'time': t,
+            'position': position,
+            'velocity': velocity,
+            'orientation': orientation,
+            'angular_vel': angular_vel,
+        }
+
+    def generate_trajectory(self) -> List[HGVState]:
+        """Generate complete HGV trajectory with Bank-to-Turn maneuver"""
+        arrays = self.trajectory_arrays()
+        return [
+            HGVState(
+                position=arrays['position'][i].copy(),
+                velocity=arrays['velocity'][i].copy(),
+                orientation=Quaternion(*arrays['orientation'][i]),
+                angular_vel=arrays['angular_vel'][i].copy(),
+                time=float(t)
+            )
+            for i, t in enumerate(arrays['time'])
+        ]
+
+    def plasma_noise(self, positions: np.ndarray, velocities: np.ndarray,
+                     noise_std: float = 500.0,
+                     plasma_factor: float = 3.0,
+                     rng: Optional[np.random.Generator] = None,
+                     batch: Optional[int] = None) -> np.ndarray:
+        """
+        Noisy (..., N, 3) measurements of (..., N, 3) true positions.
+
+        The g-load of each sample comes from the velocity change since the
+        previous one. batch=B draws B independent noise realizations,
+        giving (B, ..., N, 3). Without an rng each call draws from a fresh,
+        unseeded Generator (new noise every call); pass a seeded one, as
+        run_simulation() does, to reproduce a run.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        positions = np.asarray(positions, dtype=np.float64)
+        velocities = np.asarray(velocities, dtype=np.float64)
+
+        # Instantaneous g-loading (1 g for the first sample)
+        accel = np.linalg.norm(np.diff(velocities, axis=-2), axis=-1) / self.dt
+        g_load = np.concatenate([np.ones(accel.shape[:-1] + (1,)), accel / self.g], axis=-1)
+
+        # Noise scales with g-loading (plasma compression)
+        max_g = np.asarray(self.max_g, dtype=np.float64)[..., np.newaxis]
+        noise_scale = noise_std * (1 + (plasma_factor - 1) * np.minimum(g_load / max_g, 1.0))
+        noise_scale = noise_scale[..., np.newaxis]
+
+        # Non-Gaussian noise (plasma has heavy tails): 70% Gaussian,
+        # 30% Laplacian
+        shape = positions.shape if batch is None else (batch,) + positions.shape
+        gaussian_noise = rng.standard_normal(shape) * noise_scale
+        laplacian_noise = rng.laplace(0.0, noise_scale / 2, shape)
+
+        return positions + 0.7 * gaussian_noise + 0.3 * laplacian_noise
 
     def add_plasma_noise(self, states: List[HGVState],
                          noise_std: float = 500.0,
-                         plasma_factor: float = 3.0) -> List[np.ndarray]:
+                         plasma_factor: float = 3.0,
+                         rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """
         Add plasma sheath radar noise to trajectory.
 
@@ -841,43 +852,22 @@ class HypersonicTrajectory:
         Args:
             noise_std: Base radar measurement noise (meters)
             plasma_factor: Noise amplification during maneuvers
+            rng: Source of the noise (default: a fresh, unseeded Generator
+                per call; see plasma_noise)
 
         Returns:
-            List of noisy position measurements
+            (N, 3) array of noisy position measurements
         """
-        noisy_positions = []
-
-        for i, state in enumerate(states):
-            # Compute instantaneous g-loading
-            if i > 0:
-                dv = state.velocity - states[i-1].velocity
-                accel = np.linalg.norm(dv) / self.dt
-                g_load = accel / self.g
-            else:
-                g_load = 1.0
-
-            # Noise scales with g-loading (plasma compression)
-            noise_scale = noise_std * (1 + (plasma_factor - 1) * min(g_load / self.max_g, 1.0))
-
-            # Add non-Gaussian noise (plasma has heavy tails)
-            # Use mixture of Gaussian and Laplacian
-            gaussian_noise = np.random.randn(3) * noise_scale
-            laplacian_noise = np.random.laplace(0, noise_scale/2, 3)
-
-            # 70% Gaussian, 30% Laplacian (heavy tails)
-            noise = 0.7 * gaussian_noise + 0.3 * laplacian_noise
-
-            noisy_pos = state.position + noise
-            noisy_positions.append(noisy_pos)
-
-        return noisy_positions
+        positions = np.array([s.position for s in states])
+        velocities = np.array([s.velocity for s in states])
+        return self.plasma_noise(positions, velocities, noise_std, plasma_factor, rng)
 
 
 # =============================================================================
 # SECTION 5: KALMAN FILTER (BASELINE TRACKER)
 # =============================================================================
 
-class KalmanFilter:
+class KalmanFilter(StreamingTracker):
     """
     Standard Linear Kalman Filter for trajectory tracking.
 
@@ -956,27 +946,25 @@ class KalmanFilter:
         I = np.eye(6)
         self.P = (I - K @ self.H) @ self.P
 
+    def _estimate(self, z: np.ndarray) -> np.ndarray:
+        self.predict()
+        self.update(z)
+        return self.x[0:3].copy()
+
     def track(self, measurements: List[np.ndarray]) -> List[np.ndarray]:
         """
         Track a sequence of measurements.
 
         Returns list of estimated positions.
         """
-        estimates = []
-
-        for z in measurements:
-            self.predict()
-            self.update(z)
-            estimates.append(self.x[0:3].copy())
-
-        return estimates
+        return [self._estimate(z) for z in measurements]
 
 
 # =============================================================================
 # SECTION 6: POM MANIFOLD TRACKER (GEOMETRIC TRACKER)
 # =============================================================================
 
-class POMManifoldTracker:
+class POMManifoldTracker(StreamingTracker):
     """
     Polytopal Orthogonal Modulation (POM) Manifold Tracker.
 
@@ -998,13 +986,14 @@ class POMManifoldTracker:
     - OAM physical layer (6G research)
     """
 
-    def __init__(self, lattice: Lattice600, dt: float = 0.1):
+    def __init__(self, lattice: Lattice600, dt: float = 0.1, noise_window: int = 20):
         """
         Initialize the POM tracker.
 
         Args:
             lattice: The 600-cell lattice for geometric projection
             dt: Time step
+            noise_window: Innovations in the running-median noise estimate
         """
         self.lattice = lattice
         self.dt = dt
@@ -1014,8 +1003,8 @@ class POMManifoldTracker:
         self.velocity: Optional[np.ndarray] = None
         self.acceleration: Optional[np.ndarray] = None
 
-        # State history for geodesic prediction
-        self.position_history: List[np.ndarray] = []
+        # State history for geodesic prediction (last 50 positions)
+        self.position_history = RingBuffer(50, (3,))
 
         # Alpha-Beta-Gamma filter coefficients
         # Tuned for maneuvering targets with high noise
@@ -1024,8 +1013,8 @@ class POMManifoldTracker:
         self.beta = 0.25   # Velocity correction
         self.gamma = 0.15  # Acceleration correction
 
-        # Noise estimation
-        self.innovation_history: List[float] = []
+        # Noise estimation (running median of the last noise_window innovations)
+        self.innovation_history = SlidingMedian(noise_window)
         self.noise_estimate = 800.0  # Initial estimate (high for plasma)
 
         self.initialized = False
@@ -1060,13 +1049,9 @@ class POMManifoldTracker:
         """
         self.innovation_history.append(innovation)
 
-        # Keep limited history
-        if len(self.innovation_history) > 20:
-            self.innovation_history.pop(0)
-
         if len(self.innovation_history) >= 5:
             # Use median for robustness to outliers
-            self.noise_estimate = np.median(self.innovation_history)
+            self.noise_estimate = self.innovation_history.median()
 
     def _compute_adaptive_gains(self, innovation: float) -> Tuple[float, float, float]:
         """
@@ -1113,7 +1098,7 @@ class POMManifoldTracker:
             self.position = measurement.copy()
             self.velocity = np.zeros(3)
             self.acceleration = np.zeros(3)
-            self.position_history.append(measurement.copy())
+            self.position_history.append(measurement)
             self.initialized = True
             return measurement.copy()
 
@@ -1155,9 +1140,7 @@ class POMManifoldTracker:
             self.acceleration = self.acceleration * (max_accel / accel_mag)
 
         # Update history
-        self.position_history.append(self.position.copy())
-        if len(self.position_history) > 50:
-            self.position_history.pop(0)
+        self.position_history.append(self.position)
 
         return self.position.copy()
 
@@ -1237,6 +1220,18 @@ class RollingLattice:
         self.trace_chain = trace_chain
         self.current_rotation = Quaternion(1, 0, 0, 0)
         self.rotation_history: List[Quaternion] = []
+        # Rotated constellation for current_rotation, shared by
+        # modulate/demodulate within a tick: (rotation key, lattice)
+        self._lattice_cache: Optional[Tuple[bytes, np.ndarray]] = None
+
+        # Base-lattice decoder: one representative per ±v pair (the lower
+        # index, as argmax |V p| picks). Without the antipodal twins the
+        # best/second-best correlation margin is meaningful.
+        vertices = lattice.vertices
+        is_twin = (vertices @ vertices.T) <= -1 + 1e-9
+        has_lower_twin = np.tril(is_twin, k=-1).any(axis=1)
+        self._decoder_idx = np.flatnonzero(~has_lower_twin)
+        self._decoder = vertices[self._decoder_idx]
 
     def tick(self, event_payload: str = "tick") -> Quaternion:
         """
@@ -1254,8 +1249,18 @@ class RollingLattice:
         return self.current_rotation
 
     def get_current_lattice(self) -> np.ndarray:
-        """Get the current rotated lattice constellation"""
-        return self.base_lattice.rotate_lattice(self.current_rotation)
+        """
+        Get the current rotated lattice constellation.
+
+        Cached per current_rotation (returned read-only), so modulate and
+        demodulate on the same tick rotate the lattice once.
+        """
+        key = self.current_rotation.q.tobytes()
+        if self._lattice_cache is None or self._lattice_cache[0] != key:
+            lattice = self.base_lattice.rotate_lattice(self.current_rotation)
+            lattice.flags.writeable = False
+            self._lattice_cache = (key, lattice)
+        return self._lattice_cache[1]
 
     def modulate(self, data: np.ndarray) -> np.ndarray:
         """
@@ -1267,22 +1272,40 @@ class RollingLattice:
         indices = data.astype(int) % len(lattice)
         return lattice[indices]
 
-    def demodulate(self, received: np.ndarray) -> np.ndarray:
+    def demodulate(self, received: np.ndarray,
+                   return_confidence: bool = False):
         """
         Demodulate received symbols using current lattice.
 
-        Snaps received points to nearest lattice vertices.
+        Snaps received points to nearest lattice vertices. The whole
+        (N, 4) burst is normalized at once, rotated back by the inverse
+        of current_rotation (p ↦ q† * p, i.e. P @ L(q)) and decoded with
+        one matrix product against the fixed base-lattice decoder.
+
+        Args:
+            received: (N, 4) received points
+            return_confidence: Also return, per symbol, the margin between
+                the best and second-best |correlation| (from the same pass)
+
+        Returns:
+            indices, or (indices, confidence) if return_confidence
         """
-        lattice = self.get_current_lattice()
-        indices = []
+        received = np.atleast_2d(received)
+        points = received / (np.linalg.norm(received, axis=1, keepdims=True) + 1e-10)
+
+        # Unit quaternion: L(q)^-1 = L(q)^T, so rows rotate back as P @ L(q)
+        unrotated = points @ self.current_rotation.left_matrix()
+
+        corr = np.abs(unrotated @ self._decoder.T)
+        best = np.argmax(corr, axis=1)
+        indices = self._decoder_idx[best]
 
-        for point in received:
-            point_norm = point / (np.linalg.norm(point) + 1e-10)
-            dots = np.abs(lattice @ point_norm)
-            idx = np.argmax(dots)
-            indices.append(idx)
+        if not return_confidence:
+            return indices
 
-        return np.array(indices)
+        top2 = np.partition(corr, -2, axis=1)[:, -2:]
+        confidence = top2[:, 1] - top2[:, 0]
+        return indices, confidence
 
 
 # =============================================================================
@@ -1398,7 +1421,8 @@ def run_simulation():
     noisy_positions = hgv_sim.add_plasma_noise(
         true_states,
         noise_std=600.0,
-        plasma_factor=5.0  # Higher amplification during maneuvers
+        plasma_factor=5.0,  # Higher amplification during maneuvers
+        rng=np.random.default_rng(42)
     )
     print(f"      Base noise: 600m RMS")
     print(f"      Plasma amplification: 5x during maneuver")
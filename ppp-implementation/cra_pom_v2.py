@@ -15,10 +15,20 @@ Version: 2.0 - Theoretical Claims Now Implemented
 
 import numpy as np
 from dataclasses import dataclass, field
-from typing import Tuple, List, Optional, Dict
+from typing import Tuple, List, Optional, Dict, Iterator, Mapping
 import hashlib
 from abc import ABC, abstractmethod
 
+from lattice_index import SphericalCapIndex
+from kalman_core import KalmanKernel, SteadyStateMonitor
+from ring_buffer import RingBuffer
+from sliding_median import SlidingMedian
+from tracker_stream import StreamingTracker
+from kinematics import integrate
+from polytope_geometry import cell600_vertices, cell24_vertices, e8_roots, unique_vertices
+from distance_spectrum import DistanceSpectrum, distance_spectrum
+from polytope_graph import PolytopeGraph, polytope_graph
+
 # =============================================================================
 # SECTION 1: QUATERNION ALGEBRA (Enhanced)
 # =============================================================================
@@ -368,35 +378,61 @@ class PolytopeLattice(ABC):
     def get_symmetry_order(self) -> int:
         pass
 
+    def get_index(self) -> SphericalCapIndex:
+        """Nearest-vertex index, built on first use and reused afterwards"""
+        index = getattr(self, '_index', None)
+        if index is None:
+            # q and -q are equivalent, so snap by absolute dot product
+            index = SphericalCapIndex(self.get_vertices(), antipodal=True)
+            self._index = index
+        return index
+
     def snap_to_nearest(self, point: np.ndarray) -> Tuple[int, np.ndarray, float]:
         """Snap point to nearest vertex"""
-        vertices = self.get_vertices()
-        point_norm = point / (np.linalg.norm(point) + 1e-10)
+        idx, nearest, distance = self.snap_batch(point[np.newaxis])
+        return int(idx[0]), nearest[0], float(distance[0])
 
-        # Use absolute dot product (q and -q are equivalent)
-        dots = np.abs(vertices @ point_norm)
-        idx = np.argmax(dots)
+    def snap_batch(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Snap an (M, 4) batch of points to their nearest vertices.
 
-        nearest = vertices[idx]
-        if np.dot(nearest, point_norm) < 0:
-            nearest = -nearest
+        Returns (indices, sign-aligned nearest vertices, distances).
+        """
+        vertices = self.get_vertices()
+        idx, distances = self.get_index().query(points)
 
-        distance = np.linalg.norm(point_norm - nearest)
-        return idx, nearest, distance
+        nearest = vertices[idx]
+        signs = np.where(np.sum(nearest * points, axis=1) < 0, -1.0, 1.0)
+        return idx, nearest * signs[:, np.newaxis], distances
+
+    def get_spectrum(self) -> DistanceSpectrum:
+        """Exact pairwise-distance spectrum, computed on first use"""
+        spectrum = getattr(self, '_spectrum', None)
+        if spectrum is None:
+            # Vertices closer than 0.01 are treated as duplicates
+            spectrum = distance_spectrum(self.get_vertices(), duplicate_tol=0.01)
+            self._spectrum = spectrum
+        return spectrum
 
     def minimum_distance(self) -> float:
-        """Compute minimum distance between vertices (code distance)"""
-        vertices = self.get_vertices()
-        n = len(vertices)
-        min_dist = float('inf')
+        """Minimum distance between vertices (code distance), over all pairs"""
+        return self.get_spectrum().d_min
 
-        for i in range(min(n, 50)):  # Sample for large lattices
-            for j in range(i+1, min(n, 50)):
-                d = np.linalg.norm(vertices[i] - vertices[j])
-                if d > 0.01:  # Ignore duplicates
-                    min_dist = min(min_dist, d)
+    def kissing_number(self) -> int:
+        """Most vertices any vertex has at the minimum distance"""
+        return self.get_spectrum().kissing_number
 
-        return min_dist
+    def get_graph(self) -> Optional[PolytopeGraph]:
+        """
+        Edge graph at the minimum distance (CSR), built on first use.
+
+        None for irregular point sets (e.g. Fibonacci), where the few pairs
+        at exactly d_min are not the edges of any polytope.
+        """
+        if not hasattr(self, '_graph'):
+            graph = polytope_graph(self.get_vertices(), self.minimum_distance())
+            self._graph = graph if graph.degree_stats()['regular'] else None
+        return self._graph
 
 
 class Lattice600Cell(PolytopeLattice):
@@ -413,46 +449,9 @@ class Lattice600Cell(PolytopeLattice):
         self._vertices = self._generate()
 
     def _generate(self) -> np.ndarray:
-        phi = self.PHI
-        inv_phi = 1 / phi
-        vertices = []
-
-        # 8 vertices: (±1, 0, 0, 0) permutations
-        for i in range(4):
-            for sign in [1, -1]:
-                v = np.zeros(4)
-                v[i] = sign
-                vertices.append(v)
-
-        # 16 vertices: (±½, ±½, ±½, ±½)
-        for signs in np.ndindex(2, 2, 2, 2):
-            v = np.array([(-1)**s * 0.5 for s in signs])
-            vertices.append(v)
-
-        # 96 vertices: even permutations of (±φ/2, ±1/2, ±1/(2φ), 0)
-        base = [phi/2, 0.5, inv_phi/2, 0]
-        even_perms = [
-            [0,1,2,3], [0,2,3,1], [0,3,1,2],
-            [1,0,3,2], [1,2,0,3], [1,3,2,0],
-            [2,0,1,3], [2,1,3,0], [2,3,0,1],
-            [3,0,2,1], [3,1,0,2], [3,2,1,0]
-        ]
-
-        for perm in even_perms:
-            base_perm = np.array([base[p] for p in perm])
-            for signs in np.ndindex(2, 2, 2):
-                v = base_perm.copy()
-                sign_idx = 0
-                for i in range(4):
-                    if base_perm[i] != 0:
-                        v[i] *= (-1)**signs[sign_idx]
-                        sign_idx += 1
-                vertices.append(v)
-
-        vertices = np.array(vertices)
-        # Normalize to unit sphere
-        norms = np.linalg.norm(vertices, axis=1, keepdims=True)
-        return vertices / norms
+        # 8 of (±1, 0, 0, 0), 16 of (±½, ±½, ±½, ±½) and the 96 even
+        # permutations of (±φ/2, ±1/2, ±1/(2φ), 0), built once per process
+        return cell600_vertices()
 
     def get_vertices(self) -> np.ndarray:
         return self._vertices.copy()
@@ -478,21 +477,8 @@ class Lattice24Cell(PolytopeLattice):
         self._vertices = self._generate()
 
     def _generate(self) -> np.ndarray:
-        vertices = []
-
-        # 8 vertices: permutations of (±1, 0, 0, 0)
-        for i in range(4):
-            for sign in [1, -1]:
-                v = np.zeros(4)
-                v[i] = sign
-                vertices.append(v)
-
-        # 16 vertices: (±½, ±½, ±½, ±½)  - normalized to unit
-        for signs in np.ndindex(2, 2, 2, 2):
-            v = np.array([(-1)**s * 0.5 for s in signs])
-            vertices.append(v / np.linalg.norm(v))
-
-        return np.array(vertices)
+        # 8 of (±1, 0, 0, 0) and 16 of (±½, ±½, ±½, ±½), all unit length
+        return cell24_vertices('hurwitz')
 
     def get_vertices(self) -> np.ndarray:
         return self._vertices.copy()
@@ -512,32 +498,26 @@ class LatticeE8Projection(PolytopeLattice):
     When projected to 4D, it provides an even denser code than the 600-cell.
 
     This is cutting-edge: E8 is used in modern error-correcting codes.
+
+    Projected roots that coincide (or are antipodal) within dedup_tol are
+    merged.
     """
 
-    def __init__(self):
+    def __init__(self, dedup_tol: float = 0.01):
+        self.dedup_tol = dedup_tol
         self._vertices = self._generate()
 
     def _generate(self) -> np.ndarray:
         """Generate E8 roots and project to 4D"""
-        roots = []
-
-        # Type 1: permutations of (±1, ±1, 0, 0, 0, 0, 0, 0)
-        for i in range(8):
-            for j in range(i+1, 8):
-                for si in [1, -1]:
-                    for sj in [1, -1]:
-                        v = np.zeros(8)
-                        v[i] = si
-                        v[j] = sj
-                        roots.append(v)
-
-        # Type 2: (±½, ±½, ±½, ±½, ±½, ±½, ±½, ±½) with even number of minus
-        for signs in np.ndindex(2, 2, 2, 2, 2, 2, 2, 2):
-            if sum(signs) % 2 == 0:  # Even number of minus signs
-                v = np.array([(-1)**s * 0.5 for s in signs])
-                roots.append(v)
-
-        roots = np.array(roots)
+        roots = e8_roots()
+
+        # unique_vertices keeps the first of each ±v pair, so list the roots
+        # in this lattice's original order: (+,+) sign pairs first, and the
+        # half-integer roots with coordinate 0 as the most significant sign
+        type1 = roots[:112].reshape(28, 4, 8)[:, ::-1].reshape(112, 8)
+        type2 = roots[112:]
+        minus_mask = (type2 < 0) @ (1 << np.arange(7, -1, -1))
+        roots = np.concatenate([type1, type2[np.argsort(minus_mask)]])
 
         # Project to 4D using a specific projection that preserves structure
         # Use the first 4 coordinates (simple projection)
@@ -549,18 +529,8 @@ class LatticeE8Projection(PolytopeLattice):
         norms = np.maximum(norms, 1e-10)
         projected = projected / norms
 
-        # Remove duplicates (within tolerance)
-        unique = [projected[0]]
-        for v in projected[1:]:
-            is_dup = False
-            for u in unique:
-                if np.linalg.norm(v - u) < 0.01 or np.linalg.norm(v + u) < 0.01:
-                    is_dup = True
-                    break
-            if not is_dup:
-                unique.append(v)
-
-        return np.array(unique)
+        # Remove duplicates and antipodes (within tolerance)
+        return unique_vertices(projected, self.dedup_tol)
 
     def get_vertices(self) -> np.ndarray:
         return self._vertices.copy()
@@ -580,44 +550,26 @@ class LatticeGosset(PolytopeLattice):
     Related to exceptional Lie algebras and string theory.
     """
 
-    def __init__(self):
+    def __init__(self, dedup_tol: float = 0.01):
         # For simplicity, use a subset that projects well to 4D
+        self.dedup_tol = dedup_tol
         self._vertices = self._generate()
 
     def _generate(self) -> np.ndarray:
         """Generate Gosset polytope vertices via E8 construction"""
         phi = (1 + np.sqrt(5)) / 2
 
-        vertices = []
-
-        # Use the "H4 + H4" decomposition of E8
-        # First H4 (600-cell)
-        h4 = Lattice600Cell()
-        v600 = h4.get_vertices()
-
-        # Scaled copy for second layer
-        for v in v600:
-            vertices.append(v)
-            vertices.append(v * phi / 2)  # Scaled
-
-        vertices = np.array(vertices)
+        # Use the "H4 + H4" decomposition of E8: each 600-cell vertex
+        # followed by its scaled copy for the second layer
+        v600 = cell600_vertices()
+        vertices = np.stack([v600, v600 * phi / 2], axis=1).reshape(-1, 4)
 
         # Normalize
         norms = np.linalg.norm(vertices, axis=1, keepdims=True)
         vertices = vertices / np.maximum(norms, 1e-10)
 
-        # Remove duplicates
-        unique = [vertices[0]]
-        for v in vertices[1:]:
-            is_dup = False
-            for u in unique:
-                if np.linalg.norm(v - u) < 0.01 or np.linalg.norm(v + u) < 0.01:
-                    is_dup = True
-                    break
-            if not is_dup:
-                unique.append(v)
-
-        return np.array(unique)
+        # Remove duplicates and antipodes (within tolerance)
+        return unique_vertices(vertices, self.dedup_tol)
 
     def get_vertices(self) -> np.ndarray:
         return self._vertices.copy()
@@ -964,7 +916,7 @@ class MoireConsensus:
 # SECTION 6: GEOMETRIC TRACKER - Proper Implementation
 # =============================================================================
 
-class GeometricTracker:
+class GeometricTracker(StreamingTracker):
     """
     Position tracker with adaptive gain and second-order dynamics.
 
@@ -987,8 +939,8 @@ class GeometricTracker:
         self.velocity: Optional[np.ndarray] = None
         self.acceleration: Optional[np.ndarray] = None
 
-        # History
-        self.position_history: List[np.ndarray] = []
+        # History (last 30 positions)
+        self.position_history = RingBuffer(30, (3,))
 
         # Tuned filter parameters
         self.alpha = 0.35  # Position gain
@@ -1052,7 +1004,7 @@ class GeometricTracker:
             self.position = measurement.copy()
             self.velocity = np.zeros(3)
             self.acceleration = np.zeros(3)
-            self.position_history.append(measurement.copy())
+            self.position_history.append(measurement)
             return measurement.copy()
 
         # Predict
@@ -1093,7 +1045,7 @@ class GeometricTracker:
 
         # Update acceleration
         if len(self.position_history) >= 2:
-            prev_vel = (self.position_history[-1] - self.position_history[-2]) / self.dt if len(self.position_history) >= 2 else np.zeros(3)
+            prev_vel = (self.position_history[-1] - self.position_history[-2]) / self.dt
             accel_est = (self.velocity - prev_vel) / self.dt
             self.acceleration = (1 - gamma) * self.acceleration + gamma * accel_est
 
@@ -1104,9 +1056,7 @@ class GeometricTracker:
             self.acceleration = self.acceleration * (max_accel / accel_mag)
 
         # Update history
-        self.position_history.append(self.position.copy())
-        if len(self.position_history) > 30:
-            self.position_history.pop(0)
+        self.position_history.append(self.position)
 
         return self.position.copy()
 
@@ -1131,7 +1081,49 @@ class GeometricTracker:
 # SECTION 7: STEREOSCOPIC POM-KALMAN FUSION
 # =============================================================================
 
-class StereoscopicPOMKalman:
+class StereoDiagnostics(Mapping):
+    """
+    Diagnostic dict of one StereoscopicPOMKalman sample.
+
+    Holds the sample's arrays and converts them to the plain dict
+    (lists and floats) only when a key is first read, so update() can
+    return it every sample without building dicts nobody looks at.
+    """
+
+    def __init__(self, names: List[str], estimates: np.ndarray, disparities: np.ndarray,
+                 weights: np.ndarray, max_disparity: float, confidence: float,
+                 fused: np.ndarray):
+        self._arrays = (names, estimates, disparities, weights, max_disparity, confidence, fused)
+        self._dict: Optional[Dict] = None
+
+    def _build(self) -> Dict:
+        if self._dict is None:
+            names, estimates, disparities, weights, max_disparity, confidence, fused = self._arrays
+            self._dict = {
+                'individual_estimates': {name: est.tolist() for name, est in zip(names, estimates)},
+                'disparities': {name: float(disp) for name, disp in zip(names, disparities)},
+                'weights': {name: float(w) for name, w in zip(names, weights)},
+                'max_disparity': float(max_disparity),
+                'consensus_confidence': float(confidence),
+                'fused_estimate': fused.tolist()
+            }
+            self._arrays = None
+        return self._dict
+
+    def __getitem__(self, key: str):
+        return self._build()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._build())
+
+    def __len__(self) -> int:
+        return len(self._build())
+
+    def __repr__(self) -> str:
+        return repr(self._build())
+
+
+class StereoscopicPOMKalman(StreamingTracker):
     """
     Stereoscopic fusion of multiple Kalman filters with different geometric lenses.
 
@@ -1155,14 +1147,23 @@ class StereoscopicPOMKalman:
     The fused estimate combines all perspectives weighted by their agreement:
 
         x_fused = Σ w_i * x_i  where w_i ∝ exp(-disparity_i / σ)
+
+    DIAGNOSTICS:
+    Per-sample lens estimates, disparities, weights and the fused estimate
+    are recorded into preallocated ring buffers holding the last `history`
+    samples; diagnostics(i) materializes the dict view of any of them.
+    update() returns the current sample's diagnostics as a StereoDiagnostics
+    mapping, which builds the dict only when a key is first read.
     """
 
-    def __init__(self, dt: float = 0.1):
+    def __init__(self, dt: float = 0.1,
+                 lens_configs: Optional[List[Tuple[str, PolytopeLattice]]] = None,
+                 history: int = 1024):
         self.dt = dt
-        self.lenses: List[Tuple[str, PolytopeLattice, 'StereoKalmanFilter']] = []
+        self.lenses: List[Tuple[str, PolytopeLattice]] = []
 
         # Initialize with multiple geometric lenses
-        self._init_lenses()
+        self._init_lenses(lens_configs)
 
         # Fusion parameters
         self.disparity_sigma = 0.1  # Controls how quickly we downweight disagreeing lenses
@@ -1172,36 +1173,37 @@ class StereoscopicPOMKalman:
         self.total_samples = 0
         self.high_disparity_events = 0
 
-    def _init_lenses(self):
-        """Initialize the stereoscopic lens array"""
-        lens_configs = [
-            ("Dense-H4", Lattice600Cell()),
-            ("Sparse-F4", Lattice24Cell()),
-            ("E8-Proj", LatticeE8Projection()),
-            ("Fibonacci", LatticeFibonacci(60)),  # Smaller for diversity
-        ]
-
-        for name, lattice in lens_configs:
-            kf = StereoKalmanFilter(lattice, self.dt)
-            self.lenses.append((name, lattice, kf))
-
-    def _compute_disparity(self, estimates: List[np.ndarray]) -> np.ndarray:
+        # Diagnostic ring buffers (last `history` samples)
+        n_lenses = len(self.lenses)
+        self.estimate_history = RingBuffer(history, (n_lenses, 3))
+        self.disparity_history = RingBuffer(history, (n_lenses,))
+        self.weight_history = RingBuffer(history, (n_lenses,))
+        self.max_disparity_history = RingBuffer(history)
+        self.confidence_history = RingBuffer(history)
+        self.fused_history = RingBuffer(history, (3,))
+
+    def _init_lenses(self, lens_configs: Optional[List[Tuple[str, PolytopeLattice]]] = None):
+        """Initialize the stereoscopic lens array (default: four lenses)"""
+        if lens_configs is None:
+            lens_configs = [
+                ("Dense-H4", Lattice600Cell()),
+                ("Sparse-F4", Lattice24Cell()),
+                ("E8-Proj", LatticeE8Projection()),
+                ("Fibonacci", LatticeFibonacci(60)),  # Smaller for diversity
+            ]
+
+        self.lenses = list(lens_configs)
+        self.bank = StereoLensBank([lattice for _, lattice in self.lenses], self.dt)
+
+    def _compute_disparity(self, estimates: np.ndarray) -> np.ndarray:
         """
         Compute pairwise disparity between lens estimates.
 
         Returns disparity for each lens (mean distance from other lenses).
         """
         n = len(estimates)
-        disparities = np.zeros(n)
-
-        for i in range(n):
-            total_dist = 0
-            for j in range(n):
-                if i != j:
-                    total_dist += np.linalg.norm(estimates[i] - estimates[j])
-            disparities[i] = total_dist / (n - 1)
-
-        return disparities
+        distances = np.linalg.norm(estimates[:, np.newaxis, :] - estimates[np.newaxis, :, :], axis=2)
+        return distances.sum(axis=1) / max(1, n - 1)
 
     def _compute_weights(self, disparities: np.ndarray) -> np.ndarray:
         """
@@ -1214,25 +1216,18 @@ class StereoscopicPOMKalman:
         weights /= np.sum(weights)
         return weights
 
-    def update(self, measurement: np.ndarray) -> Tuple[np.ndarray, Dict]:
+    def update(self, measurement: np.ndarray) -> Tuple[np.ndarray, 'StereoDiagnostics']:
         """
         Process measurement through all lenses and fuse.
 
         Returns:
-            Fused position estimate and diagnostic dict
+            Fused position estimate and diagnostic dict (a StereoDiagnostics
+            mapping, converted to plain values on first access)
         """
         self.total_samples += 1
 
-        # Get estimate from each lens
-        estimates = []
-        innovations = []
-
-        for name, lattice, kf in self.lenses:
-            est, innov = kf.update(measurement)
-            estimates.append(est)
-            innovations.append(innov)
-
-        estimates = np.array(estimates)
+        # Get estimate from every lens in one stacked update
+        estimates, innovations = self.bank.update(measurement)
 
         # Compute disparities and weights
         disparities = self._compute_disparity(estimates)
@@ -1244,31 +1239,51 @@ class StereoscopicPOMKalman:
             self.high_disparity_events += 1
 
         # Fused estimate
-        fused = np.sum(weights[:, np.newaxis] * estimates, axis=0)
+        fused = weights @ estimates
 
-        # Diagnostics
-        diagnostics = {
-            'individual_estimates': {name: est.tolist() for (name, _, _), est in zip(self.lenses, estimates)},
-            'disparities': {name: disp for (name, _, _), disp in zip(self.lenses, disparities)},
-            'weights': {name: w for (name, _, _), w in zip(self.lenses, weights)},
-            'max_disparity': max_disparity,
-            'consensus_confidence': 1.0 / (1.0 + max_disparity / 100),
-            'fused_estimate': fused.tolist()
-        }
+        confidence = 1.0 / (1.0 + max_disparity / 100)
+
+        self.estimate_history.append(estimates)
+        self.disparity_history.append(disparities)
+        self.weight_history.append(weights)
+        self.max_disparity_history.append(max_disparity)
+        self.confidence_history.append(confidence)
+        self.fused_history.append(fused)
+
+        return fused, StereoDiagnostics(self.lens_names, estimates, disparities, weights,
+                                        max_disparity, confidence, fused)
 
-        return fused, diagnostics
+    def _estimate(self, z: np.ndarray) -> np.ndarray:
+        return self.update(z)[0]
+
+    def diagnostics(self, i: int = -1) -> Dict:
+        """
+        Dict view of recorded sample i (default: the most recent).
+
+        Only the last `history` samples are held; i indexes them oldest
+        first, negative values count back from the newest.
+        """
+        return dict(StereoDiagnostics(
+            self.lens_names, self.estimate_history[i], self.disparity_history[i],
+            self.weight_history[i], self.max_disparity_history[i],
+            self.confidence_history[i], self.fused_history[i]))
+
+    @property
+    def lens_names(self) -> List[str]:
+        return [name for name, _ in self.lenses]
 
     def track(self, measurements: List[np.ndarray]) -> Tuple[List[np.ndarray], Dict]:
         """Track sequence with stereoscopic fusion"""
+        n = len(measurements)
         estimates = []
-        all_disparities = []
-        all_confidences = []
+        all_disparities = np.empty(n)
+        all_confidences = np.empty(n)
 
-        for m in measurements:
-            est, diag = self.update(m)
+        for k, m in enumerate(measurements):
+            est, _ = self.update(m)
             estimates.append(est)
-            all_disparities.append(diag['max_disparity'])
-            all_confidences.append(diag['consensus_confidence'])
+            all_disparities[k] = self.max_disparity_history[-1]
+            all_confidences[k] = self.confidence_history[-1]
 
         stats = {
             'total_samples': self.total_samples,
@@ -1288,9 +1303,12 @@ class StereoKalmanFilter:
 
     The lens transforms measurements into a geometric space before filtering,
     providing a unique perspective on the tracking problem.
+
+    steady_state=True switches to the cached constant-gain update once
+    the gain has converged.
     """
 
-    def __init__(self, lens: PolytopeLattice, dt: float = 0.1):
+    def __init__(self, lens: PolytopeLattice, dt: float = 0.1, steady_state: bool = False):
         self.lens = lens
         self.dt = dt
 
@@ -1321,6 +1339,8 @@ class StereoKalmanFilter:
         self.P = np.eye(6) * 10000
 
         self.initialized = False
+        self.steady = SteadyStateMonitor(self.F, self.H, self.Q, self.R) if steady_state else None
+        self.kernel = KalmanKernel(6, 3)
 
     def _lens_transform(self, measurement: np.ndarray) -> np.ndarray:
         """
@@ -1364,22 +1384,102 @@ class StereoKalmanFilter:
             self.initialized = True
             return transformed.copy(), 0.0
 
-        # Predict
-        self.x = self.F @ self.x
-        self.P = self.F @ self.P @ self.F.T + self.Q
+        if self.steady is not None and self.steady.converged:
+            self.x, y = self.steady.step(self.F, self.H, self.x, transformed)
+            return self.x[0:3].copy(), np.linalg.norm(y)
 
-        # Update with transformed measurement
-        y = transformed - self.H @ self.x
+        # Predict, then update with transformed measurement
+        self.kernel.predict(self.F, self.Q, self.x, self.P)
+        K, y = self.kernel.update(self.H, self.R, self.x, self.P, transformed)
         innovation = np.linalg.norm(y)
 
-        S = self.H @ self.P @ self.H.T + self.R
-        K = self.P @ self.H.T @ np.linalg.inv(S)
-        self.x = self.x + K @ y
-        self.P = (np.eye(6) - K @ self.H) @ self.P
+        if self.steady is not None and self.steady.check(K):
+            self.P[:] = self.steady.solution.P_post
 
         return self.x[0:3].copy(), innovation
 
 
+class StereoLensBank:
+    """
+    All lenses of a StereoscopicPOMKalman advanced as one stacked engine.
+
+    Equivalent to running one StereoKalmanFilter per lattice, but per
+    measurement:
+    - the 4D embedding and normalization are computed once,
+    - the snap against every lens is ONE product with the concatenated
+      vertex matrix; per-lens winners come from a padded (L, N_max) gather
+      of offset indices (the antipodal argmax |v·q| rule of
+      PolytopeLattice.snap_batch, exact ties going to the lowest index),
+    - the L filters advance as a single batched (L, 6, 6) Kalman update.
+
+    Per-step cost is a handful of array operations whatever the lens count.
+    """
+
+    def __init__(self, lattices: List[PolytopeLattice], dt: float = 0.1):
+        template = StereoKalmanFilter(lattices[0], dt)
+        self.F, self.H, self.Q, self.R = template.F, template.H, template.Q, template.R
+        self.n_lenses = L = len(lattices)
+
+        # Concatenated vertex matrix with per-lens offsets
+        vertices = [np.asarray(lat.get_vertices(), dtype=np.float64) for lat in lattices]
+        sizes = np.array([len(v) for v in vertices])
+        self._offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        self._vertices = np.vstack(vertices)
+        norms = np.linalg.norm(self._vertices, axis=1, keepdims=True)
+        self._dirs = np.where(norms > 1e-9, self._vertices / np.maximum(norms, 1e-300), 0.0)
+
+        # (L, N_max) gather into the concatenated |dots|; padding points at a
+        # sentinel slot holding -1 so it never wins
+        n_total = len(self._vertices)
+        cols = np.arange(sizes.max())
+        self._gather = np.where(cols < sizes[:, np.newaxis],
+                                self._offsets[:, np.newaxis] + cols, n_total)
+        self._abs_dots = np.empty(n_total + 1)
+        self._abs_dots[-1] = -1.0
+
+        self.x = np.zeros((L, 6))
+        self.P = np.repeat(template.P[np.newaxis], L, axis=0)
+        self.kernel = KalmanKernel(6, 3, batch=L)
+        self.initialized = False
+
+    def lens_transform(self, measurement: np.ndarray) -> np.ndarray:
+        """(L, 3) lens-transformed copies of one measurement"""
+        # Shared normalizer: embed in 4D (w = 0) and normalize once
+        m_4d = np.array([measurement[0], measurement[1], measurement[2], 0])
+        scale = np.linalg.norm(m_4d) + 1e-10
+        q = m_4d / scale
+
+        # Snap against every lens at once
+        dots = self._dirs @ q
+        np.abs(dots, out=self._abs_dots[:-1])
+        idx = self._offsets + np.argmax(self._abs_dots[self._gather], axis=1)
+        signs = np.where(dots[idx] < 0, -1.0, 1.0)[:, np.newaxis]
+        distances = np.linalg.norm(q - signs * self._dirs[idx], axis=1)
+
+        # Blend with the sign-aligned lattice projection (see StereoKalmanFilter)
+        lattice_weight = np.exp(-distances / 0.3)[:, np.newaxis]
+        projected_3d = signs * self._vertices[idx, :3] * scale
+        return (1 - 0.2 * lattice_weight) * measurement + 0.2 * lattice_weight * projected_3d
+
+    def update(self, measurement: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Update all lens filters with one measurement.
+
+        Returns:
+            (estimates, innovations): (L, 3) positions and (L,) innovation magnitudes
+        """
+        transformed = self.lens_transform(measurement)
+
+        if not self.initialized:
+            self.x[:, 0:3] = transformed
+            self.initialized = True
+            return transformed, np.zeros(self.n_lenses)
+
+        self.kernel.predict(self.F, self.Q, self.x, self.P)
+        _, y = self.kernel.update(self.H, self.R, self.x, self.P, transformed)
+        return self.x[:, 0:3].copy(), np.linalg.norm(y, axis=1)
+
+
 # =============================================================================
 # SECTION 8: ViT-INSPIRED GEOMETRIC ATTENTION
 # =============================================================================
@@ -1452,24 +1552,19 @@ class ViTGeometricAttention:
         # Precompute key and value embeddings for vertices
         self._precompute_kv()
 
-        # Statistics
-        self.attention_history: List[np.ndarray] = []
+        # Statistics (attention of the last 100 observations)
+        self.attention_history = RingBuffer(100, (n_heads, self.n_vertices))
 
     def _precompute_kv(self):
         """Precompute key and value embeddings for all vertices"""
-        # Keys: (n_heads, n_vertices, embed_dim)
-        self.keys = np.zeros((self.n_heads, self.n_vertices, self.embed_dim))
-        self.values = np.zeros((self.n_heads, self.n_vertices, self.embed_dim))
-
-        for h in range(self.n_heads):
-            for i, v in enumerate(self.vertices):
-                self.keys[h, i] = v @ self.W_k[h]
-                self.values[h, i] = v @ self.W_v[h]
+        # Keys and values: (n_heads, n_vertices, embed_dim)
+        self.keys = np.einsum('nd,hde->hne', self.vertices, self.W_k)
+        self.values = np.einsum('nd,hde->hne', self.vertices, self.W_v)
 
     def _softmax(self, x: np.ndarray) -> np.ndarray:
-        """Numerically stable softmax"""
-        exp_x = np.exp(x - np.max(x))
-        return exp_x / (np.sum(exp_x) + 1e-10)
+        """Numerically stable softmax over the last axis"""
+        exp_x = np.exp(x - np.max(x, axis=-1, keepdims=True))
+        return exp_x / (np.sum(exp_x, axis=-1, keepdims=True) + 1e-10)
 
     def forward(self, observation: np.ndarray) -> Tuple[np.ndarray, Dict]:
         """
@@ -1481,89 +1576,91 @@ class ViTGeometricAttention:
         Returns:
             Transformed observation and attention diagnostics
         """
-        # Ensure 4D
-        if len(observation) == 3:
-            obs_4d = np.array([*observation, 0.0])
-        else:
-            obs_4d = observation
+        outputs, _, diag = self.forward_batch(np.asarray(observation)[np.newaxis])
 
-        # Normalize
-        obs_norm = obs_4d / (np.linalg.norm(obs_4d) + 1e-10)
+        diagnostics = {
+            'attention_entropy': float(diag['attention_entropy'][0]),
+            'dominant_vertex': int(diag['dominant_vertex'][0]),
+            'attention_concentration': float(diag['attention_concentration'][0]),
+            'head_agreement': float(diag['head_agreement'][0])
+        }
 
-        # Compute queries: (n_heads, embed_dim)
-        queries = np.zeros((self.n_heads, self.embed_dim))
-        for h in range(self.n_heads):
-            queries[h] = obs_norm @ self.W_q[h]
+        return outputs[0], diagnostics
+
+    def forward_batch(self, observations: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict]:
+        """
+        Apply attention to a batch of observations in one pass.
 
-        # Compute attention scores for each head: (n_heads, n_vertices)
-        attention = np.zeros((self.n_heads, self.n_vertices))
-        scale = np.sqrt(self.embed_dim)
+        Args:
+            observations: (B, 4) points (or (B, 3) positions padded to 4D)
+
+        Returns:
+            (outputs, attention, diagnostics): (B, 4) transformed observations,
+            (B, n_heads, n_vertices) attention, and a dict of (B,) arrays with
+            the same keys as forward()
+        """
+        obs = np.asarray(observations, dtype=np.float64)
+        # Ensure 4D
+        if obs.shape[1] == 3:
+            obs = np.hstack([obs, np.zeros((len(obs), 1))])
 
-        for h in range(self.n_heads):
-            scores = queries[h] @ self.keys[h].T / scale
-            attention[h] = self._softmax(scores)
+        # Normalize
+        obs_norm = obs / (np.linalg.norm(obs, axis=1, keepdims=True) + 1e-10)
 
-        # Compute weighted values: (n_heads, embed_dim)
-        head_outputs = np.zeros((self.n_heads, self.embed_dim))
-        for h in range(self.n_heads):
-            head_outputs[h] = attention[h] @ self.values[h]
+        # Queries (B, n_heads, embed_dim) and attention (B, n_heads, n_vertices)
+        queries = np.einsum('bd,hde->bhe', obs_norm, self.W_q)
+        scores = np.einsum('bhe,hne->bhn', queries, self.keys) / np.sqrt(self.embed_dim)
+        attention = self._softmax(scores)
 
-        # Concatenate heads and project to output
-        concat = head_outputs.flatten()  # (n_heads * embed_dim,)
-        output_4d = concat @ self.W_o    # (4,)
+        # Weighted values, heads concatenated and projected to 4D
+        head_outputs = np.einsum('bhn,hne->bhe', attention, self.values)
+        outputs = head_outputs.reshape(len(obs), -1) @ self.W_o
 
         # Normalize output
-        output_4d = output_4d / (np.linalg.norm(output_4d) + 1e-10)
+        outputs /= np.linalg.norm(outputs, axis=1, keepdims=True) + 1e-10
 
         # Store attention for analysis
-        self.attention_history.append(attention.copy())
-        if len(self.attention_history) > 100:
-            self.attention_history.pop(0)
+        self.attention_history.extend(attention)
 
-        # Diagnostics
+        mean_attn = np.mean(attention, axis=1)
         diagnostics = {
-            'attention_entropy': self._attention_entropy(attention),
-            'dominant_vertex': int(np.argmax(np.mean(attention, axis=0))),
-            'attention_concentration': float(np.max(attention)),
+            'attention_entropy': self._attention_entropy(mean_attn),
+            'dominant_vertex': np.argmax(mean_attn, axis=1),
+            'attention_concentration': np.max(attention, axis=(1, 2)),
             'head_agreement': self._head_agreement(attention)
         }
 
-        return output_4d, diagnostics
+        return outputs, attention, diagnostics
 
-    def _attention_entropy(self, attention: np.ndarray) -> float:
-        """Compute entropy of attention distribution (higher = more distributed)"""
-        mean_attn = np.mean(attention, axis=0)
+    def _attention_entropy(self, mean_attn: np.ndarray) -> np.ndarray:
+        """Entropy of head-averaged attention (higher = more distributed)"""
         mean_attn = mean_attn + 1e-10
-        return float(-np.sum(mean_attn * np.log(mean_attn)))
-
-    def _head_agreement(self, attention: np.ndarray) -> float:
-        """Measure how much the heads agree (higher = more agreement)"""
-        n_heads = attention.shape[0]
-        agreements = []
-        for i in range(n_heads):
-            for j in range(i+1, n_heads):
-                # Cosine similarity between attention distributions
-                sim = np.dot(attention[i], attention[j]) / (
-                    np.linalg.norm(attention[i]) * np.linalg.norm(attention[j]) + 1e-10
-                )
-                agreements.append(sim)
-        return float(np.mean(agreements)) if agreements else 1.0
+        return -np.sum(mean_attn * np.log(mean_attn), axis=-1)
+
+    def _head_agreement(self, attention: np.ndarray) -> np.ndarray:
+        """Mean pairwise cosine similarity between heads (higher = more agreement)"""
+        n_heads = attention.shape[1]
+        if n_heads < 2:
+            return np.ones(len(attention))
+        gram = np.einsum('bhn,bkn->bhk', attention, attention)
+        norms = np.linalg.norm(attention, axis=2)
+        i, j = np.triu_indices(n_heads, k=1)
+        sims = gram[:, i, j] / (norms[:, i] * norms[:, j] + 1e-10)
+        return np.mean(sims, axis=1)
 
     def analyze_attention_patterns(self) -> Dict:
         """Analyze accumulated attention patterns"""
-        if not self.attention_history:
+        if len(self.attention_history) == 0:
             return {}
 
-        all_attn = np.array(self.attention_history)  # (T, n_heads, n_vertices)
-
-        # Average attention per vertex
-        mean_vertex_attn = np.mean(all_attn, axis=(0, 1))
+        # Average attention per vertex (running window mean, no stacking)
+        mean_vertex_attn = self.attention_history.mean().mean(axis=0)
 
         # Most attended vertices
         top_vertices = np.argsort(mean_vertex_attn)[-5:][::-1]
 
         # Attention stability over time
-        attn_std = np.std(all_attn, axis=0).mean()
+        attn_std = self.attention_history.std().mean()
 
         return {
             'top_vertices': top_vertices.tolist(),
@@ -1573,7 +1670,7 @@ class ViTGeometricAttention:
         }
 
 
-class CognitiveGeometricTracker:
+class CognitiveGeometricTracker(StreamingTracker):
     """
     Combined tracker using stereoscopic POM-Kalman with ViT attention.
 
@@ -1590,7 +1687,7 @@ class CognitiveGeometricTracker:
     providing robustness to adversarial conditions and non-Gaussian noise.
     """
 
-    def __init__(self, dt: float = 0.1):
+    def __init__(self, dt: float = 0.1, entropy_window: int = 50):
         self.dt = dt
 
         # State (like Kalman filter)
@@ -1617,13 +1714,15 @@ class CognitiveGeometricTracker:
         self.Q[0:3, 0:3] *= 0.01
 
         self.R_base = np.eye(3) * 600**2
+        self.kernel = KalmanKernel(6, 3)
 
         # ViT layer for adaptive R estimation (one shared attention layer)
         self.lattice = Lattice600Cell()
         self.vit = ViTGeometricAttention(self.lattice, n_heads=4, embed_dim=8)
 
-        # Track attention entropy history for adaptation
-        self.entropy_history: List[float] = []
+        # Track attention entropy history for adaptation (running median
+        # of the last entropy_window samples)
+        self.entropy_history = SlidingMedian(entropy_window)
 
         # Statistics
         self.total_samples = 0
@@ -1644,15 +1743,23 @@ class CognitiveGeometricTracker:
 
         # Track entropy for baseline estimation
         self.entropy_history.append(entropy)
-        if len(self.entropy_history) > 50:
-            self.entropy_history.pop(0)
 
         # Compute baseline entropy
         if len(self.entropy_history) >= 10:
-            baseline_entropy = np.median(self.entropy_history)
+            baseline_entropy = self.entropy_history.median()
         else:
             baseline_entropy = entropy
 
+        return self.noise_scale(entropy, baseline_entropy, concentration, head_agreement)
+
+    @staticmethod
+    def noise_scale(entropy, baseline_entropy, concentration, head_agreement):
+        """
+        Noise scale factor from attention statistics (scalars or arrays).
+
+        Shared by the single-target update and the multi-target manager,
+        which keeps one entropy baseline per track.
+        """
         # Higher entropy than baseline = less confident = higher noise estimate
         entropy_ratio = entropy / (baseline_entropy + 1e-10)
 
@@ -1670,14 +1777,25 @@ class CognitiveGeometricTracker:
 
         return noise_scale
 
-    def update(self, measurement: np.ndarray) -> Tuple[np.ndarray, Dict]:
-        """Process measurement with cognitive-adaptive Kalman filtering"""
+    def _attention_input(self, measurements: np.ndarray) -> np.ndarray:
+        """(B, 3) positions -> (B, 4) normalized ViT observations"""
+        m_4d = np.hstack([measurements / 50000, np.full((len(measurements), 1), 0.5)])
+        return m_4d / (np.linalg.norm(m_4d, axis=1, keepdims=True) + 1e-10)
+
+    def update(self, measurement: np.ndarray,
+               attention_diag: Optional[Dict] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Process measurement with cognitive-adaptive Kalman filtering.
+
+        attention_diag may be supplied when the ViT analysis was already run
+        for this measurement (track() does one forward_batch for all of them).
+        """
         self.total_samples += 1
 
         # Run ViT attention analysis on measurement
-        m_4d = np.array([measurement[0]/50000, measurement[1]/50000, measurement[2]/50000, 0.5])
-        m_4d = m_4d / (np.linalg.norm(m_4d) + 1e-10)
-        _, attention_diag = self.vit.forward(m_4d)
+        if attention_diag is None:
+            m_4d = self._attention_input(np.asarray(measurement)[np.newaxis])[0]
+            _, attention_diag = self.vit.forward(m_4d)
 
         # Estimate noise scale from attention
         noise_scale = self._estimate_noise_from_attention(attention_diag)
@@ -1690,16 +1808,9 @@ class CognitiveGeometricTracker:
             self.initialized = True
             return measurement.copy(), {'noise_scale': noise_scale, 'attention': attention_diag}
 
-        # Predict
-        self.x = self.F @ self.x
-        self.P = self.F @ self.P @ self.F.T + self.Q
-
-        # Update with adaptive R
-        y = measurement - self.H @ self.x
-        S = self.H @ self.P @ self.H.T + R
-        K = self.P @ self.H.T @ np.linalg.inv(S)
-        self.x = self.x + K @ y
-        self.P = (np.eye(6) - K @ self.H) @ self.P
+        # Predict, then update with adaptive R
+        self.kernel.predict(self.F, self.Q, self.x, self.P)
+        K, _ = self.kernel.update(self.H, R, self.x, self.P, measurement)
 
         diagnostics = {
             'noise_scale': noise_scale,
@@ -1709,15 +1820,35 @@ class CognitiveGeometricTracker:
 
         return self.x[0:3].copy(), diagnostics
 
+    def _process_block(self, block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(n, 3) measurements -> (n, 3) estimates and (n,) noise scales"""
+        estimates = np.empty((len(block), 3))
+        noise_scales = np.empty(len(block))
+
+        # Attention depends only on the measurements: analyze the block at once
+        _, _, batch_diag = self.vit.forward_batch(self._attention_input(block))
+
+        for k, m in enumerate(block):
+            attention_diag = {
+                'attention_entropy': float(batch_diag['attention_entropy'][k]),
+                'dominant_vertex': int(batch_diag['dominant_vertex'][k]),
+                'attention_concentration': float(batch_diag['attention_concentration'][k]),
+                'head_agreement': float(batch_diag['head_agreement'][k])
+            }
+            estimates[k], diag = self.update(m, attention_diag)
+            noise_scales[k] = diag['noise_scale']
+
+        return estimates, noise_scales
+
+    def _estimate(self, z: np.ndarray) -> np.ndarray:
+        return self.update(z)[0]
+
+    def _estimate_block(self, block: np.ndarray) -> np.ndarray:
+        return self._process_block(block)[0]
+
     def track(self, measurements: List[np.ndarray]) -> Tuple[List[np.ndarray], Dict]:
         """Track sequence with cognitive geometric processing"""
-        estimates = []
-        noise_scales = []
-
-        for m in measurements:
-            est, diag = self.update(m)
-            estimates.append(est)
-            noise_scales.append(diag['noise_scale'])
+        estimates, noise_scales = self._process_block(np.asarray(measurements, dtype=np.float64))
 
         # Get attention analysis
         attention_analysis = self.vit.analyze_attention_patterns()
@@ -1729,7 +1860,7 @@ class CognitiveGeometricTracker:
             'attention_analysis': attention_analysis
         }
 
-        return estimates, stats
+        return list(estimates), stats
 
 
 # =============================================================================
@@ -1810,58 +1941,62 @@ def hash_to_rotation(hash_string: str) -> Rotation4D:
 # =============================================================================
 
 def generate_hgv_trajectory(duration: float = 30.0, dt: float = 0.1,
-                            mach: float = 8.0, max_g: float = 15.0):
-    """Generate hypersonic vehicle trajectory with maneuver"""
+                            mach: float = 8.0, max_g=15.0) -> np.ndarray:
+    """
+    Generate hypersonic vehicle trajectory with maneuver.
+
+    Returns (N, 3) positions, each recorded after its integration step.
+    max_g may be an array of B peak loads, giving (B, N, 3).
+    """
     speed = mach * 343.0  # m/s
     g = 9.81
 
     n_steps = int(duration / dt)
-    positions = []
-
-    pos = np.array([0.0, 0.0, 30000.0])
-    vel = np.array([speed, 0.0, 0.0])
-
-    for i in range(n_steps):
-        t = i * dt
+    t = np.arange(n_steps) * dt
 
-        # Maneuver phase: 30% to 70% of trajectory
-        if 0.3 * duration < t < 0.7 * duration:
-            progress = (t - 0.3 * duration) / (0.4 * duration)
-            envelope = np.sin(np.pi * progress)
-
-            g_load = max_g * envelope
-            accel = np.array([0, g_load * g * 0.8, -g_load * g * 0.2])
-        else:
-            accel = np.array([0, 0, 0])
+    # Maneuver phase: 30% to 70% of trajectory
+    maneuver = (0.3 * duration < t) & (t < 0.7 * duration)
+    progress = (t - 0.3 * duration) / (0.4 * duration)
+    envelope = np.where(maneuver, np.sin(np.pi * progress), 0.0)
 
-        vel = vel + accel * dt
-        pos = pos + vel * dt
-        positions.append(pos.copy())
+    g_load = np.asarray(max_g, dtype=np.float64)[..., np.newaxis] * envelope
+    accel = np.zeros(g_load.shape + (3,))
+    accel[..., 1] = g_load * g * 0.8
+    accel[..., 2] = -g_load * g * 0.2
 
+    positions, _ = integrate([0.0, 0.0, 30000.0], [speed, 0.0, 0.0], accel, dt,
+                             record='after')
     return positions
 
 
-def add_plasma_noise(positions: List[np.ndarray],
+def add_plasma_noise(positions: np.ndarray,
                      base_std: float = 600.0,
-                     plasma_factor: float = 5.0) -> List[np.ndarray]:
-    """Add heteroscedastic plasma noise"""
-    noisy = []
-    n = len(positions)
-
-    for i, pos in enumerate(positions):
-        t_frac = i / n
-
-        # Noise increases during maneuver (30-70%)
-        if 0.3 < t_frac < 0.7:
-            progress = (t_frac - 0.3) / 0.4
-            noise_scale = base_std * (1 + (plasma_factor - 1) * np.sin(np.pi * progress))
-        else:
-            noise_scale = base_std
+                     plasma_factor: float = 5.0,
+                     rng: Optional[np.random.Generator] = None,
+                     batch: Optional[int] = None) -> np.ndarray:
+    """
+    Add heteroscedastic plasma noise to (..., N, 3) positions.
+
+    batch=B draws B independent noise realizations of the same
+    trajectory, giving (B, ..., N, 3). Without an rng each call draws from
+    a fresh, unseeded Generator (new noise every call); pass a seeded one,
+    as run_comprehensive_benchmark() does, to reproduce a run.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    positions = np.asarray(positions, dtype=np.float64)
+    n = positions.shape[-2]
+    t_frac = np.arange(n) / n
 
-        noise = np.random.randn(3) * noise_scale
-        noisy.append(pos + noise)
+    # Noise increases during maneuver (30-70%)
+    maneuver = (0.3 < t_frac) & (t_frac < 0.7)
+    progress = (t_frac - 0.3) / 0.4
+    noise_scale = base_std * np.where(
+        maneuver, 1 + (plasma_factor - 1) * np.sin(np.pi * progress), 1.0)
 
-    return noisy
+    shape = positions.shape if batch is None else (batch,) + positions.shape
+    noise = rng.standard_normal(shape) * noise_scale[:, np.newaxis]
+    return positions + noise
 
 
 def compute_rms(true: List[np.ndarray], est: List[np.ndarray]) -> float:
@@ -1870,10 +2005,15 @@ def compute_rms(true: List[np.ndarray], est: List[np.ndarray]) -> float:
     return np.sqrt(np.mean(errors))
 
 
-class KalmanFilter:
-    """Standard Kalman filter for comparison"""
+class KalmanFilter(StreamingTracker):
+    """
+    Standard Kalman filter for comparison
+
+    steady_state=True switches to the cached constant-gain update once
+    the gain has converged.
+    """
 
-    def __init__(self, dt: float = 0.1):
+    def __init__(self, dt: float = 0.1, steady_state: bool = False):
         self.dt = dt
         self.x = np.zeros(6)  # [x, y, z, vx, vy, vz]
 
@@ -1906,30 +2046,30 @@ class KalmanFilter:
         self.P = np.eye(6) * 10000
 
         self.initialized = False
+        self.steady = SteadyStateMonitor(self.F, self.H, self.Q, self.R) if steady_state else None
+        self.kernel = KalmanKernel(6, 3)
 
-    def track(self, measurements: List[np.ndarray]) -> Tuple[List[np.ndarray], Dict]:
-        estimates = []
+    def update(self, z: np.ndarray) -> np.ndarray:
+        """Process one position measurement; returns the position estimate"""
+        if not self.initialized:
+            self.x[0:3] = z
+            self.initialized = True
+            return z.copy()
 
-        for z in measurements:
-            if not self.initialized:
-                self.x[0:3] = z
-                self.initialized = True
-                estimates.append(z.copy())
-                continue
+        if self.steady is not None and self.steady.converged:
+            self.x, _ = self.steady.step(self.F, self.H, self.x, z)
+            return self.x[0:3].copy()
 
-            # Predict
-            self.x = self.F @ self.x
-            self.P = self.F @ self.P @ self.F.T + self.Q
+        self.kernel.predict(self.F, self.Q, self.x, self.P)
+        K, _ = self.kernel.update(self.H, self.R, self.x, self.P, z)
 
-            # Update
-            y = z - self.H @ self.x
-            S = self.H @ self.P @ self.H.T + self.R
-            K = self.P @ self.H.T @ np.linalg.inv(S)
-            self.x = self.x + K @ y
-            self.P = (np.eye(6) - K @ self.H) @ self.P
+        if self.steady is not None and self.steady.check(K):
+            self.P[:] = self.steady.solution.P_post
 
-            estimates.append(self.x[0:3].copy())
+        return self.x[0:3].copy()
 
+    def track(self, measurements: List[np.ndarray]) -> Tuple[List[np.ndarray], Dict]:
+        estimates = [self.update(z) for z in measurements]
         return estimates, {'type': 'kalman'}
 
 
@@ -1944,7 +2084,7 @@ def run_comprehensive_benchmark():
     # Generate trajectory
     print("[1/6] Generating HGV trajectory...")
     true_positions = generate_hgv_trajectory()
-    noisy_positions = add_plasma_noise(true_positions)
+    noisy_positions = add_plasma_noise(true_positions, rng=np.random.default_rng(42))
     raw_rms = compute_rms(true_positions, noisy_positions)
     print(f"      Samples: {len(true_positions)}")
     print(f"      Raw noise RMS: {raw_rms:.0f} m")
@@ -1971,7 +2111,9 @@ def run_comprehensive_benchmark():
     for lat in lattices:
         vertices = lat.get_vertices()
         min_dist = lat.minimum_distance()
-        print(f"      {lat.get_name():30s}: {len(vertices):4d} vertices, "
+        graph = lat.get_graph()
+        edges = f"{graph.n_edges:4d} edges" if graph is not None else " irregular"
+        print(f"      {lat.get_name():30s}: {len(vertices):4d} vertices, {edges}, "
               f"min_dist={min_dist:.4f}, symmetry={lat.get_symmetry_order():,}")
     print()
 
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Exact Pairwise-Distance Spectrum
+================================
+
+d_min of a constellation used to come from double Python loops over the
+first 50 or 100 points only, which is wrong whenever the closest pair
+lies further in, and the union bound assumed 12 nearest neighbours for
+every lattice. distance_spectrum() looks at every pair once:
+
+    spec = distance_spectrum(points)
+    spec.d_min              # exact minimum distance between distinct points
+    spec.kissing_number     # most neighbours any point has at d_min
+    spec.as_dict()          # {distance: number of pairs at that distance}
+
+Squared distances come from row blocks of the Gram matrix,
+|x|² + |y|² - 2 x·y, so memory stays O(block · N) for large sets. Equal
+distances are grouped on a grid of rtol times the point-set radius; the
+pairs in the closest shell are then re-measured directly as |x - y|, so
+d_min carries no Gram cancellation error.
+
+Results are cached per point set (keyed by the array bytes), so every
+lattice or constellation computes its spectrum once.
+"""
+
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterator, Tuple
+
+DEFAULT_BLOCK_SIZE = 1024
+
+
+@dataclass
+class DistanceSpectrum:
+    """Pairwise-distance summary of a point set"""
+    n_points: int
+    d_min: float                   # Smallest distance between distinct points
+    kissing_number: int            # Most neighbours of any point at d_min
+    neighbor_counts: np.ndarray    # (N,) neighbours of each point at d_min
+    distances: np.ndarray          # (S,) distinct distances, ascending
+    multiplicities: np.ndarray     # (S,) unordered pairs at each distance
+    n_duplicates: int              # Pairs closer than the duplicate tolerance
+
+    def as_dict(self) -> Dict[float, int]:
+        """Distance → multiplicity"""
+        return {float(d): int(m) for d, m in zip(self.distances, self.multiplicities)}
+
+    def mean_neighbors(self) -> float:
+        """Average number of nearest neighbours per point"""
+        return float(np.mean(self.neighbor_counts))
+
+    def union_bound(self, noise_std: float) -> float:
+        """
+        Full union bound on SER with per-dimension noise std σ:
+
+            P_s ≤ (1/N) Σ_i Σ_{j≠i} Q(d_ij / 2σ)
+
+        summed shell by shell (each pair counts for both endpoints).
+        """
+        if self.n_points == 0:
+            return 0.0
+        q = [0.5 * math.erfc(d / (2 * noise_std) / math.sqrt(2)) for d in self.distances]
+        return min(1.0, float(np.dot(2 * self.multiplicities, q)) / self.n_points)
+
+
+def _gram_d2(points: np.ndarray, sq: np.ndarray, rows: slice, cols: slice) -> np.ndarray:
+    """Squared distances |x|² + |y|² - 2 x·y between two slices of points"""
+    d2 = sq[rows, np.newaxis] + sq[np.newaxis, cols] - 2.0 * (points[rows] @ points[cols].T)
+    return np.maximum(d2, 0.0)
+
+
+def _upper_blocks(points: np.ndarray, block_size: int) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Yield (start, mask, d²) per row block: d² holds squared distances from
+    rows [start, start + b) to columns [start, N), mask selects j > i.
+    """
+    sq = np.einsum('ij,ij->i', points, points)
+    n = len(points)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        mask = np.arange(n - start)[np.newaxis, :] > np.arange(stop - start)[:, np.newaxis]
+        yield start, mask, _gram_d2(points, sq, slice(start, stop), slice(start, n))
+
+
+def compute_distance_spectrum(points: np.ndarray, rtol: float = 1e-8,
+                              duplicate_tol: float = 1e-10,
+                              block_size: int = DEFAULT_BLOCK_SIZE) -> DistanceSpectrum:
+    """
+    Spectrum of all N(N-1)/2 pairwise distances (uncached).
+
+    Args:
+        points: (N, D) point set
+        rtol: Distances within rtol × (largest point norm) share a shell
+        duplicate_tol: Pairs closer than this are counted as duplicates
+            and excluded from d_min and the spectrum
+        block_size: Rows of the Gram matrix formed at once
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    n = len(points)
+    scale = max(float(np.max(np.linalg.norm(points, axis=1))), 1.0) if n else 1.0
+    grid = rtol * scale
+
+    keys, sums, counts = [], [], []
+    n_duplicates = 0
+    for _, mask, d2 in _upper_blocks(points, block_size):
+        d = np.sqrt(d2[mask])
+        distinct = d[d > duplicate_tol]
+        n_duplicates += len(d) - len(distinct)
+        k, inverse = np.unique(np.round(distinct / grid).astype(np.int64), return_inverse=True)
+        keys.append(k)
+        sums.append(np.bincount(inverse, weights=distinct, minlength=len(k)))
+        counts.append(np.bincount(inverse, minlength=len(k)))
+
+    if not keys or sum(len(k) for k in keys) == 0:
+        return DistanceSpectrum(n, float('inf'), 0, np.zeros(n, dtype=np.int64),
+                                np.empty(0), np.empty(0, dtype=np.int64), n_duplicates)
+
+    # Merge the per-block shells
+    all_keys, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+    multiplicities = np.bincount(inverse, weights=np.concatenate(counts)).astype(np.int64)
+    distances = np.bincount(inverse, weights=np.concatenate(sums)) / multiplicities
+
+    # Second pass over the closest shell: exact distances and neighbour counts
+    k_min = all_keys[0]
+    d_min = float('inf')
+    neighbor_counts = np.zeros(n, dtype=np.int64)
+    for start, mask, d2 in _upper_blocks(points, block_size):
+        d = np.sqrt(d2)
+        shell = mask & (d > duplicate_tol) & (np.round(d / grid).astype(np.int64) == k_min)
+        rows, cols = np.nonzero(shell)
+        if len(rows) == 0:
+            continue
+        i, j = rows + start, cols + start
+        d_min = min(d_min, float(np.min(np.linalg.norm(points[i] - points[j], axis=1))))
+        neighbor_counts += np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+
+    return DistanceSpectrum(
+        n_points=n,
+        d_min=d_min,
+        kissing_number=int(neighbor_counts.max()),
+        neighbor_counts=neighbor_counts,
+        distances=distances,
+        multiplicities=multiplicities,
+        n_duplicates=n_duplicates,
+    )
+
+
+def nearest_neighbor_table(points: np.ndarray, rel_tol: float = 1e-6,
+                           block_size: int = DEFAULT_BLOCK_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Neighbours of every point at its own minimum distance.
+
+    Full rows of the Gram distance matrix are formed one block at a time,
+    so memory stays O(block · N).
+
+    Returns:
+        (neighbors, counts): (N, K) index table padded with -1, and the
+        number of valid entries per row
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    n = len(points)
+    sq = np.einsum('ij,ij->i', points, points)
+
+    rows, cols = [], []
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        d2 = _gram_d2(points, sq, slice(start, stop), slice(0, n))
+        d2[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        # Compare squared distances: d <= d_i (1 + tol) ⇔ d² <= d_i² (1 + tol)²
+        limit = d2.min(axis=1, keepdims=True) * (1 + rel_tol) ** 2
+        r, c = np.nonzero(d2 <= limit)
+        rows.append(r + start)
+        cols.append(c)
+
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int64)
+    counts = np.bincount(rows, minlength=n)
+    neighbors = np.full((n, counts.max() if n else 0), -1)
+    slots = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    neighbors[rows, slots] = cols
+    return neighbors, counts
+
+
+_SPECTRUM_CACHE: Dict[Tuple, DistanceSpectrum] = {}
+_SPECTRUM_CACHE_SIZE = 64
+
+
+def distance_spectrum(points: np.ndarray, rtol: float = 1e-8,
+                      duplicate_tol: float = 1e-10) -> DistanceSpectrum:
+    """Distance spectrum of a point set, computed once per distinct array"""
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    key = (points.shape, points.tobytes(), rtol, duplicate_tol)
+    spectrum = _SPECTRUM_CACHE.get(key)
+    if spectrum is None:
+        spectrum = compute_distance_spectrum(points, rtol, duplicate_tol)
+        if len(_SPECTRUM_CACHE) >= _SPECTRUM_CACHE_SIZE:
+            _SPECTRUM_CACHE.pop(next(iter(_SPECTRUM_CACHE)))
+        _SPECTRUM_CACHE[key] = spectrum
+    return spectrum
@@ -15,10 +15,13 @@ Date: January 2026
 """
 
 import numpy as np
-from itertools import combinations, product
-from collections import defaultdict
 import json
 
+from polytope_geometry import cell600_vertices, cell24_vertices, e8_roots as e8_root_system
+from distance_spectrum import distance_spectrum
+from polytope_graph import PolytopeGraph
+from h4_orbits import H4OrbitEngine
+
 # Golden ratio
 PHI = (1 + np.sqrt(5)) / 2
 PHI_INV = PHI - 1  # = 1/φ = φ - 1
@@ -48,29 +51,7 @@ def generate_e8_roots():
 
     All roots have norm √2.
     """
-    roots = []
-
-    # Type I: 112 roots
-    # Choose 2 positions from 8, assign ±1 to each
-    for i, j in combinations(range(8), 2):
-        for si, sj in product([-1, 1], repeat=2):
-            root = np.zeros(8)
-            root[i] = si
-            root[j] = sj
-            roots.append(root)
-
-    # Type II: 128 roots with even parity
-    for mask in range(256):
-        # Count number of 1-bits (minus signs)
-        parity = bin(mask).count('1')
-        if parity % 2 == 0:  # Even number of minus signs
-            root = np.array([
-                -0.5 if (mask >> i) & 1 else 0.5
-                for i in range(8)
-            ])
-            roots.append(root)
-
-    return np.array(roots)
+    return e8_root_system()
 
 e8_roots = generate_e8_roots()
 
@@ -258,51 +239,7 @@ def generate_600_cell():
 
     Total: 8 + 16 + 96 = 120
     """
-    vertices = []
-
-    phi = PHI
-    psi = PHI_INV  # 1/φ
-
-    # Type 1: 8 vertices - axis permutations of (±1, 0, 0, 0)
-    for i in range(4):
-        for s in [-1, 1]:
-            v = np.zeros(4)
-            v[i] = s
-            vertices.append(v)
-
-    # Type 2: 16 vertices - all (±½, ±½, ±½, ±½)
-    for mask in range(16):
-        v = np.array([
-            0.5 if (mask >> i) & 1 else -0.5
-            for i in range(4)
-        ])
-        vertices.append(v)
-
-    # Type 3: 96 vertices - even permutations of (0, ±ψ/2, ±1/2, ±φ/2)
-    # where ψ = 1/φ
-    base = [0, psi/2, 0.5, phi/2]
-
-    # Generate even permutations (there are 12)
-    even_perms = [
-        [0, 1, 2, 3], [0, 2, 3, 1], [0, 3, 1, 2],
-        [1, 0, 3, 2], [1, 2, 0, 3], [1, 3, 2, 0],
-        [2, 0, 1, 3], [2, 1, 3, 0], [2, 3, 0, 1],
-        [3, 0, 2, 1], [3, 1, 0, 2], [3, 2, 1, 0]
-    ]
-
-    for perm in even_perms:
-        base_perm = [base[p] for p in perm]
-        # Apply all sign combinations to non-zero elements (8 combinations)
-        for signs in product([-1, 1], repeat=3):
-            v = np.array(base_perm, dtype=float)
-            sign_idx = 0
-            for i in range(4):
-                if v[i] != 0:
-                    v[i] *= signs[sign_idx]
-                    sign_idx += 1
-            vertices.append(v)
-
-    return np.array(vertices)
+    return cell600_vertices()
 
 cell_600 = generate_600_cell()
 
@@ -315,26 +252,13 @@ print(f"\nVertex norms: min={norms_600.min():.6f}, max={norms_600.max():.6f}")
 print(f"Expected: 1.0 (unit sphere S³)")
 
 # Remove duplicates and verify count
-unique_verts = []
-for v in cell_600:
-    is_dup = False
-    for u in unique_verts:
-        if np.allclose(v, u, atol=1e-10):
-            is_dup = True
-            break
-    if not is_dup:
-        unique_verts.append(v)
+_, first = np.unique(np.round(cell_600, 10), axis=0, return_index=True)
+unique_verts = cell_600[np.sort(first)]
 
 print(f"\nUnique vertices: {len(unique_verts)}")
 
-# Verify edge length (should be 1/φ ≈ 0.618)
-min_dist = float('inf')
-for i, v1 in enumerate(unique_verts[:20]):  # Sample
-    for j, v2 in enumerate(unique_verts[:20]):
-        if i < j:
-            d = np.linalg.norm(v1 - v2)
-            if d < min_dist and d > 0.1:
-                min_dist = d
+# Verify edge length (should be 1/φ ≈ 0.618), exact over all pairs
+min_dist = distance_spectrum(unique_verts).d_min
 
 print(f"\nMinimum edge length: {min_dist:.6f}")
 print(f"Expected: 1/φ = {PHI_INV:.6f}")
@@ -357,29 +281,12 @@ def generate_24_cell():
 
     Total: 8 + 16 = 24
     """
-    vertices = []
-
-    # Type 1: 8 vertices
-    for i in range(4):
-        for s in [-1, 1]:
-            v = np.zeros(4)
-            v[i] = s
-            vertices.append(v)
-
-    # Type 2: 16 vertices
-    for mask in range(16):
-        v = np.array([
-            0.5 if (mask >> i) & 1 else -0.5
-            for i in range(4)
-        ])
-        vertices.append(v)
-
-    return np.array(vertices)
+    return cell24_vertices('hurwitz')
 
 cell_24 = generate_24_cell()
 print(f"\n24-cell vertices: {len(cell_24)}")
 
-def find_inscribed_24_cells(cell_600_verts):
+def find_inscribed_24_cells(engine):
     """
     Find all 25 inscribed 24-cells in the 600-cell.
 
@@ -389,103 +296,28 @@ def find_inscribed_24_cells(cell_600_verts):
     - There are exactly 10 such partitions (5 rows + 5 columns)
     - Non-disjoint 24-cells share exactly 6 vertices
 
-    We find them by:
+    We find them as an orbit:
     1. Start with the "standard" 24-cell (vertices that are Hurwitz quaternions)
-    2. Apply H4 symmetry operations to generate all 25
-    """
-
-    # The standard 24-cell is already contained in the 600-cell
-    # Its vertices are the 24 Hurwitz units
-
-    # Convert to set of tuples for comparison
-    cell_600_set = set(tuple(np.round(v, 10)) for v in cell_600_verts)
-
-    inscribed_24_cells = []
+    2. Apply all 7200 H4 rotations, as vertex permutations of the 600-cell
+       quaternion multiplication table, and keep the distinct images
 
-    # Method: Use golden ratio rotations to find all 24-cells
-    # The 600-cell has 120/24 = 5 disjoint 24-cells in each partition
-    # And there are 5 different ways to partition, giving 25 total (but not all disjoint)
-
-    # Generate rotations that preserve the 600-cell
-    phi = PHI
-    psi = PHI_INV
-
-    # Key rotation angles in H4 related to golden ratio
-    angles = [0, 2*np.pi/5, 4*np.pi/5, 6*np.pi/5, 8*np.pi/5]
-
-    # Generate 24-cells by rotating the standard one
-    standard_24 = generate_24_cell()
-
-    for k, angle in enumerate(angles):
-        # 4D rotation in the xw plane
-        c, s = np.cos(angle), np.sin(angle)
-        R1 = np.array([
-            [c, 0, 0, -s],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [s, 0, 0, c]
-        ])
-
-        # Apply rotation
-        rotated = standard_24 @ R1.T
-        inscribed_24_cells.append(rotated)
-
-    # Generate more 24-cells using different rotation planes
-    for k, angle in enumerate(angles):
-        if angle == 0:
-            continue
-        c, s = np.cos(angle), np.sin(angle)
-        R2 = np.array([
-            [c, -s, 0, 0],
-            [s, c, 0, 0],
-            [0, 0, c, -s],
-            [0, 0, s, c]
-        ])
-        rotated = standard_24 @ R2.T
-        inscribed_24_cells.append(rotated)
-
-    # Continue with more rotation combinations to get all 25
-    for k1, a1 in enumerate(angles[:3]):
-        for k2, a2 in enumerate(angles[:3]):
-            if k1 == 0 and k2 == 0:
-                continue
-            c1, s1 = np.cos(a1), np.sin(a1)
-            c2, s2 = np.cos(a2), np.sin(a2)
-            R = np.array([
-                [c1, -s1, 0, 0],
-                [s1, c1, 0, 0],
-                [0, 0, c2, -s2],
-                [0, 0, s2, c2]
-            ])
-            rotated = standard_24 @ R.T
-
-            # Check if this is a new 24-cell (not duplicate)
-            is_new = True
-            rotated_set = set(tuple(np.round(v, 6)) for v in rotated)
-            for existing in inscribed_24_cells:
-                existing_set = set(tuple(np.round(v, 6)) for v in existing)
-                if len(rotated_set & existing_set) > 20:  # Same 24-cell
-                    is_new = False
-                    break
-
-            if is_new and len(inscribed_24_cells) < 25:
-                inscribed_24_cells.append(rotated)
-
-    return inscribed_24_cells
+    Returns the (25, 24) vertex indices into engine.vertices.
+    """
+    return engine.inscribed_24_cells()
 
 print("\nFinding inscribed 24-cells...")
-inscribed = find_inscribed_24_cells(np.array(unique_verts))
+h4_engine = H4OrbitEngine(np.array(unique_verts))
+inscribed_idx = find_inscribed_24_cells(h4_engine)
+inscribed = h4_engine.vertices[inscribed_idx]
+partitions = h4_engine.partitions(inscribed_idx)
 print(f"Found {len(inscribed)} inscribed 24-cells")
+print(f"  H4 rotations: {h4_engine.order}, stabilizer of each 24-cell: "
+      f"{len(h4_engine.stabilizer(inscribed_idx[0]))}")
+print(f"  Partitions into 5 disjoint 24-cells: {len(partitions)}")
 
 # Analyze overlaps
 print("\nAnalyzing 24-cell overlaps...")
-overlap_counts = defaultdict(int)
-for i in range(len(inscribed)):
-    for j in range(i+1, len(inscribed)):
-        set_i = set(tuple(np.round(v, 6)) for v in inscribed[i])
-        set_j = set(tuple(np.round(v, 6)) for v in inscribed[j])
-        overlap = len(set_i & set_j)
-        overlap_counts[overlap] += 1
+overlap_counts = h4_engine.overlaps(inscribed_idx)
 
 print("Overlap distribution:")
 for overlap, count in sorted(overlap_counts.items()):
@@ -548,13 +380,8 @@ def verify_16_cell(vertices, name):
 
     # Check edge structure: each vertex connects to 6 others
     # In a 16-cell, edges connect vertices at distance √2 × radius
-    edge_count = 0
-    expected_edge_len = np.sqrt(2) * norms[0]
-    for i in range(len(vertices)):
-        for j in range(i+1, len(vertices)):
-            d = np.linalg.norm(vertices[i] - vertices[j])
-            if np.isclose(d, expected_edge_len, atol=0.1):
-                edge_count += 1
+    graph = PolytopeGraph(vertices, np.sqrt(2) * norms[0], atol=0.1)
+    edge_count = graph.n_edges
 
     # 16-cell has 24 edges
     return edge_count == 24, f"{name}: {edge_count} edges (expected 24)"
@@ -781,6 +608,12 @@ results = {
         "expected": 24,
         "status": "PASS" if len(cell_24) == 24 else "FAIL"
     },
+    "inscribed_24_cells": {
+        "count": len(inscribed),
+        "partitions": len(partitions),
+        "expected": 25,
+        "status": "PASS" if len(inscribed) == 25 and len(partitions) == 10 else "FAIL"
+    },
     "trinity_decomposition": {
         "alpha": len(alpha),
         "beta": len(beta),
@@ -801,6 +634,7 @@ print("-" * 60)
 print(f"E8 Root Lattice              {results['e8_roots']['count']:>6}    {results['e8_roots']['expected']:>6}     {results['e8_roots']['status']}")
 print(f"600-Cell Vertices            {results['600_cell']['count']:>6}    {results['600_cell']['expected']:>6}     {results['600_cell']['status']}")
 print(f"24-Cell Vertices             {results['24_cell']['count']:>6}    {results['24_cell']['expected']:>6}     {results['24_cell']['status']}")
+print(f"Inscribed 24-Cells           {results['inscribed_24_cells']['count']:>6}    {results['inscribed_24_cells']['expected']:>6}     {results['inscribed_24_cells']['status']}")
 print(f"Trinity Decomposition        {results['trinity_decomposition']['total']:>6}    {results['trinity_decomposition']['expected']:>6}     {results['trinity_decomposition']['status']}")
 print(f"Phillips Synthesis Triads    {results['phillips_synthesis']['valid_triads']:>6}     > 0      {results['phillips_synthesis']['status']}")
 print("-" * 60)
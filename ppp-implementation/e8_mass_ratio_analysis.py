@@ -17,6 +17,8 @@ import numpy as np
 from typing import Dict, List, Tuple
 import json
 
+from polytope_geometry import cell600_vertices, e8_roots, moxness_matrix
+
 # Golden ratio
 PHI = (1 + np.sqrt(5)) / 2  # ≈ 1.618033988749895
 
@@ -69,40 +71,12 @@ FUNDAMENTAL_RATIOS = {
 
 def create_moxness_matrix() -> np.ndarray:
     """Corrected orthogonal Moxness matrix (det=1, rank=8)."""
-    matrix = np.array([
-        [ 0.2628656, -0.2628656, -0.2628656,  0.2628656,  0.6424204, -0.5330869, -0.1217464,  0.1090828],
-        [ 0.2628656, -0.2628656,  0.2628656, -0.2628656,  0.3841082,  0.4628869, -0.4013878, -0.4479857],
-        [ 0.2628656,  0.2628656, -0.2628656, -0.2628656,  0.3841082,  0.4628869,  0.4013878,  0.4479857],
-        [ 0.2628656,  0.2628656,  0.2628656,  0.2628656,  0.1257960, -0.1043868,  0.6217397, -0.5570685],
-        [ 0.4253254, -0.4253254, -0.4253254,  0.4253254, -0.3970376,  0.3294658,  0.0752434, -0.0674169],
-        [ 0.4253254, -0.4253254,  0.4253254, -0.4253254, -0.2373919, -0.2860798,  0.2480713,  0.2768704],
-        [ 0.4253254,  0.4253254, -0.4253254, -0.4253254, -0.2373919, -0.2860798, -0.2480713, -0.2768704],
-        [ 0.4253254,  0.4253254,  0.4253254,  0.4253254, -0.0777462,  0.0645146, -0.3842563,  0.3442873],
-    ])
-    return matrix
+    return moxness_matrix('orthogonal')
 
 
 def generate_e8_roots() -> np.ndarray:
     """Generate all 240 roots of the E8 lattice."""
-    roots = []
-
-    # Type 1: All permutations of (±1, ±1, 0, 0, 0, 0, 0, 0) - 112 roots
-    for i in range(8):
-        for j in range(i+1, 8):
-            for si in [-1, 1]:
-                for sj in [-1, 1]:
-                    root = np.zeros(8)
-                    root[i] = si
-                    root[j] = sj
-                    roots.append(root)
-
-    # Type 2: (±1/2, ±1/2, ..., ±1/2) with even number of minus signs - 128 roots
-    for bits in range(256):
-        signs = [1 if (bits >> i) & 1 else -1 for i in range(8)]
-        if signs.count(-1) % 2 == 0:
-            roots.append(np.array(signs) * 0.5)
-
-    return np.array(roots)
+    return e8_roots()
 
 
 def fold_e8_to_h4(roots: np.ndarray, moxness: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -132,38 +106,7 @@ def generate_phi_cascade(n_levels: int = 12) -> np.ndarray:
 
 def generate_600_cell_vertices() -> np.ndarray:
     """Generate all 120 vertices of the 600-cell."""
-    vertices = []
-
-    # 8 vertices: (±1, 0, 0, 0) permutations
-    for i in range(4):
-        for s in [-1, 1]:
-            v = np.zeros(4)
-            v[i] = s
-            vertices.append(v)
-
-    # 16 vertices: (±1/2, ±1/2, ±1/2, ±1/2)
-    for signs in range(16):
-        v = np.array([(1 if (signs >> i) & 1 else -1) * 0.5 for i in range(4)])
-        vertices.append(v)
-
-    # 96 vertices: even permutations of (±φ/2, ±1/2, ±1/(2φ), 0)
-    a, b, c = PHI/2, 0.5, 1/(2*PHI)
-    base_perms = [
-        [a, b, c, 0], [a, c, 0, b], [a, 0, b, c],
-        [b, a, 0, c], [b, c, a, 0], [b, 0, c, a],
-        [c, a, b, 0], [c, b, 0, a], [c, 0, a, b],
-        [0, a, c, b], [0, b, a, c], [0, c, b, a],
-    ]
-
-    for perm in base_perms:
-        for s0 in [-1, 1]:
-            for s1 in [-1, 1]:
-                for s2 in [-1, 1]:
-                    if perm[3] == 0:
-                        v = np.array([s0*perm[0], s1*perm[1], s2*perm[2], 0])
-                        vertices.append(v)
-
-    return np.unique(np.round(np.array(vertices), 10), axis=0)
+    return cell600_vertices()
 
 
 # =============================================================================
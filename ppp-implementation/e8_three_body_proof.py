@@ -27,6 +27,9 @@ from typing import List, Tuple, Dict
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+from polytope_geometry import (cell600_vertices, cell24_vertices, cell16_vertices,
+                               tesseract_vertices, e8_roots, moxness_matrix)
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -47,31 +50,9 @@ def generate_e8_roots() -> np.ndarray:
     - 112 roots: permutations of (±1, ±1, 0, 0, 0, 0, 0, 0)
     - 128 roots: (±½)^8 with even number of minus signs
 
-    Returns: (240, 8) array of E8 root vectors
+    Returns: (240, 8) array of E8 root vectors (shared, read-only)
     """
-    roots = []
-
-    # Type 1: 112 roots from (±1, ±1, 0, 0, 0, 0, 0, 0) permutations
-    for i in range(8):
-        for j in range(i + 1, 8):
-            for si in [-1, 1]:
-                for sj in [-1, 1]:
-                    root = np.zeros(8)
-                    root[i] = si
-                    root[j] = sj
-                    roots.append(root)
-
-    # Type 2: 128 roots from (±½)^8 with even parity
-    for mask in range(256):
-        popcount = bin(mask).count('1')
-        if popcount % 2 == 0:  # Even number of minus signs
-            root = np.array([
-                -0.5 if (mask & (1 << i)) else 0.5
-                for i in range(8)
-            ])
-            roots.append(root)
-
-    return np.array(roots)
+    return e8_roots()
 
 # =============================================================================
 # MOXNESS 8×8 FOLDING MATRIX
@@ -86,26 +67,12 @@ def create_moxness_matrix() -> np.ndarray:
     - Palindromic characteristic polynomial
     - Projects E8 to four chiral H4 600-cells
 
-    Returns: (8, 8) rotation matrix
+    Rows are built from a = ½, b = 1/(2φ), c = φ/2: the first four give
+    the left-handed H4 projection, the last four the φ-scaled right one.
+
+    Returns: (8, 8) rotation matrix (shared, read-only)
     """
-    a = 0.5
-    b = 0.5 * PHI_INV
-    c = 0.5 * PHI
-
-    matrix = np.array([
-        # First 4 rows: Left-handed H4 projection
-        [a,  a,  a,  a,  b,  b, -b, -b],
-        [a,  a, -a, -a,  b, -b,  b, -b],
-        [a, -a,  a, -a,  b, -b, -b,  b],
-        [a, -a, -a,  a,  b,  b, -b, -b],
-        # Last 4 rows: Right-handed H4 projection (φ-scaled)
-        [c,  c,  c,  c, -a, -a,  a,  a],
-        [c,  c, -c, -c, -a,  a, -a,  a],
-        [c, -c,  c, -c, -a,  a,  a, -a],
-        [c, -c, -c,  c, -a, -a,  a,  a]
-    ])
-
-    return matrix
+    return moxness_matrix('golden')
 
 def fold_e8_to_h4(e8_roots: np.ndarray, moxness: np.ndarray) -> Dict:
     """
@@ -160,53 +127,9 @@ def generate_600cell_vertices() -> np.ndarray:
     - 16 half-coordinates: (±½, ±½, ±½, ±½)
     - 96 golden ratio: even permutations of (0, ±1/φ, ±1, ±φ)/2
 
-    Returns: (120, 4) array of vertices on S³
+    Returns: (120, 4) array of vertices on S³ (shared, read-only)
     """
-    vertices = []
-
-    # Type A: 8 vertices (±1, 0, 0, 0)
-    for axis in range(4):
-        for sign in [-1, 1]:
-            v = np.zeros(4)
-            v[axis] = sign
-            vertices.append(v)
-
-    # Type B: 16 vertices (±½, ±½, ±½, ±½)
-    for mask in range(16):
-        v = np.array([
-            0.5 if (mask & (1 << i)) else -0.5
-            for i in range(4)
-        ])
-        vertices.append(v)
-
-    # Type C: 96 vertices from golden ratio
-    base = [0, PHI_INV/2, 0.5, PHI/2]
-    even_perms = [
-        [0,1,2,3], [0,2,3,1], [0,3,1,2], [1,0,3,2], [1,2,0,3], [1,3,2,0],
-        [2,0,1,3], [2,1,3,0], [2,3,0,1], [3,0,2,1], [3,1,0,2], [3,2,1,0]
-    ]
-
-    for perm in even_perms:
-        permuted = [base[p] for p in perm]
-        for sign_mask in range(16):
-            v = np.zeros(4)
-            valid = True
-            for i in range(4):
-                if permuted[i] == 0:
-                    v[i] = 0
-                    if sign_mask & (1 << i):
-                        valid = False
-                        break
-                else:
-                    v[i] = permuted[i] * ((-1) if (sign_mask & (1 << i)) else 1)
-
-            if valid:
-                # Check for duplicates
-                is_dup = any(np.allclose(v, existing, atol=1e-6) for existing in vertices)
-                if not is_dup:
-                    vertices.append(v)
-
-    return np.array(vertices)
+    return cell600_vertices()
 
 def decompose_600cell_to_24cells(vertices: np.ndarray) -> List[np.ndarray]:
     """
@@ -238,37 +161,15 @@ def generate_24cell_vertices() -> np.ndarray:
 
     Permutations of (±1, ±1, 0, 0).
     """
-    vertices = []
-    for i in range(4):
-        for j in range(i + 1, 4):
-            for si in [-1, 1]:
-                for sj in [-1, 1]:
-                    v = np.zeros(4)
-                    v[i] = si
-                    v[j] = sj
-                    vertices.append(v)
-    return np.array(vertices)
+    return cell24_vertices('d4')
 
 def generate_16cell_vertices() -> np.ndarray:
     """Generate 8 vertices of 16-cell (cross-polytope)."""
-    vertices = []
-    for axis in range(4):
-        for sign in [-1, 1]:
-            v = np.zeros(4)
-            v[axis] = sign
-            vertices.append(v)
-    return np.array(vertices)
+    return cell16_vertices()
 
 def generate_tesseract_vertices() -> np.ndarray:
     """Generate 16 vertices of tesseract (8-cell)."""
-    vertices = []
-    for mask in range(16):
-        v = np.array([
-            0.5 if (mask & (1 << i)) else -0.5
-            for i in range(4)
-        ])
-        vertices.append(v)
-    return np.array(vertices)
+    return tesseract_vertices()
 
 # Standard Model particle data
 GLUONS = [
@@ -20,6 +20,8 @@ from dataclasses import dataclass
 from typing import List, Tuple, Dict
 import matplotlib.pyplot as plt
 
+from polytope_geometry import cell600_vertices, cell24_vertices, e8_roots, moxness_matrix
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -47,19 +49,7 @@ def create_moxness_matrix_corrected() -> np.ndarray:
     - rank(U) = 8 (full rank)
     - U @ U.T = I (orthogonal)
     """
-    # SVD-corrected orthogonal matrix preserving golden structure
-    matrix = np.array([
-        [ 0.2628656, -0.2628656, -0.2628656,  0.2628656,  0.6424204, -0.5330869, -0.1217464,  0.1090828],
-        [ 0.2628656, -0.2628656,  0.2628656, -0.2628656,  0.3841082,  0.4628869, -0.4013878, -0.4479857],
-        [ 0.2628656,  0.2628656, -0.2628656, -0.2628656,  0.3841082,  0.4628869,  0.4013878,  0.4479857],
-        [ 0.2628656,  0.2628656,  0.2628656,  0.2628656,  0.1257960, -0.1043868,  0.6217397, -0.5570685],
-        [ 0.4253254, -0.4253254, -0.4253254,  0.4253254, -0.3970376,  0.3294658,  0.0752434, -0.0674169],
-        [ 0.4253254, -0.4253254,  0.4253254, -0.4253254, -0.2373919, -0.2860798,  0.2480713,  0.2768704],
-        [ 0.4253254,  0.4253254, -0.4253254, -0.4253254, -0.2373919, -0.2860798, -0.2480713, -0.2768704],
-        [ 0.4253254,  0.4253254,  0.4253254,  0.4253254, -0.0777462,  0.0645146, -0.3842563,  0.3442873],
-    ])
-
-    return matrix
+    return moxness_matrix('orthogonal')
 
 # =============================================================================
 # E8 ROOT LATTICE
@@ -67,25 +57,7 @@ def create_moxness_matrix_corrected() -> np.ndarray:
 
 def generate_e8_roots() -> np.ndarray:
     """Generate all 240 roots of E8."""
-    roots = []
-
-    # Type 1: 112 roots
-    for i in range(8):
-        for j in range(i + 1, 8):
-            for si in [-1, 1]:
-                for sj in [-1, 1]:
-                    root = np.zeros(8)
-                    root[i] = si
-                    root[j] = sj
-                    roots.append(root)
-
-    # Type 2: 128 roots
-    for mask in range(256):
-        if bin(mask).count('1') % 2 == 0:
-            root = np.array([-0.5 if (mask & (1 << i)) else 0.5 for i in range(8)])
-            roots.append(root)
-
-    return np.array(roots)
+    return e8_roots()
 
 # =============================================================================
 # 600-CELL (CORRECTED GEOMETRIC DECOMPOSITION)
@@ -93,45 +65,7 @@ def generate_e8_roots() -> np.ndarray:
 
 def generate_600cell_vertices() -> np.ndarray:
     """Generate 120 vertices of the 600-cell."""
-    vertices = []
-
-    # Type A: 8 axis vertices (±1, 0, 0, 0)
-    for axis in range(4):
-        for sign in [-1, 1]:
-            v = np.zeros(4)
-            v[axis] = sign
-            vertices.append(v)
-
-    # Type B: 16 vertices (±½, ±½, ±½, ±½)
-    for mask in range(16):
-        v = np.array([0.5 if (mask & (1 << i)) else -0.5 for i in range(4)])
-        vertices.append(v)
-
-    # Type C: 96 golden ratio vertices
-    base = [0, PHI_INV/2, 0.5, PHI/2]
-    even_perms = [
-        [0,1,2,3], [0,2,3,1], [0,3,1,2], [1,0,3,2], [1,2,0,3], [1,3,2,0],
-        [2,0,1,3], [2,1,3,0], [2,3,0,1], [3,0,2,1], [3,1,0,2], [3,2,1,0]
-    ]
-
-    for perm in even_perms:
-        permuted = [base[p] for p in perm]
-        for sign_mask in range(16):
-            v = np.zeros(4)
-            valid = True
-            for i in range(4):
-                if permuted[i] == 0:
-                    v[i] = 0
-                    if sign_mask & (1 << i):
-                        valid = False
-                        break
-                else:
-                    v[i] = permuted[i] * ((-1) if (sign_mask & (1 << i)) else 1)
-
-            if valid and not any(np.allclose(v, x, atol=1e-6) for x in vertices):
-                vertices.append(v)
-
-    return np.array(vertices)
+    return cell600_vertices()
 
 def geometric_decomposition_600cell(vertices: np.ndarray) -> List[np.ndarray]:
     """
@@ -182,16 +116,7 @@ def geometric_decomposition_600cell(vertices: np.ndarray) -> List[np.ndarray]:
 
 def generate_24cell_vertices() -> np.ndarray:
     """Generate 24 vertices of the 24-cell."""
-    vertices = []
-    for i in range(4):
-        for j in range(i + 1, 4):
-            for si in [-1, 1]:
-                for sj in [-1, 1]:
-                    v = np.zeros(4)
-                    v[i] = si
-                    v[j] = sj
-                    vertices.append(v)
-    return np.array(vertices)
+    return cell24_vertices('d4')
 
 def trinity_decomposition(vertices: np.ndarray) -> Dict[str, np.ndarray]:
     """
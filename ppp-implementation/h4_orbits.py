@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+H4 Orbit Engine
+===============
+
+The 120 vertices of the 600-cell are the unit icosians, a group under
+quaternion multiplication (the binary icosahedral group 2I). Every
+rotation of the 600-cell is p → v_L p v_R† for a pair of vertices, so the
+whole rotation group is a table of index permutations:
+
+    M[i, j] = index(v_i v_j)        C[j] = index(v_j†)
+    perm[(L, R), k] = M[M[L, k], C[R]]
+
+(L, R) and (-L, -R) give the same rotation, leaving 7200 distinct int16
+permutations (14,400 with the reflection p → p†). Subsets of vertices
+are integer index arrays, so an orbit is the set of distinct sorted rows
+of perm[:, subset], found by hashing each sorted index tuple, and the
+stabilizer is the rows whose sorted image is the subset itself:
+
+    engine = H4OrbitEngine()
+    cells = engine.inscribed_24_cells()   # (25, 24) vertex indices
+    engine.partitions(cells)              # (10, 5): rows of disjoint cells
+    len(engine.stabilizer(cells[0]))      # 288 = 7200 / 25
+
+The multiplication table and the permutation group are built once and
+cached through polytope_geometry. cell600_group_tables(vertices) gives
+M and C in any vertex order (the anti-jam hopping table is built from
+it), and quaternion_left_matrix / quaternion_right_matrix are the 4×4
+Hamilton products used wherever quaternions rotate point sets.
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+from polytope_geometry import cached_geometry, cell600_vertices, cell24_vertices
+from polytope_graph import adjacency_cliques, polytope_graph
+
+
+def quaternion_left_matrix(q: np.ndarray) -> np.ndarray:
+    """(..., 4, 4) left multiplication by [w, x, y, z] quaternions: q p == L(q) @ p"""
+    w, x, y, z = np.moveaxis(np.asarray(q, dtype=np.float64), -1, 0)
+    return np.stack([
+        np.stack([w, -x, -y, -z], axis=-1),
+        np.stack([x,  w, -z,  y], axis=-1),
+        np.stack([y,  z,  w, -x], axis=-1),
+        np.stack([z, -y,  x,  w], axis=-1),
+    ], axis=-2)
+
+
+def quaternion_right_matrix(q: np.ndarray) -> np.ndarray:
+    """(..., 4, 4) right multiplication by [w, x, y, z] quaternions: p q == R(q) @ p"""
+    w, x, y, z = np.moveaxis(np.asarray(q, dtype=np.float64), -1, 0)
+    return np.stack([
+        np.stack([w, -x, -y, -z], axis=-1),
+        np.stack([x,  w,  z, -y], axis=-1),
+        np.stack([y, -z,  w,  x], axis=-1),
+        np.stack([z,  y, -x,  w], axis=-1),
+    ], axis=-2)
+
+
+def quaternion_product(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product of [w, x, y, z] quaternions, broadcast over leading axes"""
+    return np.einsum('...ab,...b->...a', quaternion_left_matrix(a), b)
+
+
+@cached_geometry
+def cell600_multiplication_table() -> np.ndarray:
+    """(120, 120) M[i, j] = index of v_i v_j in cell600_vertices()"""
+    vertices = cell600_vertices()
+    products = quaternion_product(vertices[:, np.newaxis], vertices[np.newaxis, :])
+    # Products are vertices again; the largest dot product identifies which
+    return np.argmax(products @ vertices.T, axis=2)
+
+
+@cached_geometry
+def cell600_conjugation_table() -> np.ndarray:
+    """(120,) C[j] = index of v_j† in cell600_vertices()"""
+    vertices = cell600_vertices()
+    return np.argmax((vertices * np.array([1, -1, -1, -1])) @ vertices.T, axis=1)
+
+
+def cell600_labels(vertices: np.ndarray) -> np.ndarray:
+    """
+    (120,) index in cell600_vertices() of each of the caller's vertices.
+
+    Raises ValueError unless vertices are the 120 vertices of the unit
+    600-cell in some order.
+    """
+    base = cell600_vertices()
+    vertices = np.asarray(vertices, dtype=np.float64)
+    labels = polytope_graph(base).locate(vertices)
+    if len(vertices) != len(base) or np.any(labels < 0) \
+            or len(np.unique(labels)) != len(base):
+        raise ValueError("vertices are not the 120 vertices of the unit 600-cell")
+    return labels
+
+
+def cell600_group_tables(vertices: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (M, C) multiplication and conjugation tables of the binary
+    icosahedral group, indexing into vertices (default: cell600_vertices()).
+    """
+    mult = cell600_multiplication_table()
+    conj = cell600_conjugation_table()
+    if vertices is None:
+        return mult, conj
+    labels = cell600_labels(vertices)
+    to_caller = np.empty(len(labels), dtype=np.int64)
+    to_caller[labels] = np.arange(len(labels))
+    return to_caller[mult[labels[:, np.newaxis], labels[np.newaxis, :]]], to_caller[conj[labels]]
+
+
+@cached_geometry
+def h4_permutations(reflections: bool = False) -> np.ndarray:
+    """
+    (7200, 120) vertex permutations of the 600-cell rotation group
+    (14,400 with reflections), rows in lexicographic order so row 0 is
+    the identity.
+    """
+    mult, conj = cell600_group_tables()
+
+    # perm[L, R, k] = M[M[L, k], C[R]]
+    perms = mult[mult[:, np.newaxis, :], conj[np.newaxis, :, np.newaxis]]
+    perms = perms.reshape(-1, len(conj))
+    if reflections:
+        perms = np.concatenate([perms, perms[:, conj]])
+    return np.unique(perms, axis=0).astype(np.int16)
+
+
+class H4OrbitEngine:
+    """Orbits and stabilizers of 600-cell vertex subsets under H4"""
+
+    def __init__(self, vertices: np.ndarray = None, reflections: bool = False):
+        """
+        Args:
+            vertices: (120, 4) 600-cell in any vertex order (default:
+                cell600_vertices()); subsets index into this array
+            reflections: Use the full group of order 14,400 instead of
+                the 7200 rotations
+        """
+        perms = h4_permutations(reflections)
+        if vertices is None:
+            vertices = cell600_vertices()
+        else:
+            vertices = np.asarray(vertices, dtype=np.float64)
+            # Caller vertex k is base vertex labels[k]
+            labels = cell600_labels(vertices)
+            to_caller = np.empty(len(labels), dtype=np.int64)
+            to_caller[labels] = np.arange(len(labels))
+            perms = to_caller[perms[:, labels]]
+
+        self.vertices = vertices
+        self.permutations = perms
+        self._cells = None
+
+    @property
+    def order(self) -> int:
+        return len(self.permutations)
+
+    def images(self, subset: np.ndarray) -> np.ndarray:
+        """(G, k) sorted image of the subset under every group element"""
+        return np.sort(self.permutations[:, np.asarray(subset)], axis=1)
+
+    def orbit(self, subset: np.ndarray) -> np.ndarray:
+        """(K, k) distinct images of the subset, in group-element order"""
+        seen: Dict[bytes, int] = {}
+        images = self.images(subset)
+        for g, image in enumerate(images):
+            seen.setdefault(image.tobytes(), g)
+        return images[list(seen.values())]
+
+    def stabilizer(self, subset: np.ndarray) -> np.ndarray:
+        """Indices (into permutations) of the elements mapping subset to itself"""
+        target = np.sort(np.asarray(subset))
+        return np.flatnonzero(np.all(self.images(target) == target, axis=1))
+
+    def locate(self, points: np.ndarray) -> np.ndarray:
+        """Vertex indices of points on the 600-cell (-1 if not a vertex)"""
+        return polytope_graph(self.vertices).locate(points)
+
+    def inscribed_24_cells(self) -> np.ndarray:
+        """
+        (25, 24) sorted vertex indices of the inscribed 24-cells.
+
+        The 24 unit Hurwitz quaternions are 600-cell vertices; their orbit
+        under the rotation group is every inscribed 24-cell.
+        """
+        if self._cells is None:
+            self._cells = self.orbit(self.locate(cell24_vertices('hurwitz')))
+        return self._cells
+
+    def _shared(self, cells: np.ndarray) -> np.ndarray:
+        """(K, K) number of vertices shared by each pair of cells"""
+        membership = np.zeros((len(cells), len(self.vertices)), dtype=np.int64)
+        membership[np.arange(len(cells))[:, np.newaxis], cells] = 1
+        return membership @ membership.T
+
+    def partitions(self, cells: np.ndarray) -> np.ndarray:
+        """
+        (P, n_vertices / k) rows of mutually disjoint cells that together
+        cover every vertex, as indices into cells.
+        """
+        cells = np.asarray(cells)
+        disjoint = self._shared(cells) == 0
+        return adjacency_cliques(disjoint, len(self.vertices) // cells.shape[1])
+
+    def overlaps(self, cells: np.ndarray) -> Dict[int, int]:
+        """Shared-vertex count → number of cell pairs sharing that many"""
+        cells = np.asarray(cells)
+        shared = self._shared(cells)[np.triu_indices(len(cells), 1)]
+        values, counts = np.unique(shared, return_counts=True)
+        return {int(v): int(c) for v, c in zip(values, counts)}
+
+
+def inscribed_24_cells(vertices: np.ndarray = None) -> List[np.ndarray]:
+    """The 25 inscribed 24-cells as (24, 4) vertex arrays"""
+    engine = H4OrbitEngine(vertices)
+    return [engine.vertices[cell] for cell in engine.inscribed_24_cells()]
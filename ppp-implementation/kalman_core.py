@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Shared Kalman Filter Machinery
+==============================
+
+Pieces used by the tracker classes in cra_pom_v2.py, pom_measurement.py
+and pom_sbir_simulation.py.
+
+UPDATE KERNEL: KalmanKernel is the one predict/update implementation the
+trackers delegate to. It works in place on the tracker's x and P with
+preallocated buffers, gets the gain from a Cholesky factor of S (and
+a solve against it for L⁻¹) instead of inv(S), and updates P in Joseph
+form
+
+    P ← (I - K H) P (I - K H)ᵀ + K R Kᵀ
+
+which stays symmetric positive definite over very long tracks.
+
+STEADY STATE: with fixed F, H, Q, R the covariance P converges to the
+solution of the discrete algebraic Riccati equation (DARE)
+
+    P = F P Fᵀ - F P Hᵀ (H P Hᵀ + R)⁻¹ H P Fᵀ + Q
+
+and the gain to a constant K. The DARE is solved once per (F, H, Q, R)
+and cached; a SteadyStateMonitor watches a running filter and, once its
+gain has converged to K, the filter switches to the constant-gain update
+
+    x ← (I - K H) F x + K z
+
+which is a couple of small matrix-vector products per measurement.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+# =============================================================================
+# UPDATE KERNEL
+# =============================================================================
+
+def _mT(A: np.ndarray) -> np.ndarray:
+    """Transpose of the last two axes (matrix or stack of matrices)"""
+    return np.swapaxes(A, -1, -2)
+
+
+class KalmanKernel:
+    """
+    In-place Kalman predict/update for an n-state, m-measurement filter.
+
+    x (n,) and P (n, n) are owned by the tracker and modified in place;
+    F, H, Q, R are passed per call so adaptive Q/R models can reuse the
+    kernel. Matrix products, the Cholesky factor L of S and L⁻¹ are
+    written into buffers allocated here once; one code path serves a
+    single filter and a batch (np.linalg broadcasts over the batch axis).
+
+    With batch=B the kernel advances B filters that share F and H at once:
+    x is (B, n), P is (B, n, n), z is (B, m), and Q/R may be shared or
+    stacked per filter. A call with a different batch size reallocates the
+    buffers once (multi-target pools grow and shrink between scans).
+    """
+
+    def __init__(self, n: int, m: int, batch: Optional[int] = None):
+        self.n = n
+        self.m = m
+        self._I = np.eye(n)
+        self._Im = np.eye(m)
+        self._allocate(() if batch is None else (batch,))
+
+    def _allocate(self, lead: Tuple[int, ...]):
+        """(Re)allocate work buffers for a leading batch shape"""
+        n, m = self.n, self.m
+        self.batch = lead[0] if lead else None
+        self._nn = np.empty(lead + (n, n))
+        self._nn2 = np.empty(lead + (n, n))
+        self._nm = np.empty(lead + (n, m))
+        self._S = np.empty(lead + (m, m))
+        self._K = np.empty(lead + (n, m))
+        self._x = np.empty(lead + (n,))
+        self._z = np.empty(lead + (m,))
+        self._y = np.empty(lead + (m,))
+        self._L = np.empty(lead + (m, m))
+        self._L_inv = np.empty(lead + (m, m))
+
+    def predict(self, F: np.ndarray, Q: np.ndarray, x: np.ndarray, P: np.ndarray):
+        """x ← F x,  P ← F P Fᵀ + Q"""
+        if x.shape != self._x.shape:
+            self._allocate(x.shape[:-1])
+        np.matmul(x, F.T, out=self._x)
+        x[...] = self._x
+        np.matmul(F, P, out=self._nn)
+        np.matmul(self._nn, F.T, out=P)
+        P += Q
+
+    def _factor(self):
+        """_L ← Cholesky factor of _S (lower), _L_inv ← _L⁻¹"""
+        self._L[...] = np.linalg.cholesky(self._S)
+        self._L_inv[...] = np.linalg.solve(self._L, self._Im)
+
+    def update(self, H: np.ndarray, R: np.ndarray, x: np.ndarray, P: np.ndarray,
+               z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Measurement update with Cholesky gain and Joseph-form covariance.
+
+        Returns:
+            (K, y): gain and innovation. Both are views of internal buffers
+            and are overwritten by the next call.
+        """
+        if x.shape != self._x.shape:
+            self._allocate(x.shape[:-1])
+
+        # Innovation y = z - H x and covariance S = H P Hᵀ + R
+        np.matmul(x, H.T, out=self._z)
+        np.subtract(z, self._z, out=self._y)
+        np.matmul(P, H.T, out=self._nm)
+        np.matmul(H, self._nm, out=self._S)
+        self._S += R
+
+        # K = P Hᵀ S⁻¹ with S = L Lᵀ:  K = (P Hᵀ L⁻ᵀ) L⁻¹. Only the
+        # triangular factor is inverted (cond(L) = √cond(S)), never S itself
+        self._factor()
+        np.matmul(self._nm, _mT(self._L_inv), out=self._K)
+        np.matmul(self._K, self._L_inv, out=self._nm)
+        self._K[...] = self._nm
+
+        # x ← x + K y
+        np.matmul(self._K, self._y[..., np.newaxis], out=self._x[..., np.newaxis])
+        x += self._x
+
+        # Joseph form: P ← (I - K H) P (I - K H)ᵀ + K R Kᵀ
+        np.matmul(self._K, H, out=self._nn)
+        np.subtract(self._I, self._nn, out=self._nn)
+        np.matmul(self._nn, P, out=self._nn2)
+        np.matmul(self._nn2, _mT(self._nn), out=P)
+        np.matmul(self._K, R, out=self._nm)
+        np.matmul(self._nm, _mT(self._K), out=self._nn)
+        P += self._nn
+
+        # Remove rounding asymmetry
+        np.add(P, _mT(P), out=self._nn)
+        np.multiply(self._nn, 0.5, out=P)
+
+        return self._K, self._y
+
+
+# =============================================================================
+# STEADY-STATE (DARE) SOLUTION
+# =============================================================================
+
+@dataclass
+class SteadyStateSolution:
+    """Converged Kalman quantities for one (F, H, Q, R) configuration"""
+    P_pred: np.ndarray   # Prior covariance (after predict)
+    P_post: np.ndarray   # Posterior covariance (after update)
+    K: np.ndarray        # Steady-state gain
+    A: np.ndarray        # Closed-loop transition (I - K H) F
+    iterations: int      # Doubling steps used
+
+
+def solve_dare(F: np.ndarray, H: np.ndarray, Q: np.ndarray, R: np.ndarray,
+               tol: float = 1e-12, max_iter: int = 100) -> SteadyStateSolution:
+    """
+    Solve the filtering DARE by the structured doubling algorithm.
+
+    Each doubling step squares the number of Riccati iterations covered,
+    so convergence is quadratic (typically < 30 steps even when the
+    plain recursion needs thousands).
+    """
+    n = F.shape[0]
+    I = np.eye(n)
+
+    # Control-form DARE with A = Fᵀ, B = Hᵀ
+    A = F.T.copy()
+    G = H.T @ np.linalg.solve(R, H)
+    X = Q.copy()
+
+    for it in range(1, max_iter + 1):
+        W = np.linalg.solve(I + G @ X, np.hstack([A, G]))
+        WA, WG = W[:, :n], W[:, n:]
+        X_next = X + A.T @ X @ WA
+        G = G + A @ WG @ A.T
+        A = A @ WA
+
+        done = np.max(np.abs(X_next - X)) <= tol * max(1.0, np.max(np.abs(X_next)))
+        X = 0.5 * (X_next + X_next.T)
+        if done:
+            break
+
+    S = H @ X @ H.T + R
+    K = np.linalg.solve(S, H @ X).T
+    P_post = (I - K @ H) @ X
+    return SteadyStateSolution(
+        P_pred=X,
+        P_post=0.5 * (P_post + P_post.T),
+        K=K,
+        A=(I - K @ H) @ F,
+        iterations=it,
+    )
+
+
+_STEADY_STATE_CACHE: Dict[Tuple[bytes, ...], SteadyStateSolution] = {}
+
+
+def steady_state_gain(F: np.ndarray, H: np.ndarray, Q: np.ndarray,
+                      R: np.ndarray) -> SteadyStateSolution:
+    """DARE solution for (F, H, Q, R), solved once per configuration"""
+    key = tuple(np.ascontiguousarray(M, dtype=np.float64).tobytes() for M in (F, H, Q, R))
+    key += (F.shape, H.shape)
+    if key not in _STEADY_STATE_CACHE:
+        _STEADY_STATE_CACHE[key] = solve_dare(F, H, Q, R)
+    return _STEADY_STATE_CACHE[key]
+
+
+class SteadyStateMonitor:
+    """
+    Detects when a running filter's gain has reached steady state.
+
+    Usage inside a tracker:
+
+        if monitor.converged:
+            x, y = monitor.step(F, H, x, z)      # constant-gain update
+        else:
+            ... full predict/update producing K ...
+            if monitor.check(K):
+                P[:] = monitor.solution.P_post
+    """
+
+    def __init__(self, F: np.ndarray, H: np.ndarray, Q: np.ndarray, R: np.ndarray,
+                 rtol: float = 1e-6):
+        self.solution = steady_state_gain(F, H, Q, R)
+        self.rtol = rtol
+        self.converged = False
+        self._scale = np.max(np.abs(self.solution.K))
+
+    def check(self, K: np.ndarray) -> bool:
+        """Compare the filter's current gain with the steady-state gain"""
+        if not self.converged:
+            self.converged = np.max(np.abs(K - self.solution.K)) <= self.rtol * self._scale
+        return self.converged
+
+    def step(self, F: np.ndarray, H: np.ndarray, x: np.ndarray,
+             z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Constant-gain update; returns (new state, innovation)"""
+        x_pred = F @ x
+        y = z - H @ x_pred
+        return x_pred + self.solution.K @ y, y
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Array-Native Trajectory Integration
+===================================
+
+The trajectory generators in cra_pom_v2.py, cra_pom_simulation.py and
+pom_measurement.py all integrate the same explicit Euler scheme
+
+    v ← v + a dt
+    p ← p + v dt
+
+one step at a time. Given the whole (..., N, 3) acceleration history up
+front, both lines are running sums:
+
+    v_k = v_0 + Σ_{j<k} a_j dt
+    p_k = p_0 + Σ_{j<k} v_{j+1} dt
+
+integrate() evaluates them with np.cumsum along the time axis. cumsum
+adds left to right, so with the initial value prepended the result is
+bit-identical to the Python loop. Any leading axes (B independent
+trajectories) are carried through.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def integrate(p0: np.ndarray, v0: np.ndarray, accel: np.ndarray, dt: float,
+              record: str = 'before') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Euler-integrate an acceleration history.
+
+    Args:
+        p0, v0: Initial position and velocity, (3,) or (..., 3)
+        accel: (..., N, 3) acceleration applied at each step
+        dt: Time step (seconds)
+        record: 'before' returns the state at the start of each step (the
+            generator stores the state, then integrates); 'after' returns
+            the state once each step has been applied
+
+    Returns:
+        (positions, velocities), each (..., N, 3)
+    """
+    accel = np.asarray(accel, dtype=np.float64)
+    lead = accel.shape[:-2]
+    start = lead + (1, accel.shape[-1])
+
+    v0 = np.broadcast_to(np.asarray(v0, dtype=np.float64)[..., np.newaxis, :], start)
+    p0 = np.broadcast_to(np.asarray(p0, dtype=np.float64)[..., np.newaxis, :], start)
+
+    # (..., N + 1, 3): entry k is the state after k steps
+    vel = np.cumsum(np.concatenate([v0, accel * dt], axis=-2), axis=-2)
+    pos = np.cumsum(np.concatenate([p0, vel[..., 1:, :] * dt], axis=-2), axis=-2)
+
+    if record == 'before':
+        return pos[..., :-1, :], vel[..., :-1, :]
+    if record == 'after':
+        return pos[..., 1:, :], vel[..., 1:, :]
+    raise ValueError(f"record must be 'before' or 'after', got {record!r}")
+
+
+def accumulated_times(dt: float, duration: float) -> np.ndarray:
+    """
+    Times 0, dt, 2 dt, ... up to duration, accumulated as t += dt.
+
+    Matches the sample count of a `while t <= duration: ...; t += dt`
+    loop, whose float accumulation can include or drop the final sample.
+    """
+    n_max = int(duration / dt) + 2
+    t = np.cumsum(np.concatenate([[0.0], np.full(n_max, dt)]))
+    return t[t <= duration]
+
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Nearest-Vertex Decoder Index on S³
+==================================
+
+Every decoder in this directory (POM constellations, 600-cell / 24-cell /
+E8-projection lattices, the anti-jam receiver) answers the same question:
+which vertex of a fixed point set on the unit sphere is closest to a
+received point? Brute force costs O(N) dot products per query.
+
+SphericalCapIndex is built once per lattice and replaces the N-way scan
+with K + C dot products per query (K ≈ √N anchors, C = cap size):
+
+1. ANCHORS: a farthest-point subset of K vertices. Each query is
+   assigned to its nearest anchor a (angle β).
+2. CAPS: each anchor stores the vertices within angle ρ_a of it. Queries
+   are grouped by anchor and decoded against that cap with one matrix
+   product per group.
+3. CERTIFICATE: if the best cap vertex is at angle α from the query, the
+   true nearest vertex lies within β + α of the anchor (triangle
+   inequality). When β + α ≤ ρ_a it is in the cap, so the answer is
+   EXACT. Queries that cannot be certified fall back to brute force, so
+   the result always equals brute force.
+
+In 4D (600-cell) caps hold roughly half the lattice; in 8D (E8 roots)
+they cover almost all of it and the index degenerates into a single
+matrix scan, which is also what small lattices (24-cell) use.
+
+For equal-norm vertex sets the nearest vertex by Euclidean distance is
+the one with the largest dot product, so the same index serves
+Constellation.decode (raw received points) and the S³ snapping code.
+With antipodal=True, v and -v are identified (argmax |v·q|), matching
+the snap_to_nearest convention in cra_pom_v2.py / cra_pom_simulation.py.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+class SphericalCapIndex:
+    """
+    Exact nearest-vertex index for a point set on a sphere.
+
+    query() returns the same index as brute-force argmin ||v - q̂||
+    (or argmax |v·q̂| with antipodal=True), including the lowest-index
+    tie-break for antipodal pairs.
+    """
+
+    # Below this size brute force is as fast as the index
+    MIN_INDEXED_VERTICES = 48
+    # Mean cap size (fraction of the lattice) above which the index is dropped
+    MAX_CAP_FRACTION = 0.6
+
+    def __init__(self, vertices: np.ndarray, antipodal: bool = False,
+                 n_anchors: int = None, n_samples: int = 4096):
+        """
+        Args:
+            vertices: (N, d) vertex set; all nonzero rows must have the same norm
+            antipodal: Identify v with -v (projective nearest vertex)
+            n_anchors: Number of anchor caps (default ~√N)
+            n_samples: Random directions used to size the caps
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        norms = np.linalg.norm(vertices, axis=1)
+
+        # Degenerate zero rows (e.g. E8 roots that project to the origin)
+        # never win an |v·q| snap, so they are left out of the search
+        live = np.flatnonzero(norms > 1e-9)
+        if len(live) < len(vertices) and not antipodal:
+            raise ValueError("Zero vertices are only supported with antipodal=True")
+        if not np.allclose(norms[live], norms[live[0]], rtol=1e-9):
+            raise ValueError("SphericalCapIndex requires equal-norm vertices")
+
+        self.vertices = vertices
+        self.n_vertices = len(vertices)
+        self.antipodal = antipodal
+
+        dirs = vertices[live] / norms[live, np.newaxis]
+
+        # Map every search direction back to the original vertex index.
+        # In antipodal mode, search over V ∪ -V; for a pair (v_i, v_j = -v_i)
+        # both resolve to min(i, j), exactly as argmax |V q| does.
+        owner = live
+        if antipodal:
+            is_neg = (dirs @ dirs.T) <= -1 + 1e-9
+            has_neg = is_neg.any(axis=1)
+            neg_match = np.argmax(is_neg, axis=1)
+            owner = np.where(has_neg, np.minimum(owner, live[neg_match]), owner)
+            extra = np.flatnonzero(~has_neg)
+            dirs = np.vstack([dirs, -dirs[extra]])
+            owner = np.concatenate([owner, live[extra]])
+        self._dirs = dirs
+        self._owner = owner
+
+        m = len(dirs)
+        if m < self.MIN_INDEXED_VERTICES:
+            self._anchors = None
+            return
+
+        if n_anchors is None:
+            n_anchors = int(round(np.sqrt(m)))
+        n_anchors = max(1, min(n_anchors, m))
+
+        # Farthest-point anchors (deterministic, starts at vertex 0)
+        chosen = [0]
+        best_cos = dirs @ dirs[0]
+        for _ in range(n_anchors - 1):
+            nxt = int(np.argmin(best_cos))
+            chosen.append(nxt)
+            best_cos = np.maximum(best_cos, dirs @ dirs[nxt])
+        self._anchor_ids = np.array(chosen)
+        self._anchors = dirs[self._anchor_ids]
+
+        # Anchor caps: every query whose nearest anchor is a only has to be
+        # checked against the vertices within angle ρ_a of a. ρ_a is sized
+        # from random probes so that nearly every query is certified below.
+        rng = np.random.default_rng(0)
+        probe = rng.normal(0, 1, (n_samples, dirs.shape[1]))
+        probe /= np.linalg.norm(probe, axis=1, keepdims=True)
+        probe_anchor = np.argmax(probe @ self._anchors.T, axis=1)
+        beta = np.arccos(np.clip(np.sum(probe * self._anchors[probe_anchor], axis=1), -1, 1))
+        alpha = np.arccos(np.clip((probe @ dirs.T).max(axis=1), -1, 1))
+        reach = np.zeros(n_anchors)
+        np.maximum.at(reach, probe_anchor, beta + alpha)
+        self._radius = np.minimum(np.pi, 1.25 * reach + 1e-9)
+
+        anchor_angle = np.arccos(np.clip(self._anchors @ dirs.T, -1, 1))
+        self._caps = [np.flatnonzero(anchor_angle[a] <= self._radius[a])
+                      for a in range(n_anchors)]
+        self._cap_dirs = [dirs[cap] for cap in self._caps]
+
+        # Caps that cover most of the lattice (high dimension, irregular
+        # point sets) cost more than they save: use the plain scan
+        if np.mean([len(cap) for cap in self._caps]) > self.MAX_CAP_FRACTION * m:
+            self._anchors = None
+
+    def __len__(self) -> int:
+        return self.n_vertices
+
+    def _normalize(self, points: np.ndarray) -> np.ndarray:
+        return points / (np.linalg.norm(points, axis=-1, keepdims=True) + 1e-10)
+
+    def _finish(self, q: np.ndarray, search_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Chord distance on the unit sphere (taken directly rather than
+        # from 2 - 2 cos, which cancels badly near a vertex)
+        distances = np.linalg.norm(q - self._dirs[search_idx], axis=1)
+        return self._owner[search_idx], distances
+
+    def query(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode a batch of points.
+
+        Args:
+            points: (M, d) received points (need not be normalized)
+
+        Returns:
+            (indices, distances): nearest vertex index per point and the
+            chord distance between the normalized point and that vertex
+            (sign-aligned in antipodal mode)
+        """
+        q = self._normalize(np.atleast_2d(np.asarray(points, dtype=np.float64)))
+        m = len(q)
+
+        if self._anchors is None:
+            dots = q @ self._dirs.T
+            idx = np.argmax(dots, axis=1)
+            return self._finish(q, idx)
+
+        anchor_dots = q @ self._anchors.T
+        a = np.argmax(anchor_dots, axis=1)
+        beta = np.arccos(np.clip(anchor_dots[np.arange(m), a], -1, 1))
+
+        idx = np.empty(m, dtype=np.int64)
+        best = np.empty(m)
+        order = np.argsort(a, kind='stable')
+        bounds = np.searchsorted(a[order], np.arange(len(self._caps) + 1))
+        for k, cap in enumerate(self._caps):
+            rows = order[bounds[k]:bounds[k + 1]]
+            if len(rows) == 0:
+                continue
+            dots = q[rows] @ self._cap_dirs[k].T
+            j = np.argmax(dots, axis=1)
+            idx[rows] = cap[j]
+            best[rows] = dots[np.arange(len(rows)), j]
+
+        # Certificate: the true nearest vertex is within α of the query and
+        # hence within β + α of the anchor, i.e. inside the searched cap
+        alpha = np.arccos(np.clip(best, -1, 1))
+        uncertain = beta + alpha > self._radius[a]
+        if np.any(uncertain):
+            bad = np.flatnonzero(uncertain)
+            dots = q[bad] @ self._dirs.T
+            j = np.argmax(dots, axis=1)
+            idx[bad] = j
+
+        return self._finish(q, idx)
+
+    def query_one(self, point: np.ndarray) -> Tuple[int, float]:
+        """
+        Decode a single point; returns (index, distance).
+
+        One point does not amortize the anchor grouping, so this is a
+        single scan of the precomputed (sign-expanded) directions.
+        """
+        q = self._normalize(np.asarray(point, dtype=np.float64))
+        j = int(np.argmax(self._dirs @ q))
+        return int(self._owner[j]), float(np.linalg.norm(q - self._dirs[j]))
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Multi-Target Tracking Manager
+=============================
+
+The trackers in cra_pom_v2.py and pom_measurement.py follow one target.
+MultiTargetTracker runs many tracks of one filter model (KalmanFilter,
+SingerKalman, CognitiveGeometricTracker, ...) against scans of unlabeled
+detections:
+
+1. PREDICT: every track advances in one batched Kalman predict.
+2. GATE: squared Mahalanobis distances between all predicted tracks and
+   all detections, d² = (z - Hx)ᵀ S⁻¹ (z - Hx), from one batched Cholesky
+   factorization of the innovation covariances. Pairs with d² above the
+   chi-square gate are impossible.
+3. ASSIGN: the gated pairs split into independent clusters (connected
+   components of the gating graph); each cluster is solved on its own,
+   either optimally (Hungarian / Kuhn-Munkres, minimum total d²) or by
+   greedy global nearest neighbour (repeatedly take the closest pair).
+4. UPDATE: all assigned tracks take one batched Joseph-form update.
+5. MANAGE: unassigned detections initiate tentative tracks; a track is
+   confirmed after `confirm_hits` hits; tentative tracks die on their
+   first miss, confirmed tracks after `max_misses` consecutive misses.
+
+Track state lives in (T, n) / (T, n, n) arrays, so per-scan cost is a few
+array operations plus small per-cluster assignment problems. Filter
+models are read from a template instance of the filter class, as in
+pom_measurement.KalmanBank; for CognitiveGeometricTracker the measurement
+noise is scaled per update by the ViT attention analysis of the assigned
+detection, with one entropy baseline per track.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from kalman_core import KalmanKernel
+from sliding_median import SlidingMedian
+
+
+# Chi-square gates for 3-D position measurements
+GATE_CHI2_3DOF_99 = 11.345
+GATE_CHI2_3DOF_999 = 16.266
+
+ASSIGNMENT_METHODS = ('hungarian', 'gnn')
+
+
+# =============================================================================
+# ASSIGNMENT
+# =============================================================================
+
+def hungarian(cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Minimum-cost assignment for a rectangular cost matrix.
+
+    Shortest augmenting path form of the Hungarian algorithm (O(n² m) for
+    n ≤ m), vectorized over columns. Every row of the smaller side is
+    assigned.
+
+    Returns:
+        (rows, cols) index arrays of the assigned pairs
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.shape[0] > cost.shape[1]:
+        cols, rows = hungarian(cost.T)
+        order = np.argsort(rows)
+        return rows[order], cols[order]
+
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.int64)     # p[j]: row (1-based) matched to column j
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used[1:]
+            cur = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (cur < minv[1:])
+            minv[1:][better] = cur[better]
+            way[1:][better] = j0
+            j1 = int(np.argmin(np.where(free, minv[1:], np.inf))) + 1
+            delta = minv[j1]
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    cols = np.flatnonzero(p[1:])
+    rows = p[1:][cols] - 1
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+
+def greedy_assignment(cost: np.ndarray, gated: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Global nearest neighbour: repeatedly take the cheapest remaining gated pair"""
+    r, c = np.nonzero(gated)
+    order = np.argsort(cost[r, c], kind='stable')
+    row_used = np.zeros(cost.shape[0], dtype=bool)
+    col_used = np.zeros(cost.shape[1], dtype=bool)
+    rows, cols = [], []
+    for k in order:
+        i, j = r[k], c[k]
+        if not row_used[i] and not col_used[j]:
+            row_used[i] = col_used[j] = True
+            rows.append(i)
+            cols.append(j)
+    return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)
+
+
+def gating_clusters(pairs_t: np.ndarray, pairs_d: np.ndarray,
+                    n_tracks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Connected components of the bipartite gating graph.
+
+    Nodes are tracks 0..T-1 and detections T..T+D-1; labels are propagated
+    along the gated pairs until stable (a handful of sweeps for the sparse
+    graphs gating produces).
+
+    Returns:
+        (edge_labels, labels): component label per gated pair and per node
+    """
+    a = pairs_t
+    b = pairs_d + n_tracks
+    n_nodes = n_tracks + (int(pairs_d.max()) + 1 if len(pairs_d) else 0)
+    labels = np.arange(n_nodes)
+    while True:
+        edge = np.minimum(labels[a], labels[b])
+        new = labels.copy()
+        np.minimum.at(new, a, edge)
+        np.minimum.at(new, b, edge)
+        new = new[new]      # pointer jumping
+        if np.array_equal(new, labels):
+            break
+        labels = new
+    return labels[a], labels
+
+
+def assign(d2: np.ndarray, gate: float, method: str = 'hungarian') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign detections to tracks from a (T, D) matrix of squared distances.
+
+    Only pairs with d² ≤ gate can be assigned. 'hungarian' maximizes the
+    number of assignments and then minimizes the total d² inside each
+    gating cluster; 'gnn' is the greedy global-nearest-neighbour rule.
+
+    Returns:
+        (track_idx, detection_idx) of the assigned pairs
+    """
+    if method not in ASSIGNMENT_METHODS:
+        raise ValueError(f"Unknown assignment method '{method}' (use one of {ASSIGNMENT_METHODS})")
+
+    gated = d2 <= gate
+    pt, pd = np.nonzero(gated)
+    if len(pt) == 0:
+        return pt, pd
+
+    edge_labels, _ = gating_clusters(pt, pd, d2.shape[0])
+    order = np.argsort(edge_labels, kind='stable')
+    bounds = np.flatnonzero(np.diff(edge_labels[order])) + 1
+    tracks_out, dets_out = [], []
+    for group in np.split(order, bounds):
+        if len(group) == 1:
+            # Isolated pair: nothing to decide
+            tracks_out.append(pt[group])
+            dets_out.append(pd[group])
+            continue
+
+        t_ids = np.unique(pt[group])
+        d_ids = np.unique(pd[group])
+        sub_gated = gated[np.ix_(t_ids, d_ids)]
+        sub_cost = d2[np.ix_(t_ids, d_ids)]
+        if method == 'gnn':
+            r, c = greedy_assignment(sub_cost, sub_gated)
+        else:
+            # Forbidden pairs cost more than any set of gated pairs, so
+            # the optimum uses as many gated pairs as possible
+            forbidden = gate * (min(sub_cost.shape) + 1) + 1.0
+            r, c = hungarian(np.where(sub_gated, sub_cost, forbidden))
+            keep = sub_gated[r, c]
+            r, c = r[keep], c[keep]
+        tracks_out.append(t_ids[r])
+        dets_out.append(d_ids[c])
+
+    return np.concatenate(tracks_out), np.concatenate(dets_out)
+
+
+# =============================================================================
+# TRACK MANAGER
+# =============================================================================
+
+@dataclass
+class ScanResult:
+    """Outcome of one MultiTargetTracker scan"""
+    track_ids: np.ndarray       # (K,) ids of confirmed tracks
+    positions: np.ndarray       # (K, 3) their position estimates
+    assigned: np.ndarray        # (A, 2) [track id, detection index] pairs
+    n_initiated: int            # New tentative tracks this scan
+    n_deleted: int              # Tracks dropped this scan
+
+
+class MultiTargetTracker:
+    """
+    Gated, assignment-based multi-target tracking over one filter model.
+
+    Usage:
+
+        mtt = MultiTargetTracker(SingerKalman, dt=0.1)
+        for detections in scans:            # (D, 3) arrays
+            result = mtt.step(detections)
+    """
+
+    def __init__(self, filter_class, dt: float = 0.1,
+                 gate: float = GATE_CHI2_3DOF_999,
+                 assignment: str = 'hungarian',
+                 confirm_hits: int = 3,
+                 max_misses: int = 5,
+                 **filter_kwargs):
+        """
+        Args:
+            filter_class: Single-target filter whose model (F, H, Q, R, P) is used
+            dt: Scan interval
+            gate: Chi-square gate on the squared Mahalanobis distance
+            assignment: 'hungarian' (optimal) or 'gnn' (greedy nearest neighbour)
+            confirm_hits: Hits needed to confirm a tentative track
+            max_misses: Consecutive misses that delete a confirmed track
+        """
+        if assignment not in ASSIGNMENT_METHODS:
+            raise ValueError(f"Unknown assignment method '{assignment}' (use one of {ASSIGNMENT_METHODS})")
+
+        self.template = filter_class(dt, **filter_kwargs)
+        self.F = self.template.F
+        self.H = self.template.H
+        self.Q = self.template.Q
+        self.P0 = self.template.P.copy()
+
+        # CognitiveGeometricTracker adapts R per measurement from attention
+        self.adaptive = hasattr(self.template, 'vit')
+        self.R = self.template.R_base if self.adaptive else self.template.R
+
+        self.gate = gate
+        self.assignment = assignment
+        self.confirm_hits = confirm_hits
+        self.max_misses = max_misses
+
+        n = self.F.shape[0]
+        self.x = np.zeros((0, n))
+        self.P = np.zeros((0, n, n))
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.hits = np.zeros(0, dtype=np.int64)
+        self.misses = np.zeros(0, dtype=np.int64)
+        self.entropy_windows: List[SlidingMedian] = []
+        self.kernel = KalmanKernel(n, self.H.shape[0], batch=0)
+
+        self.next_id = 0
+        self.n_scans = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def confirmed(self) -> np.ndarray:
+        return self.hits >= self.confirm_hits
+
+    def mahalanobis(self, detections: np.ndarray) -> np.ndarray:
+        """(T, D) squared Mahalanobis distances of detections to predicted tracks"""
+        S = self.H @ self.P @ self.H.T + self.R
+        m = S.shape[-1]
+        L_inv = np.linalg.solve(np.linalg.cholesky(S), np.eye(m))
+        diff = detections[np.newaxis, :, :] - (self.x @ self.H.T)[:, np.newaxis, :]
+        # Whitened residuals L⁻¹ (z - Hx) for every (track, detection)
+        white = diff @ np.swapaxes(L_inv, 1, 2)
+        return np.einsum('tdi,tdi->td', white, white)
+
+    def _measurement_noise(self, detections: np.ndarray, tracks: np.ndarray) -> np.ndarray:
+        """Per-update R: fixed, or attention-scaled per track (cognitive model)"""
+        if not self.adaptive:
+            return self.R
+
+        _, _, diag = self.template.vit.forward_batch(self.template._attention_input(detections))
+        entropy = diag['attention_entropy']
+        baseline = np.empty(len(tracks))
+        for k, t in enumerate(tracks):
+            window = self.entropy_windows[t]
+            window.append(entropy[k])
+            baseline[k] = window.median() if len(window) >= 10 else entropy[k]
+
+        scale = self.template.noise_scale(entropy, baseline,
+                                          diag['attention_concentration'], diag['head_agreement'])
+        return self.R[np.newaxis] * scale[:, np.newaxis, np.newaxis]
+
+    def step(self, detections: np.ndarray) -> ScanResult:
+        """Process one scan of (D, 3) detections"""
+        detections = np.asarray(detections, dtype=np.float64).reshape(-1, 3)
+        self.n_scans += 1
+
+        # 1. Predict every track
+        if len(self):
+            self.kernel.predict(self.F, self.Q, self.x, self.P)
+
+        # 2-3. Gate and assign
+        if len(self) and len(detections):
+            t_idx, d_idx = assign(self.mahalanobis(detections), self.gate, self.assignment)
+        else:
+            t_idx = d_idx = np.zeros(0, dtype=np.int64)
+
+        # 4. Batched update of assigned tracks
+        if len(t_idx):
+            x, P = self.x[t_idx], self.P[t_idx]
+            R = self._measurement_noise(detections[d_idx], t_idx)
+            self.kernel.update(self.H, R, x, P, detections[d_idx])
+            self.x[t_idx], self.P[t_idx] = x, P
+        assigned = np.column_stack([self.ids[t_idx], d_idx])
+
+        # 5. Track management
+        hit = np.zeros(len(self), dtype=bool)
+        hit[t_idx] = True
+        self.hits[hit] += 1
+        self.misses[hit] = 0
+        self.misses[~hit] += 1
+
+        keep = np.where(self.confirmed, self.misses < self.max_misses, self.misses == 0)
+        n_deleted = int(np.sum(~keep))
+        if n_deleted:
+            self._select(keep)
+
+        unused = np.ones(len(detections), dtype=bool)
+        unused[d_idx] = False
+        new = detections[unused]
+        self._initiate(new)
+
+        confirmed = self.confirmed
+        return ScanResult(
+            track_ids=self.ids[confirmed],
+            positions=self.x[confirmed, 0:3].copy(),
+            assigned=assigned,
+            n_initiated=len(new),
+            n_deleted=n_deleted,
+        )
+
+    def _select(self, keep: np.ndarray):
+        self.x, self.P = self.x[keep], self.P[keep]
+        self.ids, self.hits, self.misses = self.ids[keep], self.hits[keep], self.misses[keep]
+        if self.adaptive:
+            self.entropy_windows = [w for w, k in zip(self.entropy_windows, keep) if k]
+
+    def _initiate(self, detections: np.ndarray):
+        """Start one tentative track per detection (position = detection)"""
+        k = len(detections)
+        if k == 0:
+            return
+        x = np.zeros((k, self.x.shape[1]))
+        x[:, 0:3] = detections
+        self.x = np.concatenate([self.x, x])
+        self.P = np.concatenate([self.P, np.broadcast_to(self.P0, (k,) + self.P0.shape)])
+        self.ids = np.concatenate([self.ids, self.next_id + np.arange(k)])
+        self.hits = np.concatenate([self.hits, np.ones(k, dtype=np.int64)])
+        self.misses = np.concatenate([self.misses, np.zeros(k, dtype=np.int64)])
+        if self.adaptive:
+            self.entropy_windows.extend(SlidingMedian(self.template.entropy_history.window)
+                                        for _ in range(k))
+        self.next_id += k
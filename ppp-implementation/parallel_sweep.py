@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Parallel Sweep Runner
+=====================
+
+Fans a grid of independent Monte Carlo tasks (constellation × SNR × trial)
+out over a ProcessPoolExecutor.
+
+REPRODUCIBILITY: every task gets its own Generator, seeded from
+np.random.SeedSequence(seed).spawn(n_tasks) in grid order. A task's random
+stream depends only on its position in the grid, never on which worker ran
+it or in what order, so results are bit-identical for any n_workers
+(including n_workers=1, which runs in-process without a pool).
+
+WORKERS: n_workers=None runs in-process unless $PPP_WORKERS asks for a
+pool (a count, or 0 for one worker per CPU), so library callers and
+nested pools never fan out over the whole machine without opting in.
+
+Task functions must be importable (module-level) so they can be pickled,
+and take the Generator as their LAST argument:
+
+    def trial(constellation, snr_db, n_symbols, rng) -> float
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple, Any
+
+
+def _run_task(job: Tuple[Callable, tuple, np.random.SeedSequence]) -> Any:
+    """Worker entry point: rebuild the task's generator and call it"""
+    fn, args, seed_seq = job
+    return fn(*args, np.random.default_rng(seed_seq))
+
+
+def resolve_workers(n_workers: Optional[int]) -> int:
+    """None reads $PPP_WORKERS (default 1); 0 means one worker per CPU"""
+    if n_workers is None:
+        n_workers = int(os.environ.get('PPP_WORKERS', '1') or 1)
+    if n_workers == 0:
+        n_workers = os.cpu_count() or 1
+    return max(1, int(n_workers))
+
+
+def run_tasks(fn: Callable, tasks: Sequence[tuple], seed: int = 42,
+              n_workers: Optional[int] = None, chunksize: Optional[int] = None) -> List[Any]:
+    """
+    Run fn(*task, rng) for every task and return results in task order.
+
+    Args:
+        fn: Module-level task function, Generator as last argument
+        tasks: Argument tuples, one per task (grid order defines the seeds)
+        seed: Root seed of the SeedSequence
+        n_workers: Worker processes (None = $PPP_WORKERS or 1, 0 = all
+            CPUs, 1 = in-process)
+        chunksize: Tasks per pickled batch (default: ~4 batches per worker)
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    jobs = [(fn, tuple(task), s) for task, s in zip(tasks, seeds)]
+
+    n_workers = min(resolve_workers(n_workers), max(1, len(jobs)))
+    if n_workers == 1:
+        return [_run_task(job) for job in jobs]
+
+    if chunksize is None:
+        chunksize = max(1, len(jobs) // (4 * n_workers))
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_run_task, jobs, chunksize=chunksize))
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Shared Polytope Geometry
+========================
+
+The E8 roots, the 600-cell, the 24-cell and the Moxness folding matrix
+used to be rebuilt by hand in nearly every script, element by element and
+often with O(N²) duplicate checks. This module builds each of them once:
+
+    cell600_vertices()           # (120, 4) unit quaternions of 2I
+    cell24_vertices('hurwitz')   # (24, 4) unit Hurwitz quaternions
+    cell24_vertices('d4')        # (24, 4) permutations of (±1, ±1, 0, 0)
+    cell16_vertices()            # (8, 4)
+    tesseract_vertices()         # (16, 4)
+    e8_roots()                   # (240, 8)
+    moxness_matrix()             # (8, 8) E8 → H4 × H4 folding
+
+unique_vertices() removes repeated (and optionally antipodal) vertices
+from projected vertex sets in O(N log N).
+
+Constructions are vectorized and cached twice: in-process (every caller
+gets the same array) and on disk as .npy files keyed by the construction
+name and its parameters, so script start-up loads arrays instead of
+rebuilding them. Returned arrays are READ-ONLY; take a .copy() to modify.
+
+The disk cache lives in $PPP_GEOMETRY_CACHE (default
+~/.cache/ppp_geometry); set it to an empty string to disable it. File
+names carry a digest of the builder's source, including the cached
+builders and same-module helpers it calls, so editing a construction
+(or one it depends on) invalidates its files. CACHE_VERSION only needs a
+bump when the file format itself changes.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+PHI = (1 + np.sqrt(5)) / 2  # Golden ratio
+
+CACHE_VERSION = 1
+
+# The 12 even permutations of 4 coordinates (order used throughout)
+EVEN_PERMUTATIONS = np.array([
+    [0, 1, 2, 3], [0, 2, 3, 1], [0, 3, 1, 2],
+    [1, 0, 3, 2], [1, 2, 0, 3], [1, 3, 2, 0],
+    [2, 0, 1, 3], [2, 1, 3, 0], [2, 3, 0, 1],
+    [3, 0, 2, 1], [3, 1, 0, 2], [3, 2, 1, 0],
+])
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+_MEMO: Dict[Tuple, np.ndarray] = {}
+
+
+def cache_dir() -> Optional[Path]:
+    """Directory of the on-disk cache, or None when disabled"""
+    root = os.environ.get('PPP_GEOMETRY_CACHE')
+    if root is None:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(base) / 'ppp_geometry'
+    return Path(root) if root else None
+
+
+def _code_names(code) -> set:
+    """Global names referenced by a code object and any nested code"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def source_digest(func: Callable, _seen: Optional[set] = None) -> str:
+    """
+    Short hash of a builder's source together with the cached builders
+    and same-module functions it references.
+    """
+    seen = set() if _seen is None else _seen
+    func = inspect.unwrap(func)
+    if func in seen:
+        return ''
+    seen.add(func)
+
+    try:
+        digest = hashlib.sha1(inspect.getsource(func).encode())
+    except (OSError, TypeError):
+        digest = hashlib.sha1(func.__code__.co_code)
+    for name in sorted(_code_names(func.__code__)):
+        ref = func.__globals__.get(name)
+        if inspect.isfunction(ref) and (hasattr(ref, '__wrapped__')
+                                        or ref.__module__ == func.__module__):
+            digest.update(source_digest(ref, seen).encode())
+    return digest.hexdigest()[:12]
+
+
+def _cache_path(key: Tuple, digest: str) -> Optional[Path]:
+    directory = cache_dir()
+    if directory is None:
+        return None
+    name, params = key[0], key[1:]
+    stem = '-'.join([name] + [f"{k}={v}" for k, v in params]
+                    + [f"src={digest}", f"v{CACHE_VERSION}"])
+    return directory / (re.sub(r'[^A-Za-z0-9_.=-]', '_', stem) + '.npy')
+
+
+def _load(path: Optional[Path]) -> Optional[np.ndarray]:
+    if path is None or not path.exists():
+        return None
+    try:
+        return np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None     # Truncated or foreign file: rebuild
+
+
+def _save(path: Optional[Path], array: np.ndarray) -> None:
+    """Write atomically; the cache is best effort, so failures are ignored"""
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.npy')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def cached_geometry(build: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+    """
+    Memoize a construction in-process and on disk.
+
+    The cache key is the function name plus its bound arguments (defaults
+    included), so f() and f(form='hurwitz') share an entry. Integer index
+    tables keep their dtype; everything else is stored as float64.
+    """
+    signature = inspect.signature(build)
+    digest = None
+
+    @functools.wraps(build)
+    def wrapper(*args, **kwargs) -> np.ndarray:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (build.__name__,) + tuple(sorted(bound.arguments.items()))
+
+        array = _MEMO.get(key)
+        if array is not None:
+            return array
+
+        # Resolved on first use, once every builder it calls is defined
+        nonlocal digest
+        if digest is None:
+            digest = source_digest(build)
+        path = _cache_path(key, digest)
+        array = _load(path)
+        if array is None:
+            array = np.asarray(build(*bound.args, **bound.kwargs))
+            if not np.issubdtype(array.dtype, np.integer):
+                array = array.astype(np.float64)
+            array = np.ascontiguousarray(array)
+            _save(path, array)
+
+        array.setflags(write=False)
+        _MEMO[key] = array
+        return array
+
+    return wrapper
+
+
+def clear_cache(disk: bool = False) -> None:
+    """Drop the in-process memo (and the .npy files when disk=True)"""
+    _MEMO.clear()
+    directory = cache_dir()
+    if disk and directory is not None and directory.exists():
+        for path in directory.glob('*.npy'):
+            path.unlink()
+
+
+# =============================================================================
+# DEDUPLICATION
+# =============================================================================
+
+def unique_vertices(vertices: np.ndarray, tol: float = 0.01,
+                    antipodal: bool = True) -> np.ndarray:
+    """
+    Drop repeated vertices (and, with antipodal=True, one of each ±v pair).
+
+    Coordinates are quantized to a grid of spacing tol, each row's sign is
+    fixed so its first nonzero grid coordinate is positive (round() is odd,
+    so v and -v get the same key), and np.unique groups the keys in
+    O(N log N). Of each group the vertex that comes first in the input is
+    kept, in input order, so the representative of a ±v pair (and the
+    output order) depends on the input order: reordering the input can
+    return -v where it used to return v.
+
+    Points closer than tol that straddle a cell boundary are not merged;
+    projected polytope vertices are either equal to rounding or far apart.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if len(vertices) == 0:
+        return vertices.copy()
+    keys = np.round(vertices / tol).astype(np.int64)
+    if antipodal:
+        lead = keys[np.arange(len(keys)), np.argmax(keys != 0, axis=1)]
+        keys[lead < 0] *= -1
+    _, first = np.unique(keys, axis=0, return_index=True)
+    return vertices[np.sort(first)]
+
+
+# =============================================================================
+# 4D POLYTOPES
+# =============================================================================
+
+def _sign_patterns(k: int) -> np.ndarray:
+    """(2^k, k) sign vectors in np.ndindex order, + before -"""
+    bits = (np.arange(2 ** k)[:, np.newaxis] >> np.arange(k - 1, -1, -1)) & 1
+    return 1.0 - 2.0 * bits
+
+
+@cached_geometry
+def cell600_vertices() -> np.ndarray:
+    """
+    The 120 vertices of the 600-cell on S³ (the binary icosahedral group).
+
+    Order: 8 permutations of (±1, 0, 0, 0), 16 of (±½, ±½, ±½, ±½), then
+    the 96 even permutations of (±φ/2, ±1/2, ±1/(2φ), 0), eight sign
+    patterns per permutation. The first 24 form the Hurwitz 24-cell.
+    """
+    axis = np.repeat(np.eye(4), 2, axis=0) * np.tile([1.0, -1.0], 4)[:, np.newaxis]
+    half = 0.5 * _sign_patterns(4)
+
+    base = np.array([PHI / 2, 0.5, 1 / PHI / 2, 0.0])[EVEN_PERMUTATIONS]   # (12, 4)
+
+    # Signs go to the three nonzero coordinates of each permutation in order
+    nonzero = np.nonzero(base)[1].reshape(12, 3)
+    signs = np.ones((12, 8, 4))
+    np.put_along_axis(signs, np.broadcast_to(nonzero[:, np.newaxis, :], (12, 8, 3)),
+                      np.broadcast_to(_sign_patterns(3), (12, 8, 3)), axis=2)
+    golden = (base[:, np.newaxis, :] * signs).reshape(96, 4)
+
+    vertices = np.concatenate([axis, half, golden])
+    return vertices / np.linalg.norm(vertices, axis=1, keepdims=True)
+
+
+@cached_geometry
+def cell24_vertices(form: str = 'hurwitz') -> np.ndarray:
+    """
+    The 24 vertices of the 24-cell.
+
+    form='hurwitz': the unit Hurwitz quaternions (±1, 0, 0, 0) and
+    (±½, ±½, ±½, ±½), inscribed in the 600-cell.
+    form='d4': permutations of (±1, ±1, 0, 0), radius √2 (the D4 roots).
+    """
+    if form == 'hurwitz':
+        return cell600_vertices()[:24]
+    if form == 'd4':
+        i, j = np.triu_indices(4, 1)
+        signs = np.array([[-1.0, -1.0], [-1.0, 1.0], [1.0, -1.0], [1.0, 1.0]])
+        vertices = np.zeros((6, 4, 4))
+        vertices[np.arange(6), :, i] = signs[:, 0]
+        vertices[np.arange(6), :, j] = signs[:, 1]
+        return vertices.reshape(24, 4)
+    raise ValueError(f"Unknown 24-cell form {form!r} (use 'hurwitz' or 'd4')")
+
+
+@cached_geometry
+def cell16_vertices() -> np.ndarray:
+    """The 8 vertices of the 16-cell, permutations of (±1, 0, 0, 0)"""
+    return cell600_vertices()[:8]
+
+
+@cached_geometry
+def tesseract_vertices() -> np.ndarray:
+    """The 16 vertices of the tesseract (8-cell), (±½, ±½, ±½, ±½)"""
+    return cell600_vertices()[8:24]
+
+
+# =============================================================================
+# E8
+# =============================================================================
+
+@cached_geometry
+def e8_roots() -> np.ndarray:
+    """
+    The 240 roots of E8 (norm √2).
+
+    112 permutations of (±1, ±1, 0, 0, 0, 0, 0, 0), ordered by position
+    pair then signs (-,-), (-,+), (+,-), (+,+); then the 128 vectors
+    (±½)^8 with an even number of minus signs, bit i of an increasing
+    mask putting a minus on coordinate i.
+    """
+    i, j = np.triu_indices(8, 1)
+    signs = np.array([[-1.0, -1.0], [-1.0, 1.0], [1.0, -1.0], [1.0, 1.0]])
+    type1 = np.zeros((28, 4, 8))
+    type1[np.arange(28), :, i] = signs[:, 0]
+    type1[np.arange(28), :, j] = signs[:, 1]
+
+    masks = np.arange(256)
+    bits = (masks[:, np.newaxis] >> np.arange(8)) & 1
+    type2 = np.where(bits[bits.sum(axis=1) % 2 == 0], -0.5, 0.5)
+
+    return np.concatenate([type1.reshape(112, 8), type2])
+
+
+@cached_geometry
+def moxness_matrix(form: str = 'orthogonal') -> np.ndarray:
+    """
+    Moxness 8×8 folding matrix, E8 → H4 × H4.
+
+    form='orthogonal': the SVD-corrected orthogonal matrix (det = 1,
+    rank 8) used by the analysis scripts.
+    form='golden': the golden-ratio structured target matrix it was
+    corrected from (rows of a = ½, b = 1/(2φ), c = φ/2).
+    """
+    if form == 'orthogonal':
+        return np.array([
+            [ 0.2628656, -0.2628656, -0.2628656,  0.2628656,  0.6424204, -0.5330869, -0.1217464,  0.1090828],
+            [ 0.2628656, -0.2628656,  0.2628656, -0.2628656,  0.3841082,  0.4628869, -0.4013878, -0.4479857],
+            [ 0.2628656,  0.2628656, -0.2628656, -0.2628656,  0.3841082,  0.4628869,  0.4013878,  0.4479857],
+            [ 0.2628656,  0.2628656,  0.2628656,  0.2628656,  0.1257960, -0.1043868,  0.6217397, -0.5570685],
+            [ 0.4253254, -0.4253254, -0.4253254,  0.4253254, -0.3970376,  0.3294658,  0.0752434, -0.0674169],
+            [ 0.4253254, -0.4253254,  0.4253254, -0.4253254, -0.2373919, -0.2860798,  0.2480713,  0.2768704],
+            [ 0.4253254,  0.4253254, -0.4253254, -0.4253254, -0.2373919, -0.2860798, -0.2480713, -0.2768704],
+            [ 0.4253254,  0.4253254,  0.4253254,  0.4253254, -0.0777462,  0.0645146, -0.3842563,  0.3442873],
+        ])
+    if form == 'golden':
+        a = 0.5
+        b = 0.5 * (PHI - 1)
+        c = 0.5 * PHI
+        return np.array([
+            # First 4 rows: Left-handed H4 projection
+            [a,  a,  a,  a,  b,  b, -b, -b],
+            [a,  a, -a, -a,  b, -b,  b, -b],
+            [a, -a,  a, -a,  b, -b, -b,  b],
+            [a, -a, -a,  a,  b,  b, -b, -b],
+            # Last 4 rows: Right-handed H4 projection (φ-scaled)
+            [c,  c,  c,  c, -a, -a,  a,  a],
+            [c,  c, -c, -c, -a,  a, -a,  a],
+            [c, -c,  c, -c, -a,  a,  a, -a],
+            [c, -c, -c,  c, -a, -a,  a,  a],
+        ])
+    raise ValueError(f"Unknown Moxness form {form!r} (use 'orthogonal' or 'golden')")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Polytope Edge Graph (CSR)
+=========================
+
+Edge counts, vertex degrees and face checks in the verification scripts
+used to rediscover edges with double Python loops over every vertex pair
+at a target distance. PolytopeGraph finds them once per vertex set:
+
+    graph = polytope_graph(cell600_vertices())   # edges at d_min
+    graph.n_edges                 # 720
+    graph.degree_stats()          # {'min': 12, 'max': 12, 'mean': 12.0, 'regular': True}
+    graph.neighbors(0)            # vertex indices adjacent to vertex 0
+    graph.faces(2), graph.cells() # 1200 triangles, 600 tetrahedra
+
+Edges are pairs whose distance is within atol of the edge length
+(default: the exact minimum distance from distance_spectrum). Squared
+distances come from row blocks of the Gram matrix and are thresholded in
+place, so the adjacency is produced row by row directly in CSR form
+(indptr, indices); the 240-root E8 polytope and its 6720 edges take a
+few milliseconds.
+
+FACE HOOKS: faces(k) defaults to the (k+1)-cliques of the edge graph,
+which are exactly the k-faces of a simplicial polytope (16-cell,
+600-cell). Pass face_finder=f(graph, k) for polytopes whose faces are not
+simplices (e.g. the octahedral cells of the 24-cell).
+"""
+
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+from distance_spectrum import DEFAULT_BLOCK_SIZE, distance_spectrum
+
+
+class PolytopeGraph:
+    """Edge graph of a vertex set, stored in CSR form"""
+
+    def __init__(self, vertices: np.ndarray, edge_length: float = None,
+                 atol: float = 1e-6, block_size: int = DEFAULT_BLOCK_SIZE,
+                 face_finder: Optional[Callable[['PolytopeGraph', int], np.ndarray]] = None):
+        """
+        Args:
+            vertices: (N, D) vertex set
+            edge_length: Distance of an edge (default: exact d_min)
+            atol: Pairs with |d - edge_length| <= atol are edges
+            block_size: Rows of the Gram matrix formed at once
+            face_finder: Optional f(graph, k) -> (F, m) vertex indices of
+                the k-faces, replacing clique enumeration
+        """
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+        if edge_length is None:
+            edge_length = distance_spectrum(self.vertices).d_min
+        self.edge_length = float(edge_length)
+        self.atol = atol
+        self.face_finder = face_finder
+
+        self.indptr, self.indices = self._build_csr(block_size)
+        self._adjacency = None
+        self._faces: Dict[int, np.ndarray] = {}
+
+    def _build_csr(self, block_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Threshold blocked Gram distances into (indptr, indices)"""
+        points = self.vertices
+        n = len(points)
+        sq = np.einsum('ij,ij->i', points, points)
+        lo = max(self.edge_length - self.atol, 0.0) ** 2
+        hi = (self.edge_length + self.atol) ** 2
+
+        counts = np.zeros(n, dtype=np.int64)
+        indices = []
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            d2 = sq[start:stop, np.newaxis] + sq[np.newaxis, :] \
+                - 2.0 * (points[start:stop] @ points.T)
+            d2 = np.maximum(d2, 0.0)
+            is_edge = (d2 >= lo) & (d2 <= hi)
+            is_edge[np.arange(stop - start), np.arange(start, stop)] = False
+
+            # np.nonzero walks row-major, so columns come out CSR-ordered
+            rows, cols = np.nonzero(is_edge)
+            counts[start:stop] = np.bincount(rows, minlength=stop - start)
+            indices.append(cols)
+
+        indptr = np.concatenate([[0], np.cumsum(counts)])
+        indices = np.concatenate(indices) if indices else np.empty(0, dtype=np.int64)
+        return indptr, indices.astype(np.int64)
+
+    # -------------------------------------------------------------------------
+    # Vertices and edges
+    # -------------------------------------------------------------------------
+
+    @property
+    def n_vertices(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def degrees(self) -> np.ndarray:
+        """(N,) number of edges at each vertex"""
+        return np.diff(self.indptr)
+
+    def degree_stats(self) -> Dict:
+        """Min / max / mean degree and whether the graph is regular"""
+        degrees = self.degrees()
+        if len(degrees) == 0:
+            return {'min': 0, 'max': 0, 'mean': 0.0, 'regular': True}
+        return {
+            'min': int(degrees.min()),
+            'max': int(degrees.max()),
+            'mean': float(degrees.mean()),
+            'regular': bool(degrees.min() == degrees.max()),
+        }
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """Indices of the vertices adjacent to vertex i (ascending)"""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def edges(self) -> np.ndarray:
+        """(E, 2) edges as index pairs with i < j, in lexicographic order"""
+        rows = np.repeat(np.arange(self.n_vertices), self.degrees())
+        upper = self.indices > rows
+        return np.column_stack([rows[upper], self.indices[upper]])
+
+    def adjacency(self) -> np.ndarray:
+        """Dense (N, N) boolean adjacency matrix, built on first use"""
+        if self._adjacency is None:
+            adjacency = np.zeros((self.n_vertices, self.n_vertices), dtype=bool)
+            rows = np.repeat(np.arange(self.n_vertices), self.degrees())
+            adjacency[rows, self.indices] = True
+            self._adjacency = adjacency
+        return self._adjacency
+
+    def locate(self, points: np.ndarray, atol: float = 1e-6) -> np.ndarray:
+        """
+        Vertex index of each point in an (M, D) batch, or -1 where no
+        vertex lies within atol.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        d2 = np.einsum('ij,ij->i', points, points)[:, np.newaxis] \
+            + np.einsum('ij,ij->i', self.vertices, self.vertices)[np.newaxis, :] \
+            - 2.0 * (points @ self.vertices.T)
+        nearest = np.argmin(d2, axis=1)
+        found = d2[np.arange(len(points)), nearest] <= atol ** 2
+        return np.where(found, nearest, -1)
+
+    # -------------------------------------------------------------------------
+    # Faces
+    # -------------------------------------------------------------------------
+
+    def cliques(self, size: int) -> np.ndarray:
+        """(M, size) vertex indices of every `size`-clique of the edge graph"""
+        return adjacency_cliques(self.adjacency(), size)
+
+    def faces(self, dim: int) -> np.ndarray:
+        """
+        (F, m) vertex indices of the dim-dimensional faces.
+
+        Uses face_finder when given, otherwise the (dim + 1)-cliques
+        (exact for simplicial polytopes). Cached per dimension.
+        """
+        faces = self._faces.get(dim)
+        if faces is None:
+            if self.face_finder is not None:
+                faces = np.asarray(self.face_finder(self, dim))
+            else:
+                faces = self.cliques(dim + 1)
+            self._faces[dim] = faces
+        return faces
+
+    def cells(self) -> np.ndarray:
+        """3-faces (the cells of a 4-polytope)"""
+        return self.faces(3)
+
+    def summary(self) -> Dict:
+        """Counts for printing / JSON"""
+        return {
+            'n_vertices': self.n_vertices,
+            'n_edges': self.n_edges,
+            'edge_length': self.edge_length,
+            'degree': self.degree_stats(),
+        }
+
+
+def adjacency_cliques(adjacency: np.ndarray, size: int) -> np.ndarray:
+    """
+    (M, size) vertex indices of every complete subgraph on `size`
+    vertices of a dense boolean adjacency matrix, each row ascending and
+    rows in lexicographic order.
+
+    Grown one vertex at a time: a clique is extended by every common
+    neighbour with a larger index than its last vertex.
+    """
+    n = len(adjacency)
+    order = np.arange(n)
+    cliques = order[:, np.newaxis]
+    for _ in range(size - 1):
+        common = order[np.newaxis, :] > cliques[:, -1:]
+        for column in cliques.T:
+            common &= adjacency[column]
+        rows, extension = np.nonzero(common)
+        cliques = np.column_stack([cliques[rows], extension])
+    return cliques
+
+
+_GRAPH_CACHE: Dict[Tuple, PolytopeGraph] = {}
+_GRAPH_CACHE_SIZE = 64
+
+
+def polytope_graph(vertices: np.ndarray, edge_length: float = None,
+                   atol: float = 1e-6) -> PolytopeGraph:
+    """Edge graph of a vertex set, built once per distinct array"""
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    key = (vertices.shape, vertices.tobytes(), edge_length, atol)
+    graph = _GRAPH_CACHE.get(key)
+    if graph is None:
+        graph = PolytopeGraph(vertices, edge_length, atol)
+        if len(_GRAPH_CACHE) >= _GRAPH_CACHE_SIZE:
+            _GRAPH_CACHE.pop(next(iter(_GRAPH_CACHE)))
+        _GRAPH_CACHE[key] = graph
+    return graph
@@ -16,51 +16,23 @@ Author: Clear Seas Solutions LLC
 
 import numpy as np
 from dataclasses import dataclass
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, Dict, Optional
 import json
 
+from lattice_index import SphericalCapIndex
+from polytope_geometry import cell600_vertices
+from distance_spectrum import distance_spectrum
+from parallel_sweep import run_tasks
+from kalman_core import KalmanKernel, SteadyStateMonitor
+from ring_buffer import RingBuffer
+
 # =============================================================================
 # SECTION 1: 600-CELL LATTICE (H4 Coxeter Group)
 # =============================================================================
 
 def generate_600cell() -> np.ndarray:
-    """Generate 120 vertices of the 600-cell on S³"""
-    phi = (1 + np.sqrt(5)) / 2
-    inv_phi = 1 / phi
-    vertices = []
-
-    # 8 axis-aligned
-    for i in range(4):
-        for s in [1, -1]:
-            v = np.zeros(4)
-            v[i] = s
-            vertices.append(v)
-
-    # 16 half-coordinates
-    for signs in np.ndindex(2, 2, 2, 2):
-        vertices.append(np.array([(-1)**s * 0.5 for s in signs]))
-
-    # 96 golden ratio
-    base = [phi/2, 0.5, inv_phi/2, 0]
-    even_perms = [
-        [0,1,2,3], [0,2,3,1], [0,3,1,2], [1,0,3,2], [1,2,0,3], [1,3,2,0],
-        [2,0,1,3], [2,1,3,0], [2,3,0,1], [3,0,2,1], [3,1,0,2], [3,2,1,0]
-    ]
-    for perm in even_perms:
-        base_perm = np.array([base[p] for p in perm])
-        for signs in np.ndindex(2, 2, 2):
-            v = base_perm.copy()
-            si = 0
-            for i in range(4):
-                if abs(base_perm[i]) > 0.01:
-                    v[i] *= (-1)**signs[si]
-                    si += 1
-                    if si >= 3:
-                        break
-            vertices.append(v)
-
-    vertices = np.array(vertices)
-    return vertices / np.linalg.norm(vertices, axis=1, keepdims=True)
+    """Generate 120 vertices of the 600-cell on S³ (shared, read-only)"""
+    return cell600_vertices()
 
 
 # =============================================================================
@@ -85,12 +57,7 @@ class QAM64:
         self.min_distance = self._compute_min_dist()
 
     def _compute_min_dist(self) -> float:
-        min_d = float('inf')
-        for i in range(len(self.points)):
-            for j in range(i+1, len(self.points)):
-                d = np.linalg.norm(self.points[i] - self.points[j])
-                min_d = min(min_d, d)
-        return min_d
+        return distance_spectrum(self.points).d_min
 
     def encode(self, symbol_idx: int) -> np.ndarray:
         return self.points[symbol_idx % self.n_symbols]
@@ -99,6 +66,11 @@ class QAM64:
         distances = np.linalg.norm(self.points - received, axis=1)
         return int(np.argmin(distances))
 
+    def decode_batch(self, received: np.ndarray) -> np.ndarray:
+        """Decode an (N, 2) block of received points"""
+        sq_norms = np.sum(self.points**2, axis=1)
+        return np.argmin(sq_norms - 2.0 * (received @ self.points.T), axis=1)
+
 
 class POM120:
     """Polytopal Orthogonal Modulation: 120 points on 4D 600-cell"""
@@ -107,27 +79,52 @@ class POM120:
         self.points = generate_600cell()
         self.n_symbols = 120
         self.min_distance = self._compute_min_dist()
+        # Nearest-vertex index, built once per constellation
+        self.index = SphericalCapIndex(self.points)
 
     def _compute_min_dist(self) -> float:
-        # Known: 600-cell min distance = 1/φ ≈ 0.618
-        return 1 / ((1 + np.sqrt(5)) / 2)
+        # Exact over all pairs: 1/φ ≈ 0.618 for the 600-cell
+        return distance_spectrum(self.points).d_min
 
     def encode(self, symbol_idx: int) -> np.ndarray:
         return self.points[symbol_idx % self.n_symbols]
 
     def decode(self, received: np.ndarray) -> int:
-        # Normalize to S³
-        received = received / (np.linalg.norm(received) + 1e-10)
-        # Find nearest vertex by Euclidean distance on S³
-        distances = np.linalg.norm(self.points - received, axis=1)
-        return int(np.argmin(distances))
+        # Normalize to S³ and find nearest vertex by Euclidean distance
+        return self.index.query_one(received)[0]
+
+    def decode_batch(self, received: np.ndarray) -> np.ndarray:
+        """Decode an (N, 4) block of received points"""
+        return self.index.query(received)[0]
+
 
+# Symbols per parallel task in compare_modulation_schemes. Fixed, so the
+# task grid (and therefore every random stream) is the same for any
+# worker count.
+SYMBOLS_PER_TASK = 10000
 
-def compare_modulation_schemes(snr_range_db: np.ndarray, n_trials: int = 10000) -> Dict:
+
+def run_scheme_trial(scheme, dimension: int, snr_db: float, n_symbols: int,
+                     rng: np.random.Generator) -> int:
+    """Transmit n_symbols through AWGN and return the error count"""
+    noise_power = 10 ** (-snr_db / 10)
+    noise_std = np.sqrt(noise_power / dimension)
+
+    sym = rng.integers(0, scheme.n_symbols, n_symbols)
+    rx = scheme.points[sym] + rng.normal(0, noise_std, (n_symbols, dimension))
+    return int(np.count_nonzero(scheme.decode_batch(rx) != sym))
+
+
+def compare_modulation_schemes(snr_range_db: np.ndarray, n_trials: int = 10000,
+                               n_workers: Optional[int] = None) -> Dict:
     """
     Compare QAM-64 vs POM-120 across SNR range.
 
     Key metric: Symbol Error Rate (SER)
+
+    The (scheme, SNR, symbol block) grid runs on n_workers processes
+    (None = $PPP_WORKERS, default 1) with SeedSequence-spawned streams per
+    block, so the SERs do not depend on the worker count.
     """
     qam = QAM64()
     pom = POM120()
@@ -140,36 +137,20 @@ def compare_modulation_schemes(snr_range_db: np.ndarray, n_trials: int = 10000)
         'pom120_bits_per_symbol': np.log2(120),
     }
 
-    rng = np.random.default_rng(42)
+    blocks = [min(SYMBOLS_PER_TASK, n_trials - start)
+              for start in range(0, n_trials, SYMBOLS_PER_TASK)]
+    schemes = [(qam, 2), (pom, 4)]  # (constellation, dimension)
+
+    tasks = [(scheme, dim, float(snr_db), n)
+             for snr_db in snr_range_db
+             for scheme, dim in schemes
+             for n in blocks]
+    errors = np.array(run_tasks(run_scheme_trial, tasks, seed=42, n_workers=n_workers))
+    errors = errors.reshape(len(snr_range_db), len(schemes), len(blocks)).sum(axis=2)
 
-    for snr_db in snr_range_db:
-        # QAM-64 test
-        noise_power = 10 ** (-snr_db / 10)
-        noise_std_2d = np.sqrt(noise_power / 2)  # 2D
-
-        qam_errors = 0
-        for _ in range(n_trials):
-            sym = rng.integers(0, 64)
-            tx = qam.encode(sym)
-            rx = tx + rng.normal(0, noise_std_2d, 2)
-            decoded = qam.decode(rx)
-            if decoded != sym:
-                qam_errors += 1
-
-        # POM-120 test
-        noise_std_4d = np.sqrt(noise_power / 4)  # 4D
-
-        pom_errors = 0
-        for _ in range(n_trials):
-            sym = rng.integers(0, 120)
-            tx = pom.encode(sym)
-            rx = tx + rng.normal(0, noise_std_4d, 4)
-            decoded = pom.decode(rx)
-            if decoded != sym:
-                pom_errors += 1
-
-        results['qam64_ser'].append(qam_errors / n_trials)
-        results['pom120_ser'].append(pom_errors / n_trials)
+    for qam_errors, pom_errors in errors:
+        results['qam64_ser'].append(int(qam_errors) / n_trials)
+        results['pom120_ser'].append(int(pom_errors) / n_trials)
 
     return results
 
@@ -380,9 +361,14 @@ class HypersonicTrajectory:
 
 
 class KalmanTracker:
-    """Standard Extended Kalman Filter - assumes near-ballistic"""
+    """
+    Standard Extended Kalman Filter - assumes near-ballistic
 
-    def __init__(self, dt: float = 0.1):
+    steady_state=True switches to the cached constant-gain update once
+    the gain has converged.
+    """
+
+    def __init__(self, dt: float = 0.1, steady_state: bool = False):
         self.dt = dt
         self.x = np.zeros(6)
 
@@ -401,6 +387,8 @@ class KalmanTracker:
         self.P = np.eye(6) * 10000
 
         self.initialized = False
+        self.steady = SteadyStateMonitor(self.F, self.H, self.Q, self.R) if steady_state else None
+        self.kernel = KalmanKernel(6, 3)
 
     def update(self, measurement: np.ndarray) -> np.ndarray:
         if not self.initialized:
@@ -408,16 +396,15 @@ class KalmanTracker:
             self.initialized = True
             return measurement.copy()
 
-        # Predict
-        self.x = self.F @ self.x
-        self.P = self.F @ self.P @ self.F.T + self.Q
+        if self.steady is not None and self.steady.converged:
+            self.x, _ = self.steady.step(self.F, self.H, self.x, measurement)
+            return self.x[:3].copy()
+
+        self.kernel.predict(self.F, self.Q, self.x, self.P)
+        K, _ = self.kernel.update(self.H, self.R, self.x, self.P, measurement)
 
-        # Update
-        y = measurement - self.H @ self.x
-        S = self.H @ self.P @ self.H.T + self.R
-        K = self.P @ self.H.T @ np.linalg.inv(S)
-        self.x = self.x + K @ y
-        self.P = (np.eye(6) - K @ self.H) @ self.P
+        if self.steady is not None and self.steady.check(K):
+            self.P[:] = self.steady.solution.P_post
 
         return self.x[:3].copy()
 
@@ -476,9 +463,10 @@ class ManifoldTracker:
 
         # Covariance
         self.P = np.eye(9) * 10000
+        self.kernel = KalmanKernel(9, 3)
 
-        # Maneuver detection
-        self.innovation_history: List[float] = []
+        # Maneuver detection (last 20 innovation magnitudes)
+        self.innovation_history = RingBuffer(20)
         self.maneuver_threshold = 2.0  # Normalized innovation threshold
 
         self.initialized = False
@@ -492,17 +480,14 @@ class ManifoldTracker:
         innov_mag = np.linalg.norm(innovation)
         self.innovation_history.append(innov_mag)
 
-        if len(self.innovation_history) > 20:
-            self.innovation_history.pop(0)
-
         if len(self.innovation_history) < 5:
             return 0.0
 
         # Normalized innovation (should be ~1 under null hypothesis)
-        mean_innov = np.mean(self.innovation_history)
-        std_innov = np.std(self.innovation_history) + 1e-10
+        mean_innov = self.innovation_history.mean()
+        std_innov = self.innovation_history.std() + 1e-10
 
-        recent = np.mean(self.innovation_history[-3:])
+        recent = np.mean(self.innovation_history.tail(3))
         z_score = (recent - mean_innov) / std_innov
 
         return max(0.0, z_score)
@@ -513,26 +498,20 @@ class ManifoldTracker:
             self.initialized = True
             return measurement.copy()
 
-        # Predict
-        x_pred = self.F @ self.x
-        P_pred = self.F @ self.P @ self.F.T + self.Q_base
-
-        # Innovation
-        y = measurement - self.H @ x_pred
+        # Innovation against the predicted position (independent of Q)
+        y = measurement - self.H @ (self.F @ self.x)
         maneuver_score = self._detect_maneuver(y)
 
         # Adaptive process noise based on maneuver detection
+        Q = self.Q_base
         if maneuver_score > self.maneuver_threshold:
             # Increase acceleration uncertainty during maneuver
-            Q_adapt = self.Q_base.copy()
-            Q_adapt[6:9, 6:9] *= (1 + maneuver_score)**2
-            P_pred = self.F @ self.P @ self.F.T + Q_adapt
-
-        # Kalman update
-        S = self.H @ P_pred @ self.H.T + self.R
-        K = P_pred @ self.H.T @ np.linalg.inv(S)
-        self.x = x_pred + K @ y
-        self.P = (np.eye(9) - K @ self.H) @ P_pred
+            Q = self.Q_base.copy()
+            Q[6:9, 6:9] *= (1 + maneuver_score)**2
+
+        # Predict and Kalman update
+        self.kernel.predict(self.F, Q, self.x, self.P)
+        self.kernel.update(self.H, self.R, self.x, self.P, measurement)
 
         # Physical constraint: limit acceleration to 25g
         max_accel = 25 * 9.81
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Fixed-Capacity NumPy Ring Buffer
+================================
+
+Trackers in this directory keep per-sample histories (diagnostics,
+sliding windows). A Python list that grows forever, or is trimmed with
+pop(0), allocates on every sample and costs O(window) per trim.
+
+RingBuffer stores the last `capacity` records in one preallocated array:
+
+    buf = RingBuffer(1000, shape=(4,))
+    buf.append(x)          # O(1), no allocation
+    buf.extend(xs)         # O(len(xs))
+    buf[-1]                # most recent record
+    buf.values()           # (len, 4) copy, oldest first
+    buf.mean(), buf.std()  # O(1) from running sums over the window
+    buf.median(k)          # median of the last k records
+
+Running sums are recomputed exactly every time the write position wraps,
+so rounding error from the add/subtract updates never accumulates beyond
+one pass over the buffer.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+
+class RingBuffer:
+    """Last `capacity` records of a fixed shape, oldest overwritten first"""
+
+    def __init__(self, capacity: int, shape: Tuple[int, ...] = (), dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1")
+        self.capacity = int(capacity)
+        self._data = np.zeros((self.capacity,) + tuple(shape), dtype=dtype)
+        self._next = 0      # Slot the next append writes to
+        self._count = 0     # Records currently held
+        self._sum = np.zeros(tuple(shape))
+        self._sumsq = np.zeros(tuple(shape))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        return self._count == self.capacity
+
+    def append(self, value) -> None:
+        """Store one record, overwriting the oldest when full"""
+        i = self._next
+        if self._count == self.capacity:
+            old = self._data[i]
+            self._sum -= old
+            self._sumsq -= old * old
+        self._data[i] = value
+        new = self._data[i]
+        self._sum += new
+        self._sumsq += new * new
+
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        if self._next == 0:
+            self._refresh()
+
+    def extend(self, records) -> None:
+        """Append a sequence of records (only the last `capacity` are kept)"""
+        records = np.asarray(records)[-self.capacity:]
+        k = len(records)
+        if k == 0:
+            return
+        if k == 1:
+            self.append(records[0])
+            return
+        slots = (self._next + np.arange(k)) % self.capacity
+
+        # Take the records being overwritten out of the running sums
+        held = (slots - (self._next - self._count)) % self.capacity < self._count
+        if np.any(held):
+            old = self._data[slots[held]]
+            self._sum -= old.sum(axis=0)
+            self._sumsq -= (old * old).sum(axis=0)
+        self._data[slots] = records
+        new = self._data[slots]
+        self._sum += new.sum(axis=0)
+        self._sumsq += (new * new).sum(axis=0)
+
+        wrapped = self._next + k >= self.capacity
+        self._next = int(slots[-1] + 1) % self.capacity
+        self._count = min(self._count + k, self.capacity)
+        if wrapped:
+            self._refresh()
+
+    def clear(self) -> None:
+        self._next = 0
+        self._count = 0
+        self._sum[...] = 0
+        self._sumsq[...] = 0
+
+    def _refresh(self) -> None:
+        """Recompute the running sums exactly from the held records"""
+        held = self.raw()
+        self._sum[...] = held.sum(axis=0)
+        self._sumsq[...] = (held * held).sum(axis=0)
+
+    def raw(self) -> np.ndarray:
+        """
+        Held records as a view of the storage, in SLOT order (not
+        chronological). Enough for order-independent reductions and
+        avoids the copy made by values().
+        """
+        return self._data[:self._count]
+
+    def mean(self) -> np.ndarray:
+        """Mean over the window (per element for array records)"""
+        if self._count == 0:
+            raise ValueError("mean of an empty RingBuffer")
+        return self._sum / self._count
+
+    def std(self) -> np.ndarray:
+        """Population standard deviation over the window (like np.std)"""
+        mean = self.mean()
+        return np.sqrt(np.maximum(self._sumsq / self._count - mean * mean, 0.0))
+
+    def tail(self, k: int) -> np.ndarray:
+        """Last k records, oldest first (a copy of at most k records)"""
+        k = min(k, self._count)
+        if k == 0:
+            return self._data[:0].copy()
+        start = (self._next - k) % self.capacity
+        if start < self._next:
+            return self._data[start:self._next].copy()
+        return np.concatenate([self._data[start:], self._data[:self._next]])
+
+    def median(self, k: Optional[int] = None) -> np.ndarray:
+        """Median of the last k records (default: the whole window)"""
+        if self._count == 0:
+            raise ValueError("median of an empty RingBuffer")
+        window = self.raw() if k is None or k >= self._count else self.tail(k)
+        return np.median(window, axis=0)
+
+    def _slot(self, i: int) -> int:
+        """Storage slot of chronological index i (negative = from newest)"""
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("RingBuffer index out of range")
+        return (self._next - self._count + i) % self.capacity
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self._data[self._slot(i)]
+
+    def values(self) -> np.ndarray:
+        """All held records in chronological order (a copy)"""
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.concatenate([self._data[self._next:], self._data[:self._next]])
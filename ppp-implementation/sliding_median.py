@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Sliding-Window Median and MAD
+=============================
+
+The adaptive trackers estimate noise robustly from the median of a window
+of recent innovations. np.median over the window costs O(w log w) per
+sample (O(w) with introselect, plus the copy), which rules out the long
+windows (thousands of samples) wanted for stable noise estimates through
+plasma blackout.
+
+SlidingMedian keeps the window twice: a FIFO (arrival order, to know which
+value leaves) and a blocked sorted list, i.e. a list of sorted blocks of
+at most 2 * BLOCK_LOAD values with a Fenwick tree over the block lengths
+so the k-th smallest value is found without walking the blocks. Per sample:
+
+    append:  O(log w) binary searches and Fenwick updates plus an insert
+             and a delete inside one block of O(BLOCK_LOAD) values; a
+             block that overflows is split, and the Fenwick tree is then
+             rebuilt in O(w / BLOCK_LOAD), at most once per BLOCK_LOAD
+             appends to that block
+    median:  O(log w), one or two k-th smallest lookups
+    mad:     O(log^2 w), median absolute deviation by selecting the k-th
+             smallest |x - m| from the two sorted runs either side of m
+
+Results are identical to np.median(window) and
+np.median(np.abs(window - np.median(window))).
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import List
+
+BLOCK_LOAD = 64     # Blocks split when they grow past 2 * BLOCK_LOAD values
+
+
+class SlidingMedian:
+    """Median and MAD of the last `window` scalar samples"""
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("SlidingMedian window must be at least 1")
+        self.window = int(window)
+        self._fifo: deque = deque()
+        self._blocks: List[List[float]] = []
+        self._maxes: List[float] = []       # Last (largest) value of each block
+        self._tree: List[int] = [0]         # Fenwick tree of block lengths, 1-based
+
+    def __len__(self) -> int:
+        return len(self._fifo)
+
+    def append(self, value: float) -> None:
+        """Add a sample, dropping the oldest once the window is full"""
+        value = float(value)
+        if len(self._fifo) == self.window:
+            self._remove(self._fifo.popleft())
+        self._fifo.append(value)
+        self._insert(value)
+
+    # -------------------------------------------------------------------------
+    # Blocked sorted list
+    # -------------------------------------------------------------------------
+
+    def _rebuild_tree(self) -> None:
+        """Fenwick tree of the block lengths in O(number of blocks)"""
+        n = len(self._blocks)
+        tree = [0] * (n + 1)
+        for i, block in enumerate(self._blocks, 1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add(self, b: int, delta: int) -> None:
+        """Change the length recorded for block b by delta"""
+        i, tree = b + 1, self._tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, b: int) -> int:
+        """Number of values in blocks 0 .. b - 1"""
+        total, tree = 0, self._tree
+        while b > 0:
+            total += tree[b]
+            b -= b & -b
+        return total
+
+    def _insert(self, value: float) -> None:
+        blocks, maxes = self._blocks, self._maxes
+        if not blocks:
+            blocks.append([value])
+            maxes.append(value)
+            self._rebuild_tree()
+            return
+        b = min(bisect_left(maxes, value), len(blocks) - 1)
+        block = blocks[b]
+        insort(block, value)
+        maxes[b] = block[-1]
+        if len(block) > 2 * BLOCK_LOAD:
+            blocks.insert(b + 1, block[BLOCK_LOAD:])
+            del block[BLOCK_LOAD:]
+            maxes[b] = block[-1]
+            maxes.insert(b + 1, blocks[b + 1][-1])
+            self._rebuild_tree()
+        else:
+            self._add(b, 1)
+
+    def _remove(self, value: float) -> None:
+        blocks, maxes = self._blocks, self._maxes
+        b = bisect_left(maxes, value)
+        block = blocks[b]
+        del block[bisect_left(block, value)]
+        if block:
+            maxes[b] = block[-1]
+            self._add(b, -1)
+        else:
+            del blocks[b]
+            del maxes[b]
+            self._rebuild_tree()
+
+    def _at(self, k: int) -> float:
+        """k-th smallest value (0-based) by descending the Fenwick tree"""
+        tree = self._tree
+        n = len(tree) - 1
+        b, step = 0, 1 << n.bit_length()
+        while step:
+            if b + step <= n and tree[b + step] <= k:
+                b += step
+                k -= tree[b]
+            step >>= 1
+        return self._blocks[b][k]
+
+    def _rank(self, value: float) -> int:
+        """Number of values in the window smaller than value"""
+        b = bisect_left(self._maxes, value)
+        if b == len(self._blocks):
+            return len(self._fifo)
+        return self._prefix(b) + bisect_left(self._blocks[b], value)
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    def median(self) -> float:
+        n = len(self._fifo)
+        if n == 0:
+            raise ValueError("median of an empty SlidingMedian")
+        mid = n // 2
+        if n % 2:
+            return self._at(mid)
+        return 0.5 * (self._at(mid - 1) + self._at(mid))
+
+    def _kth_deviation(self, k: int, center: float, split: int) -> float:
+        """
+        k-th smallest (0-based) |x - center|.
+
+        Below `split` the deviations center - s[i] grow as i decreases;
+        from `split` on, s[j] - center grow with j. Binary search for how
+        many of the k + 1 smallest come from the lower run.
+        """
+        at = self._at
+        n_low, n_high = split, len(self._fifo) - split
+
+        def low(i):     # i-th smallest deviation in the lower run
+            return center - at(split - 1 - i)
+
+        def high(j):    # j-th smallest deviation in the upper run
+            return at(split + j) - center
+
+        lo, hi = max(0, k + 1 - n_high), min(k + 1, n_low)
+        while lo < hi:
+            i = (lo + hi) // 2
+            if low(i) < high(k - i):
+                lo = i + 1
+            else:
+                hi = i
+        i, j = lo, k + 1 - lo
+        best = float('-inf')
+        if i > 0:
+            best = low(i - 1)
+        if j > 0:
+            best = max(best, high(j - 1))
+        return best
+
+    def mad(self) -> float:
+        """Median absolute deviation from the window median"""
+        center = self.median()
+        n = len(self._fifo)
+        split = self._rank(center)
+        mid = n // 2
+        if n % 2:
+            return self._kth_deviation(mid, center, split)
+        return 0.5 * (self._kth_deviation(mid - 1, center, split) +
+                      self._kth_deviation(mid, center, split))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Streaming Tracker Interface
+===========================
+
+track(measurements) takes a whole list and returns a whole list, which
+does not work for a continuous radar feed. StreamingTracker adds two
+generator methods on top of a tracker's per-sample update:
+
+    for est in tracker.track_stream(feed):           # one (3,) estimate per measurement
+        ...
+    for block in tracker.track_chunks(feed, 1024):   # (n, 3) estimates per block
+        ...
+
+`feed` is any iterable of (3,) measurements and/or (N, 3) chunks (an
+(N, 3) array works too). Nothing is accumulated: memory is bounded by
+the block size and the trackers' own fixed-size histories.
+
+Trackers implement _estimate(z) -> (3,) estimate (default: update(z)),
+and may override _estimate_block(block) when part of the work can be
+batched across a block.
+"""
+
+import numpy as np
+from typing import Iterable, Iterator
+
+DEFAULT_BLOCK_SIZE = 1024
+
+
+def iter_measurements(feed: Iterable) -> Iterator[np.ndarray]:
+    """Flatten a feed of (3,) measurements and (N, 3) chunks into (3,) rows"""
+    if isinstance(feed, np.ndarray):
+        feed = feed.reshape(-1, feed.shape[-1])
+    for item in feed:
+        item = np.asarray(item, dtype=np.float64)
+        if item.ndim == 1:
+            yield item
+        else:
+            yield from item
+
+
+def iter_blocks(feed: Iterable, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[np.ndarray]:
+    """Regroup a feed into (block_size, 3) blocks (the last may be shorter)"""
+    if isinstance(feed, np.ndarray):
+        feed = [feed]
+    buf = None
+    n = 0
+    for item in feed:
+        rows = np.atleast_2d(np.asarray(item, dtype=np.float64))
+        if buf is None:
+            buf = np.empty((block_size, rows.shape[1]))
+        pos = 0
+        while pos < len(rows):
+            take = min(block_size - n, len(rows) - pos)
+            buf[n:n + take] = rows[pos:pos + take]
+            n += take
+            pos += take
+            if n == block_size:
+                yield buf.copy()
+                n = 0
+    if n:
+        yield buf[:n].copy()
+
+
+class StreamingTracker:
+    """Mixin adding track_stream / track_chunks to a per-sample tracker"""
+
+    def _estimate(self, z: np.ndarray) -> np.ndarray:
+        """Process one measurement and return the (3,) position estimate"""
+        return self.update(z)
+
+    def _estimate_block(self, block: np.ndarray) -> np.ndarray:
+        """Process an (n, 3) block; returns (n, 3) estimates"""
+        out = np.empty((len(block), 3))
+        for k, z in enumerate(block):
+            out[k] = self._estimate(z)
+        return out
+
+    def track_stream(self, feed: Iterable) -> Iterator[np.ndarray]:
+        """Yield one estimate per measurement of an unbounded feed"""
+        for z in iter_measurements(feed):
+            yield self._estimate(z)
+
+    def track_chunks(self, feed: Iterable,
+                     block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[np.ndarray]:
+        """Yield (n, 3) estimate arrays, processing the feed in blocks"""
+        for block in iter_blocks(feed, block_size):
+            yield self._estimate_block(block)